@@ -0,0 +1,38 @@
+"""add uq_artifacts_name
+
+Revision ID: 4b7e2c9a1f30
+Revises: 
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2c9a1f30'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ArtifactService.create_artifact 依赖该约束做 ON CONFLICT (name) DO NOTHING；
+    # create_all 不会给已存在的表补约束。存在重名数据时需先去重，否则此处失败
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = 'uq_artifacts_name'
+            ) THEN
+                ALTER TABLE artifacts ADD CONSTRAINT uq_artifacts_name UNIQUE (name);
+            END IF;
+        END
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE artifacts DROP CONSTRAINT IF EXISTS uq_artifacts_name")
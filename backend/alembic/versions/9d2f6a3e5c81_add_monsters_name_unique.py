@@ -0,0 +1,38 @@
+"""add uq_monsters_name
+
+Revision ID: 9d2f6a3e5c81
+Revises: 4b7e2c9a1f30
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d2f6a3e5c81'
+down_revision = '4b7e2c9a1f30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 怪物名称查重与并发创建时的 23505 兜底都依赖该约束（及其索引）；
+    # create_all 不会给已存在的表补约束。存在重名数据时需先去重，否则此处失败
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = 'uq_monsters_name'
+            ) THEN
+                ALTER TABLE monsters ADD CONSTRAINT uq_monsters_name UNIQUE (name);
+            END IF;
+        END
+        $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE monsters DROP CONSTRAINT IF EXISTS uq_monsters_name")
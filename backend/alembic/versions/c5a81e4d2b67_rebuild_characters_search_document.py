@@ -0,0 +1,38 @@
+"""rebuild idx_characters_search_document with a column separator
+
+Revision ID: c5a81e4d2b67
+Revises: 9d2f6a3e5c81
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a81e4d2b67'
+down_revision = '9d2f6a3e5c81'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ('name', 'name_en', 'title', 'description', 'affiliation', 'constellation_name')
+
+
+def _create_index(separator: str) -> None:
+    document = f" || {separator} || ".join(f"coalesce({column}, '')" for column in _COLUMNS)
+    op.execute("DROP INDEX IF EXISTS idx_characters_search_document")
+    op.execute(
+        f"CREATE INDEX idx_characters_search_document ON characters "
+        f"USING gin (({document}) gin_trgm_ops)"
+    )
+
+
+def upgrade() -> None:
+    # 搜索文档的列分隔符由空格改为 E'\x1f'（Character.search_document），
+    # 索引表达式须与查询表达式一致才能被使用
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    _create_index(r"E'\x1f'")
+
+
+def downgrade() -> None:
+    _create_index("' '")
@@ -33,6 +33,13 @@ async def init_database():
             except Exception as e:
                 logger.warning("UUID扩展设置失败，但继续执行", error=str(e))
 
+            # 模糊搜索索引（gin_trgm_ops）依赖 pg_trgm 扩展
+            try:
+                await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                logger.info("pg_trgm扩展检查完成")
+            except Exception as e:
+                logger.warning("pg_trgm扩展设置失败，但继续执行", error=str(e))
+
             # 创建所有表
             await conn.run_sync(Base.metadata.create_all)
             logger.info("数据库表创建成功")
@@ -5,10 +5,15 @@
 1. 爬取所有武器数据并存储到数据库
 2. 爬取所有圣遗物数据并存储到数据库
 3. 输出统计信息
+
+设置 SCRAPER_HTML_CACHE_DIR 后武器页面会缓存到磁盘（24小时内复用），
+使用 --refresh 忽略缓存重新抓取
 """
 
+import argparse
 import asyncio
 import logging
+import os
 import time
 from datetime import datetime
 
@@ -34,8 +39,8 @@ async def scrape_all_weapons():
     start_time = time.time()
 
     # 初始化爬虫（不传参数，使用默认完整列表）
-    scraper = WeaponScraper()
-    weapons = await scraper.scrape()  # 不传参数，获取所有武器
+    async with WeaponScraper() as scraper:
+        weapons = await scraper.scrape()  # 不传参数，获取所有武器
 
     elapsed_time = time.time() - start_time
     logger.info(f"武器爬取完成，耗时: {elapsed_time:.2f}秒")
@@ -67,8 +72,8 @@ async def scrape_all_artifacts():
     start_time = time.time()
 
     # 初始化爬虫（不传参数，使用默认完整列表）
-    scraper = ArtifactScraper()
-    artifacts = await scraper.scrape()  # 不传参数，获取所有圣遗物
+    async with ArtifactScraper() as scraper:
+        artifacts = await scraper.scrape()  # 不传参数，获取所有圣遗物
 
     elapsed_time = time.time() - start_time
     logger.info(f"圣遗物爬取完成，耗时: {elapsed_time:.2f}秒")
@@ -132,4 +137,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="原神Wiki数据完整爬取")
+    parser.add_argument("--refresh", action="store_true", help="忽略磁盘HTML缓存，重新抓取所有页面")
+    args = parser.parse_args()
+    if args.refresh:
+        os.environ["SCRAPER_NOCACHE"] = "1"
+
     asyncio.run(main())
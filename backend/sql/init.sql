@@ -4,6 +4,9 @@
 -- 创建 zhparser 扩展（中文分词）
 CREATE EXTENSION IF NOT EXISTS zhparser;
 
+-- 创建 pg_trgm 扩展（模糊搜索 ILIKE '%...%' 的 trigram GIN 索引）
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- 创建中文全文搜索配置
 DO $$
 BEGIN
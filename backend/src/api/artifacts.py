@@ -37,12 +37,15 @@ async def get_artifacts(
     search: Optional[str] = Query(None, description="搜索关键词"),
     sort_by: str = Query("name", description="排序字段"),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="排序方向"),
+    cursor_id: Optional[int] = Query(None, ge=1, description="游标分页：上一页返回的 next_cursor.cursor_id"),
+    cursor_value: Optional[str] = Query(None, description="游标分页：上一页返回的 next_cursor.cursor_value"),
     artifact_service: ArtifactService = Depends(get_artifact_service)
 ):
     """
     获取圣遗物列表
 
-    支持分页、过滤、搜索和排序功能
+    支持分页、过滤、搜索和排序功能；深分页可传入上一页返回的
+    next_cursor 改用游标分页，避免大偏移量扫描
     """
     try:
         params = ArtifactQueryParams(
@@ -55,7 +58,9 @@ async def get_artifacts(
             main_stat_type=main_stat_type,
             search=search,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor_id=cursor_id,
+            cursor_value=cursor_value
         )
 
         artifacts, total = await artifact_service.get_artifact_list(params)
@@ -64,7 +69,8 @@ async def get_artifacts(
             artifacts=artifacts,
             total=total,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            next_cursor=artifact_service.get_next_cursor(artifacts, params)
         )
 
     except ValidationException as e:
@@ -173,6 +179,7 @@ async def delete_artifact(
 async def search_artifacts(
     q: str = Query(..., min_length=2, description="搜索关键词"),
     limit: int = Query(20, ge=1, le=50, description="返回结果数量限制"),
+    detail: bool = Query(True, description="是否返回完整字段（为 false 时只返回卡片视图字段）"),
     artifact_service: ArtifactService = Depends(get_artifact_service)
 ):
     """
@@ -181,8 +188,8 @@ async def search_artifacts(
     根据关键词搜索圣遗物
     """
     try:
-        artifacts = await artifact_service.search_artifacts(q, limit)
-        return ArtifactSearchResponse.create_success(artifacts, q)
+        artifacts = await artifact_service.search_artifacts(q, limit, detail=detail)
+        return ArtifactSearchResponse.create_success(artifacts, q, detail=detail)
 
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
@@ -215,6 +222,7 @@ async def get_artifact_stats(
 async def get_artifacts_by_set(
     set_name: str = Path(..., description="套装名称"),
     limit: int = Query(20, ge=1, le=50, description="返回结果数量限制"),
+    detail: bool = Query(True, description="是否返回完整字段（为 false 时只返回卡片视图字段）"),
     artifact_service: ArtifactService = Depends(get_artifact_service)
 ):
     """
@@ -223,8 +231,8 @@ async def get_artifacts_by_set(
     返回指定套装的圣遗物列表
     """
     try:
-        artifacts = await artifact_service.get_artifacts_by_set(set_name, limit)
-        return ArtifactSetResponse.create_success(set_name, artifacts)
+        artifacts = await artifact_service.get_artifacts_by_set(set_name, limit, detail=detail)
+        return ArtifactSetResponse.create_success(set_name, artifacts, detail=detail)
 
     except ValidationException as e:
         raise HTTPException(status_code=422, detail=str(e))
@@ -238,6 +246,7 @@ async def get_artifacts_by_set(
 async def get_artifacts_by_slot(
     slot: str = Path(..., description="圣遗物部位"),
     limit: int = Query(20, ge=1, le=50, description="返回结果数量限制"),
+    detail: bool = Query(True, description="是否返回完整字段（为 false 时只返回卡片视图字段）"),
     artifact_service: ArtifactService = Depends(get_artifact_service)
 ):
     """
@@ -246,12 +255,13 @@ async def get_artifacts_by_slot(
     返回指定部位的圣遗物列表
     """
     try:
-        artifacts = await artifact_service.get_artifacts_by_slot(slot, limit)
+        artifacts = await artifact_service.get_artifacts_by_slot(slot, limit, detail=detail)
         return ArtifactListResponse.create_success(
             artifacts=artifacts,
             total=len(artifacts),
             page=1,
             per_page=limit,
+            detail=detail,
             slot=slot
         )
 
@@ -276,7 +286,7 @@ async def get_artifact_filter_options(
         filters = artifact_service.get_available_filters()
         return {
             "success": True,
-            "data": filters,
+            "data": dict(filters),
             "message": "获取过滤选项成功"
         }
 
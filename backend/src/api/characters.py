@@ -58,6 +58,11 @@ async def get_characters(
     sort_by: str = Query("name", description="排序字段"),
     sort_order: str = Query("asc", pattern="^(asc|desc)$", description="排序方向"),
 
+    # 返回字段
+    detail: bool = Query(True, description="是否返回完整字段（为 false 时只返回卡片视图字段）"),
+    include: List[str] = Query([], description="一并返回的关联数据，可重复传入：skills, talents"),
+    exact_count: bool = Query(True, description="是否精确统计总数（为 false 时返回估算值，适用于“加载更多”式分页）"),
+
     character_service: CharacterService = Depends(get_character_service)
 ):
     """
@@ -78,7 +83,10 @@ async def get_characters(
         region=region,
         search=search,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        detail=detail,
+        include=set(include),
+        exact_count=exact_count
     )
 
     # 获取角色列表 - 异常会被全局处理器捕获
@@ -92,7 +100,7 @@ async def get_characters(
     return {
         "success": True,
         "data": {
-            "characters": [char.to_dict() for char in characters],
+            "characters": [char.to_dict() if detail else dict(char) for char in characters],
             "pagination": {
                 "page": page,
                 "per_page": per_page,
@@ -337,7 +345,7 @@ async def get_filter_options():
         return {
             "success": True,
             "data": {
-                "filters": filters,
+                "filters": dict(filters),
                 "sort_options": {
                     "fields": ["name", "rarity", "element", "created_at"],
                     "orders": ["asc", "desc"]
@@ -4,7 +4,7 @@
 提供怪物的增删改查、搜索、统计等 API 接口
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_db
@@ -38,12 +38,16 @@ async def get_monsters(
     search: Optional[str] = Query(None, description="搜索关键词"),
     sort_by: str = Query("name", description="排序字段"),
     sort_order: str = Query("asc", regex="^(asc|desc)$", description="排序方向"),
+    with_total: bool = Query(True, description="是否统计总数"),
+    cursor_id: Optional[int] = Query(None, ge=1, description="游标分页：上一页最后一条的ID（仅 sort_by=id 时可用）"),
+    detail: bool = Query(True, description="是否返回完整字段（为 false 时只返回卡片视图字段）"),
     monster_service: MonsterService = Depends(get_monster_service)
 ):
     """
     获取怪物列表
 
-    支持分页、过滤、搜索和排序功能
+    支持分页、过滤、搜索和排序功能；with_total=false 时跳过总数统计，
+    按ID排序时可用 cursor_id 游标分页，避免大偏移量扫描
     """
     try:
         params = MonsterQueryParams(
@@ -57,16 +61,21 @@ async def get_monsters(
             region=region,
             search=search,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            with_total=with_total,
+            cursor_id=cursor_id,
+            detail=detail
         )
 
-        monsters, total = await monster_service.get_monster_list(params)
+        monsters, total, has_next = await monster_service.get_monster_list(params)
 
         return MonsterListResponse.create_success(
             monsters=monsters,
             total=total,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            has_next=has_next,
+            detail=detail
         )
 
     except ValidationException as e:
@@ -121,6 +130,35 @@ async def create_monster(
         raise HTTPException(status_code=500, detail="创建怪物失败")
 
 
+@router.post("/batch", status_code=201)
+async def create_monsters(
+    monsters_data: List[MonsterCreate] = Body(..., min_length=1, max_length=1000),
+    monster_service: MonsterService = Depends(get_monster_service)
+):
+    """
+    批量创建怪物
+
+    一次请求创建多个怪物条目（用于数据导入），名称不能与已有怪物或批次内其他条目重复
+    """
+    try:
+        monster_ids = await monster_service.create_monsters(monsters_data)
+        return {
+            "success": True,
+            "data": {
+                "ids": monster_ids,
+                "created": len(monster_ids)
+            },
+            "message": "怪物批量创建成功"
+        }
+
+    except ValidationException as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except DatabaseException as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="批量创建怪物失败")
+
+
 @router.put("/{monster_id}", response_model=MonsterDetailResponse)
 async def update_monster(
     monster_data: MonsterUpdate,
@@ -369,7 +407,7 @@ async def get_monster_filter_options(
         filters = monster_service.get_available_filters()
         return {
             "success": True,
-            "data": filters,
+            "data": dict(filters),
             "message": "获取过滤选项成功"
         }
 
@@ -186,14 +186,14 @@ async def run_character_scraping(db: AsyncSession, character_names: Optional[Lis
         character_names: Optional list of character names to scrape.
                         If None, will scrape all default characters.
     """
-    from datetime import datetime
+    from datetime import datetime, timezone
 
     character_count = len(character_names) if character_names else "all"
     logger.info(f"Starting character scraping task for {character_count} characters...")
 
     _scraper_status["is_running"] = True
     _scraper_status["current_task"] = "characters"
-    _scraper_status["last_run"] = datetime.utcnow().isoformat()
+    _scraper_status["last_run"] = datetime.now(timezone.utc).isoformat()
 
     try:
         # Initialize scraper
@@ -207,25 +207,29 @@ async def run_character_scraping(db: AsyncSession, character_names: Optional[Lis
         # Initialize storage service
         storage = DataStorageService(db)
 
-        # Run scraping
+        # Run scraping, streaming each character straight into storage
         async with scraper:
-            logger.info("Scraping character data...")
+            logger.info("Scraping and storing character data...")
             # Pass character_names parameter
-            characters = await scraper.scrape(character_names)
-
-            logger.info(f"Scraped {len(characters)} characters")
+            storage_stats = await storage.store_character_stream(
+                scraper.iter_characters(character_names)
+            )
             scraper_stats = scraper.get_stats()
 
-            # Store data
-            logger.info("Storing character data...")
-            storage_stats = await storage.store_characters(characters)
+            total_characters = (
+                storage_stats["created"]
+                + storage_stats["updated"]
+                + storage_stats["skipped"]
+                + storage_stats["errors"]
+            )
+            logger.info(f"Scraped {total_characters} characters")
 
             # Update status
             _scraper_status["last_result"] = {
                 "success": True,
                 "scraper_stats": scraper_stats,
                 "storage_stats": storage_stats,
-                "total_characters": len(characters),
+                "total_characters": total_characters,
                 "requested_characters": len(character_names) if character_names else "all",
             }
 
@@ -286,14 +290,14 @@ async def trigger_weapon_scraping(
 
 async def run_weapon_scraping(db: AsyncSession, weapon_names: Optional[List[str]] = None):
     """执行武器数据爬取的后台任务"""
-    from datetime import datetime
+    from datetime import datetime, timezone
 
     weapon_count = len(weapon_names) if weapon_names else "all"
     logger.info(f"Starting weapon scraping task for {weapon_count} weapons...")
 
     _scraper_status["is_running"] = True
     _scraper_status["current_task"] = "weapons"
-    _scraper_status["last_run"] = datetime.utcnow().isoformat()
+    _scraper_status["last_run"] = datetime.now(timezone.utc).isoformat()
 
     try:
         config = ScraperConfig(
@@ -379,14 +383,14 @@ async def trigger_artifact_scraping(
 
 async def run_artifact_scraping(db: AsyncSession, artifact_set_names: Optional[List[str]] = None):
     """执行圣遗物数据爬取的后台任务"""
-    from datetime import datetime
+    from datetime import datetime, timezone
 
     artifact_count = len(artifact_set_names) if artifact_set_names else "all"
     logger.info(f"Starting artifact scraping task for {artifact_count} sets...")
 
     _scraper_status["is_running"] = True
     _scraper_status["current_task"] = "artifacts"
-    _scraper_status["last_run"] = datetime.utcnow().isoformat()
+    _scraper_status["last_run"] = datetime.now(timezone.utc).isoformat()
 
     try:
         config = ScraperConfig(
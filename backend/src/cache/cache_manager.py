@@ -320,6 +320,7 @@ class CacheKeys:
     CHARACTER_DETAIL = "characters:detail"
     CHARACTER_SKILLS = "characters:skills"
     CHARACTER_SEARCH = "characters:search"
+    CHARACTER_STATS = "characters:stats"
 
     # 武器相关
     WEAPON_LIST = "weapons:list"
@@ -330,11 +331,13 @@ class CacheKeys:
     ARTIFACT_LIST = "artifacts:list"
     ARTIFACT_DETAIL = "artifacts:detail"
     ARTIFACT_SEARCH = "artifacts:search"
+    ARTIFACT_STATS = "artifacts:stats"
 
     # 怪物相关
     MONSTER_LIST = "monsters:list"
     MONSTER_DETAIL = "monsters:detail"
     MONSTER_SEARCH = "monsters:search"
+    MONSTER_STATS = "monsters:stats"
 
     # 游戏机制相关
     GAME_MECHANIC_LIST = "game_mechanics:list"
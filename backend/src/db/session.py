@@ -3,9 +3,15 @@
 
 提供异步数据库连接池和会话管理功能
 """
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy import text
+import orjson
 import structlog
 
 from src.config import get_settings
@@ -13,21 +19,87 @@ from src.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
-# 异步数据库引擎
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.environment == "development",  # 开发环境显示SQL
-    pool_size=20,  # 连接池大小
-    max_overflow=30,  # 最大溢出连接数
-    pool_pre_ping=True,  # 连接前ping检查
-    pool_recycle=3600,  # 连接回收时间（秒）
-    poolclass=NullPool if settings.environment == "test" else None,  # 测试环境使用NullPool
-)
+
+def json_serializer(value) -> str:
+    """JSON/JSONB 列序列化（orjson，C实现，比标准库 json 快数倍）"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# 连接池参数：复用连接，避免每个会话（如每次爬虫入库）重新握手认证
+# 异步引擎默认使用 AsyncAdaptedQueuePool
+if settings.environment == "test":
+    # 测试环境使用NullPool（NullPool不接受pool_size等参数）
+    _pool_options = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "pool_size": settings.database_pool_size,  # 连接池大小
+        "max_overflow": settings.database_max_overflow,  # 最大溢出连接数
+        "pool_pre_ping": True,  # 连接前ping检查
+        "pool_recycle": settings.database_pool_recycle,  # 连接回收时间（秒）
+        "pool_timeout": settings.database_pool_timeout,  # 获取连接超时，避免请求无限排队
+    }
+
+# asyncpg 预编译语句缓存：高频的按ID查询、名称校验、列表排序等同构SQL
+# 在每个连接上只需解析和规划一次
+_connect_args = {}
+if "+asyncpg" in settings.database_url:
+    _connect_args = {
+        "statement_cache_size": settings.database_statement_cache_size,  # asyncpg 服务端预编译语句缓存
+        "prepared_statement_cache_size": settings.database_statement_cache_size,  # SQLAlchemy 方言层缓存
+    }
+
+def _create_engine(url: str):
+    """按统一的连接池和序列化配置创建异步引擎"""
+    return create_async_engine(
+        url,
+        echo=settings.environment == "development",  # 开发环境显示SQL
+        **_pool_options,
+        connect_args=_connect_args,
+        json_serializer=json_serializer,  # JSONB 写入使用 orjson
+        json_deserializer=orjson.loads,  # JSONB 读取使用 orjson
+    )
+
+
+# 异步数据库引擎（主库）
+engine = _create_engine(settings.database_url)
+
+# 只读副本引擎；未配置副本时与主库为同一引擎
+replica_engine = _create_engine(settings.database_replica_url) if settings.database_replica_url else engine
+
+
+class RoutingSession(Session):
+    """
+    读写分离会话
+
+    写操作（flush、INSERT/UPDATE/DELETE 语句，以及可能包含写入或 SET 的 text() 语句）
+    路由到主库，其余查询路由到只读副本。会话一旦写过或设置了 info["use_primary"]，
+    后续查询也固定使用主库，保证读到自己的写入。
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, (UpdateBase, TextClause)):
+            self.info["use_primary"] = True
+        if self.info.get("use_primary") or replica_engine is engine:
+            return engine.sync_engine
+        return replica_engine.sync_engine
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    将会话固定到主库
+
+    写操作在执行写语句之前的查询（名称查重、存在性检查、按ID加载待修改对象等）
+    也必须读主库：副本存在复制延迟，可能误判名称可用或对象不存在。
+    服务层写方法在开始处调用。
+    """
+    session.info["use_primary"] = True
+
 
 # 异步会话工厂
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -55,13 +127,21 @@ async def init_db():
     """
     初始化数据库连接
 
-    在应用启动时调用，测试数据库连接是否正常
+    在应用启动时调用，测试数据库连接是否正常，并预热连接池，
+    使首批请求不必等待建立连接
     """
-    try:
-        async with engine.begin() as conn:
+    async def _open_connection():
+        async with engine.connect() as conn:
             # 测试连接
             await conn.execute(text("SELECT 1"))
-        logger.info("数据库连接测试成功")
+
+    try:
+        prewarm = 1
+        if "pool_size" in _pool_options:
+            prewarm = max(1, min(settings.database_pool_prewarm, settings.database_pool_size))
+        # 并发打开连接，归还后留在连接池中
+        await asyncio.gather(*(_open_connection() for _ in range(prewarm)))
+        logger.info("数据库连接测试成功", prewarmed_connections=prewarm)
     except Exception as e:
         logger.error("数据库连接失败", error=str(e))
         raise
@@ -74,4 +154,6 @@ async def close_db():
     在应用关闭时调用，清理数据库连接池
     """
     await engine.dispose()
+    if replica_engine is not engine:
+        await replica_engine.dispose()
     logger.info("数据库连接池已关闭")
\ No newline at end of file
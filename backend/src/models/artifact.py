@@ -3,7 +3,7 @@
 
 存储原神圣遗物的基础信息、属性、套装效果等数据
 """
-from sqlalchemy import Column, String, Integer, Text, Boolean, Index
+from sqlalchemy import Column, String, Integer, Text, Boolean, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.models.base import BaseModel
@@ -164,6 +164,24 @@ class Artifact(BaseModel):
             return None
         return self.set_effects.get(str(pieces_count))
 
+    # 列表/搜索卡片视图只需要的列（配合 load_only 使用）
+    SUMMARY_COLUMNS = ('id', 'name', 'name_en', 'set_name', 'slot', 'rarity', 'main_stat_type')
+
+    def to_summary_dict(self):
+        """转换为卡片视图字典（只访问 SUMMARY_COLUMNS 中的列）"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'name_en': self.name_en,
+            'set_name': self.set_name,
+            'slot': self.slot,
+            'slot_display': self.get_slot_display(),
+            'rarity': self.rarity,
+            'rarity_display': self.get_rarity_display(),
+            'main_stat_type': self.main_stat_type,
+            'main_stat_display': self.get_main_stat_display(),
+        }
+
     def to_dict(self):
         """转换为字典"""
         return {
@@ -196,10 +214,40 @@ class Artifact(BaseModel):
 
     # 数据库索引
     __table_args__ = (
-        Index('idx_artifacts_set_name', 'set_name'),
-        Index('idx_artifacts_slot', 'slot'),
+        # 名称唯一，创建时由 INSERT ... ON CONFLICT 判重
+        UniqueConstraint('name', name='uq_artifacts_name'),
         Index('idx_artifacts_rarity', 'rarity'),
         Index('idx_artifacts_source', 'source'),
         Index('idx_artifacts_main_stat', 'main_stat_type'),
-        Index('idx_artifacts_set_slot', 'set_name', 'slot'),  # 复合索引
+        Index('idx_artifacts_created_at', 'created_at'),
+        # 复合索引，列顺序与 get_artifacts_by_set / get_artifacts_by_slot 的过滤+排序一致，
+        # 同时可作为 set_name、slot 单列过滤的前缀索引；
+        # INCLUDE 其余卡片视图列（SUMMARY_COLUMNS），卡片查询可走仅索引扫描
+        Index(
+            'idx_artifacts_set_slot_rarity', set_name, slot, rarity.desc(),
+            postgresql_include=['id', 'name', 'name_en', 'main_stat_type']
+        ),
+        Index(
+            'idx_artifacts_slot_rarity_set', slot, rarity.desc(), set_name,
+            postgresql_include=['id', 'name', 'name_en', 'main_stat_type']
+        ),
+        # 搜索索引：trigram GIN 让 ILIKE '%关键词%' 走索引而不是全表扫描
+        Index(
+            'idx_artifacts_search',
+            'name',
+            'name_en',
+            'set_name',
+            'description',
+            'main_stat_type',
+            'slot',
+            postgresql_using='gin',
+            postgresql_ops={
+                'name': 'gin_trgm_ops',
+                'name_en': 'gin_trgm_ops',
+                'set_name': 'gin_trgm_ops',
+                'description': 'gin_trgm_ops',
+                'main_stat_type': 'gin_trgm_ops',
+                'slot': 'gin_trgm_ops'
+            }
+        ),
     )
\ No newline at end of file
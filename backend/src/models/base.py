@@ -19,12 +19,14 @@ class TimestampMixin:
         DateTime,
         nullable=False,
         default=func.now(),
+        server_default=func.now(),
         comment="创建时间"
     )
     updated_at = Column(
         DateTime,
         nullable=False,
         default=func.now(),
+        server_default=func.now(),
         onupdate=func.now(),
         comment="更新时间"
     )
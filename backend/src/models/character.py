@@ -3,13 +3,33 @@
 
 存储角色基础信息、属性和相关数据
 """
-from sqlalchemy import Column, String, Integer, Text, Date, Index
+from sqlalchemy import Column, String, Integer, Text, Date, Index, func, inspect, literal_column
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from src.models.base import BaseModel
 
 
+# 搜索文档中各列之间的分隔符（ASCII 单元分隔符）。搜索词中会去掉该字符，
+# 因此 '%关键词%' 不会跨越列边界匹配（空格分隔时 "将军 Raiden" 会跨 name/name_en 命中）
+SEARCH_DOCUMENT_SEPARATOR = "\x1f"
+
+
+def _search_document(*columns):
+    """
+    拼接可搜索的文本列，作为单一搜索文档
+
+    使用 coalesce(...) || E'\\x1f' || ... 而不是 concat_ws（后者不是 IMMUTABLE，不能用于索引表达式）；
+    常量以字面量写入SQL，保证查询表达式与索引表达式完全一致
+    """
+    separator = literal_column("E'\\x1f'")
+    document = None
+    for column in columns:
+        part = func.coalesce(column, literal_column("''"))
+        document = part if document is None else document.op('||')(separator).op('||')(part)
+    return document
+
+
 class Character(BaseModel):
     """
     角色模型
@@ -94,17 +114,19 @@ class Character(BaseModel):
     )
 
     # 关联关系
+    # 技能和天赋必须由查询显式 selectinload；未预加载时访问直接报错，
+    # 避免遗漏预加载而退化为逐行懒加载（N+1）
     skills = relationship(
         "CharacterSkill",
         back_populates="character",
         cascade="all, delete-orphan",
-        lazy="selectin"  # 优化查询性能
+        lazy="raise"
     )
     talents = relationship(
         "CharacterTalent",
         back_populates="character",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise"
     )
     weapon_recommendations = relationship(
         "CharacterWeaponRecommendation",
@@ -125,20 +147,31 @@ class Character(BaseModel):
 
     # 数据库索引
     __table_args__ = (
-        Index('idx_characters_element', 'element'),
-        Index('idx_characters_weapon_type', 'weapon_type'),
-        Index('idx_characters_rarity', 'rarity'),
-        Index('idx_characters_region', 'region'),
-        # 全文搜索索引（中文支持）
+        # 复合索引：过滤列 + 列表默认排序列（name），分页查询可直接按索引顺序读取前 N 行，
+        # 无需排序；同时可作为单列过滤的前缀索引。不按 name 过滤时由 name 的唯一索引提供顺序
+        Index('idx_characters_element_name', 'element', 'name'),
+        Index('idx_characters_weapon_type_name', 'weapon_type', 'name'),
+        Index('idx_characters_rarity_name', 'rarity', 'name'),
+        Index('idx_characters_region_name', 'region', 'name'),
+        # 名称前缀搜索索引：短关键词（trigram 无法过滤）时 search_characters 按
+        # lower(name) LIKE '前缀%' 查询，text_pattern_ops 使 LIKE 前缀可走 B-tree
         Index(
-            'idx_characters_search',
-            'name',
-            'description',
+            'idx_characters_name_lower_prefix',
+            func.lower(name).label('name_lower'),
+            postgresql_ops={'name_lower': 'text_pattern_ops'}
+        ),
+        Index(
+            'idx_characters_name_en_lower_prefix',
+            func.lower(name_en).label('name_en_lower'),
+            postgresql_ops={'name_en_lower': 'text_pattern_ops'}
+        ),
+        # 搜索索引：在拼接后的搜索文档上建 trigram GIN 表达式索引，
+        # 一个 ILIKE '%关键词%' 即可走索引，替代多列 ILIKE 的 OR（中文支持）
+        Index(
+            'idx_characters_search_document',
+            _search_document(name, name_en, title, description, affiliation, constellation_name).label('search_document'),
             postgresql_using='gin',
-            postgresql_ops={
-                'name': 'gin_trgm_ops',
-                'description': 'gin_trgm_ops'
-            }
+            postgresql_ops={'search_document': 'gin_trgm_ops'}
         ),
     )
 
@@ -178,17 +211,29 @@ class Character(BaseModel):
     def to_dict(self) -> dict:
         """转换为字典（包含关联数据）"""
         result = super().to_dict()
+        # 只序列化已预加载的关联数据（未加载的关联访问会报错）
+        unloaded = inspect(self).unloaded
 
         # 添加技能信息
-        if hasattr(self, 'skills') and self.skills:
+        if 'skills' not in unloaded and self.skills:
             result['skills'] = [skill.to_dict() for skill in self.skills]
 
         # 添加天赋信息
-        if hasattr(self, 'talents') and self.talents:
+        if 'talents' not in unloaded and self.talents:
             result['talents'] = [talent.to_dict() for talent in self.talents]
 
         return result
 
+    # 列表卡片视图只需要的列（列表查询直接按列选取，返回行映射）
+    SUMMARY_COLUMNS = ('id', 'name', 'name_en', 'element', 'weapon_type', 'rarity', 'region', 'title', 'base_stats')
+
+    @classmethod
+    def search_document(cls):
+        """搜索文档表达式（与 idx_characters_search_document 的索引表达式一致）"""
+        return _search_document(
+            cls.name, cls.name_en, cls.title, cls.description, cls.affiliation, cls.constellation_name
+        )
+
     @classmethod
     def get_element_types(cls) -> list:
         """获取所有元素类型"""
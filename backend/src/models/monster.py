@@ -3,12 +3,32 @@
 
 存储原神怪物的基础信息、属性、技能和掉落物等数据
 """
-from sqlalchemy import Column, String, Integer, Text, Float, Boolean, Index
+from sqlalchemy import (
+    Column, String, Integer, Text, Float, Boolean, Index, UniqueConstraint,
+    column, desc, func, literal_column
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from src.models.base import BaseModel
 
 
+def _search_vector(**weighted_columns):
+    """
+    构建加权全文检索向量 setweight(to_tsvector('simple', coalesce(col, '')), 'A') || ...
+
+    使用 'simple' 配置（不做词干处理，中文词不会被丢弃）；常量以字面量写入SQL，
+    保证查询表达式与索引表达式完全一致
+    """
+    vector = None
+    for weight, text_column in weighted_columns.items():
+        part = func.setweight(
+            func.to_tsvector(literal_column("'simple'"), func.coalesce(text_column, literal_column("''"))),
+            literal_column(f"'{weight}'")
+        )
+        vector = part if vector is None else vector.op('||')(part)
+    return vector
+
+
 class Monster(BaseModel):
     """
     怪物模型
@@ -83,23 +103,49 @@ class Monster(BaseModel):
     # 是否激活状态
     is_active = Column(Boolean, default=True, comment="是否在游戏中激活")
 
+    # 列表卡片视图只需要的列（列表查询直接按列选取，返回行映射）
+    SUMMARY_COLUMNS = ('id', 'name', 'name_en', 'category', 'family', 'element', 'level', 'world_level')
+
+    # 文本搜索覆盖的列（均有 trigram GIN 索引）
+    SEARCH_COLUMNS = ('name', 'name_en', 'category', 'family', 'description', 'behavior', 'lore')
+
     # 数据库索引
     __table_args__ = (
-        Index('idx_monsters_category', 'category'),
-        Index('idx_monsters_family', 'family'),
-        Index('idx_monsters_element', 'element'),
+        # 名称唯一：名称查重走唯一索引，并由数据库兜底检查与插入之间的并发竞态
+        UniqueConstraint('name', name='uq_monsters_name'),
+        # 复合索引：过滤列 + get_monsters_by_* 的排序（level, created_at DESC），
+        # 按索引顺序读取前 N 行即可满足 LIMIT，无需排序；同时可作为单列过滤的前缀索引
+        Index('idx_monsters_category_level', 'category', 'level', desc(column('created_at'))),
+        Index('idx_monsters_family_level', 'family', 'level', desc(column('created_at'))),
+        Index(
+            'idx_monsters_element_level', 'element', 'level', desc(column('created_at')),
+            postgresql_where=element.is_not(None)
+        ),
         Index('idx_monsters_level', 'level'),
         Index('idx_monsters_world_level', 'world_level'),
-        # 全文搜索索引
+        # 地区过滤索引：regions @> '["地区"]' 由 jsonb_path_ops GIN 索引支持
         Index(
-            'idx_monsters_search',
-            'name',
-            'description',
+            'idx_monsters_regions',
+            'regions',
             postgresql_using='gin',
-            postgresql_ops={
-                'name': 'gin_trgm_ops',
-                'description': 'gin_trgm_ops'
-            }
+            postgresql_ops={'regions': 'jsonb_path_ops'}
+        ),
+        # 搜索索引：每个可搜索文本列单独建 trigram GIN 索引，
+        # 多列 ILIKE '%关键词%' 的 OR 条件可由各列索引 BitmapOr 合并，避免全表扫描（中文支持）
+        *(
+            Index(
+                f'idx_monsters_{search_column}_trgm',
+                search_column,
+                postgresql_using='gin',
+                postgresql_ops={search_column: 'gin_trgm_ops'}
+            )
+            for search_column in SEARCH_COLUMNS
+        ),
+        # 全文检索索引：多词查询走 tsvector @@ plainto_tsquery，可按 ts_rank_cd 排序
+        Index(
+            'idx_monsters_search_vector',
+            _search_vector(A=name, B=description, C=behavior, D=lore).label('search_vector'),
+            postgresql_using='gin'
         ),
     )
 
@@ -177,6 +223,11 @@ class Monster(BaseModel):
 
         return result
 
+    @classmethod
+    def search_vector(cls):
+        """全文检索向量表达式（与 idx_monsters_search_vector 的索引表达式一致）"""
+        return _search_vector(A=cls.name, B=cls.description, C=cls.behavior, D=cls.lore)
+
     @classmethod
     def get_categories(cls) -> list:
         """获取所有怪物类别"""
@@ -41,6 +41,8 @@ class ArtifactQueryParams(BaseQueryParams):
     search: Optional[str] = Field(None, min_length=1, max_length=100, description="搜索关键词")
     sort_by: str = Field("name", description="排序字段")
     sort_order: str = Field("asc", pattern="^(asc|desc)$", description="排序方向")
+    cursor_id: Optional[int] = Field(None, ge=1, description="游标分页：上一页最后一条的ID")
+    cursor_value: Optional[str] = Field(None, description="游标分页：上一页最后一条的排序字段值")
 
     @validator('slot')
     def validate_slot(cls, v):
@@ -273,6 +275,25 @@ class ArtifactResponse(EntityBase):
         return cls(**data)
 
 
+class ArtifactSummaryResponse(BaseModel):
+    """圣遗物卡片视图响应数据（不含描述、背景故事等大字段）"""
+    id: int
+    name: str
+    name_en: Optional[str]
+    set_name: str
+    slot: str
+    slot_display: str
+    rarity: int
+    rarity_display: str
+    main_stat_type: str
+    main_stat_display: str
+
+    @classmethod
+    def from_orm(cls, artifact):
+        """从ORM模型创建响应对象"""
+        return cls(**artifact.to_summary_dict())
+
+
 # ===== 统计数据 =====
 
 class ArtifactStats(BaseModel):
@@ -300,12 +321,13 @@ class ArtifactListResponse(BaseModel):
     message: str = "操作成功"
 
     @classmethod
-    def create_success(cls, artifacts: List, total: int, page: int, per_page: int, **kwargs):
+    def create_success(cls, artifacts: List, total: int, page: int, per_page: int, detail: bool = True, **kwargs):
         """创建成功响应"""
+        response_cls = ArtifactResponse if detail else ArtifactSummaryResponse
         return cls(
             success=True,
             data={
-                "artifacts": [ArtifactResponse.from_orm(artifact) for artifact in artifacts],
+                "artifacts": [response_cls.from_orm(artifact) for artifact in artifacts],
                 "total": total,
                 "page": page,
                 "per_page": per_page,
@@ -339,12 +361,13 @@ class ArtifactSearchResponse(BaseModel):
     message: str = "操作成功"
 
     @classmethod
-    def create_success(cls, artifacts: List, query: str):
+    def create_success(cls, artifacts: List, query: str, detail: bool = True):
         """创建搜索成功响应"""
+        response_cls = ArtifactResponse if detail else ArtifactSummaryResponse
         return cls(
             success=True,
             data={
-                "results": [ArtifactResponse.from_orm(artifact) for artifact in artifacts],
+                "results": [response_cls.from_orm(artifact) for artifact in artifacts],
                 "query": query,
                 "total": len(artifacts)
             },
@@ -359,13 +382,14 @@ class ArtifactSetResponse(BaseModel):
     message: str = "操作成功"
 
     @classmethod
-    def create_success(cls, set_name: str, artifacts: List):
+    def create_success(cls, set_name: str, artifacts: List, detail: bool = True):
         """创建套装成功响应"""
+        response_cls = ArtifactResponse if detail else ArtifactSummaryResponse
         return cls(
             success=True,
             data={
                 "set_name": set_name,
-                "artifacts": [ArtifactResponse.from_orm(artifact) for artifact in artifacts],
+                "artifacts": [response_cls.from_orm(artifact) for artifact in artifacts],
                 "total_pieces": len(artifacts),
                 "complete_set": len(artifacts) >= 4
             },
@@ -3,7 +3,7 @@
 
 定义通用的响应格式、分页、查询参数等基础 Schema
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 from pydantic import BaseModel, Field, validator
 
@@ -233,7 +233,7 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="错误信息")
     code: Optional[str] = Field(None, description="错误代码")
     details: Optional[Dict[str, Any]] = Field(None, description="详细信息")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="错误时间")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="错误时间")
 
 
 # 批量操作
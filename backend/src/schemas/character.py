@@ -4,7 +4,7 @@
 定义角色数据的请求和响应格式
 """
 from datetime import date, datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from pydantic import BaseModel, Field, validator
 
 from src.schemas.base import EntityBase, BaseQueryParams, ElementFilter, RarityFilter, WeaponTypeFilter
@@ -195,6 +195,17 @@ class CharacterQueryParams(BaseQueryParams, ElementFilter, RarityFilter, WeaponT
         pattern="^(Mondstadt|Liyue|Inazuma|Sumeru|Fontaine|Natlan|Snezhnaya)$",
         description="地区过滤"
     )
+    detail: bool = Field(True, description="是否加载全部列（为 False 时只加载卡片视图列）")
+    include: Set[str] = Field(default_factory=set, description="需要一并加载的关联数据（skills, talents）")
+    exact_count: bool = Field(True, description="是否精确统计总数（为 False 时返回规划器估算值）")
+
+    @validator('include')
+    def validate_include(cls, v):
+        allowed = {'skills', 'talents'}
+        unknown = set(v) - allowed
+        if unknown:
+            raise ValueError(f'include 只支持: {", ".join(sorted(allowed))}')
+        return set(v)
 
 
 class CharacterSkillQueryParams(BaseQueryParams):
@@ -62,6 +62,9 @@ class MonsterQueryParams(BaseQueryParams):
     search: Optional[str] = Field(None, min_length=1, max_length=100, description="搜索关键词")
     sort_by: str = Field("name", description="排序字段")
     sort_order: str = Field("asc", pattern="^(asc|desc)$", description="排序方向")
+    with_total: bool = Field(True, description="是否统计总数（不统计时只返回是否有下一页）")
+    cursor_id: Optional[int] = Field(None, ge=1, description="游标分页：上一页最后一条的ID（仅按ID排序时可用）")
+    detail: bool = Field(True, description="是否加载全部列（为 False 时只加载卡片视图列）")
 
     @validator('category')
     def validate_category(cls, v):
@@ -378,6 +381,18 @@ class PopularMonsterFamily(BaseModel):
 
 # ===== 列表响应 =====
 
+class MonsterSummaryResponse(BaseModel):
+    """怪物卡片视图响应数据（不含描述、背景故事等大字段）"""
+    id: int
+    name: str
+    name_en: Optional[str]
+    category: str
+    family: str
+    element: Optional[str]
+    level: int
+    world_level: Optional[int]
+
+
 class MonsterListResponse(BaseModel):
     """怪物列表响应"""
     success: bool = True
@@ -385,17 +400,34 @@ class MonsterListResponse(BaseModel):
     message: str = "操作成功"
 
     @classmethod
-    def create_success(cls, monsters: List, total: int, page: int, per_page: int, **kwargs):
-        """创建成功响应"""
+    def create_success(
+        cls,
+        monsters: List,
+        total: Optional[int],
+        page: int,
+        per_page: int,
+        has_next: Optional[bool] = None,
+        detail: bool = True,
+        **kwargs
+    ):
+        """
+        创建成功响应
+
+        total 为 None 表示未统计总数，此时由 has_next 指明是否有下一页；
+        detail=False 时 monsters 为卡片视图列的映射
+        """
         return cls(
             success=True,
             data={
-                "monsters": [MonsterResponse.from_orm(monster) for monster in monsters],
+                "monsters": [
+                    MonsterResponse.from_orm(monster) if detail else MonsterSummaryResponse(**monster)
+                    for monster in monsters
+                ],
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "pages": (total + per_page - 1) // per_page,
-                "has_next": page * per_page < total,
+                "pages": (total + per_page - 1) // per_page if total is not None else None,
+                "has_next": has_next if has_next is not None else page * per_page < total,
                 "has_prev": page > 1,
                 **kwargs
             },
@@ -8,11 +8,12 @@ and monster data from various sources including:
 - Other community databases
 """
 
-from .base_scraper import BaseScraper, ScraperConfig
+from .base_scraper import BaseScraper, CachedResponse, ScraperConfig
 from .character_scraper import CharacterScraper
 
 __all__ = [
     "BaseScraper",
+    "CachedResponse",
     "ScraperConfig",
     "CharacterScraper",
 ]
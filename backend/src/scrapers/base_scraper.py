@@ -7,16 +7,24 @@ Provides:
 - Request retry with exponential backoff
 - User-Agent rotation
 - Proxy support (optional)
+- Conditional GETs (ETag / Last-Modified) for unchanged pages
+- Optional on-disk gzip cache of fetched HTML
 - Error handling and logging
 """
 
 import asyncio
+import gzip
+import hashlib
 import logging
+import os
 import random
+import tempfile
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import aiohttp
 from aiohttp import ClientSession, ClientTimeout, TCPConnector
@@ -41,10 +49,20 @@ class ScraperConfig:
 
     # Request timeout
     timeout_seconds: int = 30
+    connect_timeout_seconds: float = 10.0
+    read_timeout_seconds: float = 20.0
 
-    # Connection pool
-    max_connections: int = 10
-    max_connections_per_host: int = 5
+    # Maximum number of pages scraped concurrently
+    max_concurrency: int = 8
+
+    # Connection pool (shared by every fetch for the scraper's lifetime)
+    max_connections: int = 64
+    max_connections_per_host: int = 16
+    dns_cache_ttl_seconds: int = 300
+    keepalive_timeout_seconds: float = 60.0
+
+    # HTML parsing worker processes (0: parse in a thread, off the event loop)
+    parse_workers: int = 0
 
     # User-Agent rotation
     user_agents: List[str] = field(default_factory=lambda: [
@@ -55,6 +73,18 @@ class ScraperConfig:
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
     ])
 
+    # Conditional GET cache: number of pages whose body and validators are
+    # kept for If-None-Match / If-Modified-Since requests (0 disables)
+    response_cache_size: int = 256
+
+    # On-disk gzip cache of fetched HTML used by fetch_cached (None disables).
+    # Set SCRAPER_NOCACHE=1 to ignore cached files and refetch everything.
+    html_cache_dir: Optional[str] = field(
+        default_factory=lambda: os.getenv("SCRAPER_HTML_CACHE_DIR")
+    )
+    html_cache_ttl_seconds: int = 24 * 3600
+    html_cache_max_files: int = 2000
+
     # Proxy configuration (optional)
     proxy_url: Optional[str] = None
 
@@ -62,6 +92,49 @@ class ScraperConfig:
     respect_robots_txt: bool = True
 
 
+@dataclass
+class CachedResponse:
+    """A previously fetched page with the validators needed to revalidate it."""
+
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Parsed result attached by subclasses so unchanged pages skip parsing too
+    parsed: Optional[Any] = None
+
+
+# Shared by all scraper instances in the process, keyed by URL (LRU order)
+_response_cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+
+def _read_html_cache(path: Path, ttl_seconds: int) -> Optional[str]:
+    """Read a cached page if it exists and is younger than ttl_seconds."""
+    try:
+        if datetime.now().timestamp() - path.stat().st_mtime > ttl_seconds:
+            return None
+        return gzip.decompress(path.read_bytes()).decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+
+
+def _write_html_cache(path: Path, html: str, max_files: int) -> None:
+    """Atomically write a page to the cache, evicting the oldest files past max_files."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(gzip.compress(html.encode("utf-8")))
+        os.replace(tmp_name, path)
+
+        cached_files = list(path.parent.glob("*.html.gz"))
+        if len(cached_files) > max_files:
+            cached_files.sort(key=lambda f: f.stat().st_mtime)
+            for stale in cached_files[:len(cached_files) - max_files]:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to write HTML cache {path}: {e}")
+
+
 class BaseScraper(ABC):
     """
     Base class for all web scrapers.
@@ -83,9 +156,12 @@ class BaseScraper(ABC):
         """
         self.config = config or ScraperConfig()
         self.session: Optional[ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._rate_limit_lock = asyncio.Lock()
         self._last_request_time: Optional[datetime] = None
         self._request_count = 0
         self._error_count = 0
+        self._not_modified_urls: Set[str] = set()
 
         logger.info(f"Initialized {self.__class__.__name__} with config: {self.config}")
 
@@ -99,12 +175,31 @@ class BaseScraper(ABC):
         await self.close()
 
     async def start(self):
-        """Initialize the HTTP session."""
-        if self.session is None:
-            timeout = ClientTimeout(total=self.config.timeout_seconds)
+        """
+        Initialize the HTTP session.
+
+        The session (and its keep-alive connection pool) is created lazily
+        and reused by every fetch, so TCP/TLS handshakes are paid once per
+        host instead of once per request. Concurrent callers share the same
+        session thanks to the lock.
+        """
+        if self.session is not None:
+            return
+
+        async with self._session_lock:
+            if self.session is not None:
+                return
+
+            timeout = ClientTimeout(
+                total=self.config.timeout_seconds,
+                connect=self.config.connect_timeout_seconds,
+                sock_read=self.config.read_timeout_seconds,
+            )
             connector = TCPConnector(
                 limit=self.config.max_connections,
                 limit_per_host=self.config.max_connections_per_host,
+                ttl_dns_cache=self.config.dns_cache_ttl_seconds,
+                keepalive_timeout=self.config.keepalive_timeout_seconds,
             )
 
             self.session = ClientSession(
@@ -117,6 +212,9 @@ class BaseScraper(ABC):
         """Close the HTTP session."""
         if self.session:
             await self.session.close()
+            # Give the connector a moment to close underlying SSL transports
+            # (see aiohttp "Graceful Shutdown" docs)
+            await asyncio.sleep(0.25)
             self.session = None
             logger.info(
                 f"{self.__class__.__name__} session closed. "
@@ -128,22 +226,28 @@ class BaseScraper(ABC):
         return random.choice(self.config.user_agents)
 
     async def _apply_rate_limit(self):
-        """Apply rate limiting between requests."""
-        if self._last_request_time:
-            elapsed = (datetime.now() - self._last_request_time).total_seconds()
-            required_delay = 1.0 / self.config.requests_per_second
-
-            if elapsed < required_delay:
-                sleep_time = required_delay - elapsed
-                # Add random jitter
-                sleep_time += random.uniform(
-                    self.config.min_delay_seconds,
-                    self.config.max_delay_seconds
-                )
-                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-                await asyncio.sleep(sleep_time)
+        """
+        Apply rate limiting between requests.
+
+        Serialized with a lock so concurrent fetches start one after another
+        at the configured rate; their responses still overlap.
+        """
+        async with self._rate_limit_lock:
+            if self._last_request_time:
+                elapsed = (datetime.now() - self._last_request_time).total_seconds()
+                required_delay = 1.0 / self.config.requests_per_second
+
+                if elapsed < required_delay:
+                    sleep_time = required_delay - elapsed
+                    # Add random jitter
+                    sleep_time += random.uniform(
+                        self.config.min_delay_seconds,
+                        self.config.max_delay_seconds
+                    )
+                    logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
 
-        self._last_request_time = datetime.now()
+            self._last_request_time = datetime.now()
 
     async def fetch(
         self,
@@ -185,6 +289,21 @@ class BaseScraper(ABC):
         if headers:
             request_headers.update(headers)
 
+        # Revalidate pages we already hold instead of downloading them again
+        cacheable = (
+            method == "GET"
+            and not params
+            and data is None
+            and json is None
+            and self.config.response_cache_size > 0
+        )
+        cached = _response_cache.get(url) if cacheable else None
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
         # Retry logic
         for attempt in range(self.config.max_retries):
             try:
@@ -201,6 +320,13 @@ class BaseScraper(ABC):
                     json=json,
                     proxy=self.config.proxy_url,
                 ) as response:
+                    if response.status == 304 and cached is not None:
+                        self._request_count += 1
+                        self._not_modified_urls.add(url)
+                        _response_cache.move_to_end(url)
+                        logger.info(f"Not modified since last fetch: {url}")
+                        return cached.body
+
                     response.raise_for_status()
                     self._request_count += 1
 
@@ -209,6 +335,10 @@ class BaseScraper(ABC):
                         f"Successfully fetched {url} "
                         f"(status: {response.status}, length: {len(text)})"
                     )
+
+                    self._not_modified_urls.discard(url)
+                    if cacheable:
+                        self._remember_response(url, text, response.headers)
                     return text
 
             except aiohttp.ClientError as e:
@@ -235,6 +365,67 @@ class BaseScraper(ABC):
 
         return None
 
+    async def fetch_cached(self, url: str) -> Optional[str]:
+        """
+        Fetch a GET page through the on-disk HTML cache.
+
+        Pages are stored gzip-compressed as <sha1(url)>.html.gz under
+        config.html_cache_dir and served from disk while younger than
+        html_cache_ttl_seconds, so development re-runs skip the network.
+        Falls back to a plain fetch when no cache directory is configured.
+
+        Args:
+            url: The URL to fetch
+
+        Returns:
+            Response text if successful, None otherwise
+        """
+        cache_dir = self.config.html_cache_dir
+        if not cache_dir:
+            return await self.fetch(url)
+
+        path = Path(cache_dir) / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html.gz"
+
+        if os.getenv("SCRAPER_NOCACHE") != "1":
+            html = await asyncio.to_thread(
+                _read_html_cache, path, self.config.html_cache_ttl_seconds
+            )
+            if html is not None:
+                logger.debug(f"Served from HTML cache: {url}")
+                return html
+
+        html = await self.fetch(url)
+        if html:
+            await asyncio.to_thread(
+                _write_html_cache, path, html, self.config.html_cache_max_files
+            )
+        return html
+
+    def _remember_response(self, url: str, text: str, headers: Any) -> None:
+        """Store a fetched page and its validators for later conditional GETs."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if not etag and not last_modified:
+            # Nothing to revalidate with, so there is no point keeping the body
+            _response_cache.pop(url, None)
+            return
+
+        _response_cache[url] = CachedResponse(
+            body=text, etag=etag, last_modified=last_modified
+        )
+        _response_cache.move_to_end(url)
+        while len(_response_cache) > self.config.response_cache_size:
+            _response_cache.popitem(last=False)
+
+    def get_cached_response(self, url: str) -> Optional[CachedResponse]:
+        """Get the cached page for a URL, if any."""
+        return _response_cache.get(url)
+
+    def is_not_modified(self, url: str) -> bool:
+        """Whether the last fetch of this URL was answered with 304 Not Modified."""
+        return url in self._not_modified_urls
+
     def parse_html(self, html: str, parser: str = "lxml") -> Optional[BeautifulSoup]:
         """
         Parse HTML content into BeautifulSoup object.
@@ -5,17 +5,166 @@ Scrapes character information from individual character pages on Bilibili Game W
 URL pattern: https://wiki.biligame.com/ys/{角色中文名}
 """
 
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import quote
 
+import soupsieve
 from bs4 import BeautifulSoup, Tag
 
 from .base_scraper import BaseScraper, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# Element mapping (Chinese to English)
+_ELEMENT_MAP: Dict[str, str] = {
+    "火": "Pyro",
+    "火元素": "Pyro",
+    "水": "Hydro",
+    "水元素": "Hydro",
+    "风": "Anemo",
+    "风元素": "Anemo",
+    "雷": "Electro",
+    "雷元素": "Electro",
+    "草": "Dendro",
+    "草元素": "Dendro",
+    "冰": "Cryo",
+    "冰元素": "Cryo",
+    "岩": "Geo",
+    "岩元素": "Geo",
+}
+
+# Weapon type mapping (Chinese to English)
+_WEAPON_MAP: Dict[str, str] = {
+    "单手剑": "Sword",
+    "单手剑武器使用": "Sword",
+    "双手剑": "Claymore",
+    "双手剑武器使用": "Claymore",
+    "长柄武器": "Polearm",
+    "长柄武器武器使用": "Polearm",
+    "弓": "Bow",
+    "弓武器使用": "Bow",
+    "弓箭武器使用": "Bow",
+    "法器": "Catalyst",
+    "法器武器使用": "Catalyst",
+}
+
+# Region mapping (Chinese to English)
+_REGION_MAP: Dict[str, str] = {
+    "蒙德": "Mondstadt",
+    "璃月": "Liyue",
+    "稻妻": "Inazuma",
+    "须弥": "Sumeru",
+    "枫丹": "Fontaine",
+    "纳塔": "Natlan",
+    "至冬": "Snezhnaya",
+}
+
+_NUMBER_RE = re.compile(r"([\d.]+)")
+# Percentage signs, ASCII/full-width commas and spaces, removed in one C-level pass
+_STAT_STRIP_TABLE = str.maketrans("", "", "%,， ")
+
+# Precompiled CSS selectors for the wikitable walks (parsed once, not per call)
+_WIKITABLE_SELECTOR = soupsieve.compile("table.wikitable")
+_TR_SELECTOR = soupsieve.compile("tr")
+_TH_SELECTOR = soupsieve.compile("th")
+_TD_SELECTOR = soupsieve.compile("td")
+
+# Resolved header/label → target field, memoized per distinct string.
+# Wiki tables reuse the same handful of headers on every character page,
+# so each header runs the substring classification below only once.
+_STAT_KEYS: Dict[str, Optional[Tuple[str, str]]] = {}
+_BASIC_INFO_KEYS: Dict[str, Optional[str]] = {}
+
+
+def _classify_stat_header(header: str) -> Optional[Tuple[str, str]]:
+    """Map a stats table header to a (section, key) pair, or None if unknown."""
+    header_lower = header.lower()
+
+    if "生命" in header or "hp" in header_lower:
+        return ("base_stats", "hp")
+    if "攻击" in header or "atk" in header_lower or "attack" in header_lower:
+        return ("base_stats", "atk")
+    if "防御" in header or "def" in header_lower or "defense" in header_lower:
+        return ("base_stats", "def")
+    if "暴击" in header and "率" in header:
+        return ("ascension_stats", "crit_rate")
+    if "暴击" in header and "伤" in header:
+        return ("ascension_stats", "crit_dmg")
+    if "元素充能" in header or "energy" in header_lower:
+        return ("ascension_stats", "energy_recharge")
+    if "治疗" in header or "heal" in header_lower:
+        return ("ascension_stats", "healing_bonus")
+    if "元素精通" in header or "mastery" in header_lower:
+        return ("ascension_stats", "elemental_mastery")
+    if "物理伤害" in header:
+        return ("ascension_stats", "physical_dmg_bonus")
+    if "元素伤害" in header or "伤害加成" in header:
+        # Generic elemental damage bonus
+        return ("ascension_stats", "elemental_dmg_bonus")
+    return None
+
+
+def _classify_basic_info_label(label: str) -> Optional[str]:
+    """Map a basic info row label to the field it populates, or None."""
+    if "全名" in label or "本名" in label:
+        return "full_name"
+    if "所属地区" in label:
+        return "region"
+    if "神之眼" in label or "神之心" in label or "古龙大权" in label:
+        return "element"
+    if "武器类型" in label:
+        return "weapon_type"
+    if "稀有度" in label:
+        return "rarity"
+    return None
+
+
+def _parse_stat_number(text: str) -> Optional[Union[int, float]]:
+    """
+    Parse a stats table cell such as "14,695" or "38.4%" into a number.
+
+    The wiki formats plain numbers consistently, so the fast path is a single
+    str.translate plus int()/float(); the regex is only used for cells with
+    extra text around the number.
+    """
+    raw = text.translate(_STAT_STRIP_TABLE)
+    try:
+        return float(raw) if "." in raw else int(raw)
+    except ValueError:
+        pass
+
+    match = _NUMBER_RE.search(raw)
+    if not match:
+        return None
+
+    num_str = match.group(1)
+    try:
+        return float(num_str) if "." in num_str else int(num_str)
+    except ValueError:
+        return None
+
+
+def _resolve_stat_header(header: str) -> Optional[Tuple[str, str]]:
+    """Cached wrapper around _classify_stat_header."""
+    try:
+        return _STAT_KEYS[header]
+    except KeyError:
+        target = _STAT_KEYS[header] = _classify_stat_header(header.strip())
+        return target
+
+
+def _resolve_basic_info_label(label: str) -> Optional[str]:
+    """Cached wrapper around _classify_basic_info_label."""
+    try:
+        return _BASIC_INFO_KEYS[label]
+    except KeyError:
+        field_name = _BASIC_INFO_KEYS[label] = _classify_basic_info_label(label.strip())
+        return field_name
+
 
 class CharacterScraper(BaseScraper):
     """
@@ -30,54 +179,19 @@ class CharacterScraper(BaseScraper):
     # Data source URLs
     BILIBILI_BASE_URL = "https://wiki.biligame.com/ys"
 
-    # Element mapping (Chinese to English)
-    ELEMENT_MAP = {
-        "火": "Pyro",
-        "火元素": "Pyro",
-        "水": "Hydro",
-        "水元素": "Hydro",
-        "风": "Anemo",
-        "风元素": "Anemo",
-        "雷": "Electro",
-        "雷元素": "Electro",
-        "草": "Dendro",
-        "草元素": "Dendro",
-        "冰": "Cryo",
-        "冰元素": "Cryo",
-        "岩": "Geo",
-        "岩元素": "Geo",
-    }
-
-    # Weapon type mapping (Chinese to English)
-    WEAPON_MAP = {
-        "单手剑": "Sword",
-        "单手剑武器使用": "Sword",
-        "双手剑": "Claymore",
-        "双手剑武器使用": "Claymore",
-        "长柄武器": "Polearm",
-        "长柄武器武器使用": "Polearm",
-        "弓": "Bow",
-        "弓武器使用": "Bow",
-        "弓箭武器使用": "Bow",
-        "法器": "Catalyst",
-        "法器武器使用": "Catalyst",
-    }
-
-    # Region mapping (Chinese to English)
-    REGION_MAP = {
-        "蒙德": "Mondstadt",
-        "璃月": "Liyue",
-        "稻妻": "Inazuma",
-        "须弥": "Sumeru",
-        "枫丹": "Fontaine",
-        "纳塔": "Natlan",
-        "至冬": "Snezhnaya",
-    }
+    # Chinese → English maps (module-level so hot loops avoid class attribute lookups)
+    ELEMENT_MAP = _ELEMENT_MAP
+    WEAPON_MAP = _WEAPON_MAP
+    REGION_MAP = _REGION_MAP
 
     def __init__(self, config: Optional[ScraperConfig] = None):
         """Initialize character scraper."""
         super().__init__(config)
+        # Parsed results keyed by page URL; _visited_urls records every URL
+        # scraped successfully so repeated runs skip the fetch entirely
         self._character_cache: Dict[str, Dict[str, Any]] = {}
+        self._visited_urls: Set[str] = set()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
         # Initialize stats if parent didn't
         if not hasattr(self, '_stats'):
@@ -98,27 +212,53 @@ class CharacterScraper(BaseScraper):
         Returns:
             List of character dictionaries with complete information
         """
+        return [char_data async for char_data in self.iter_characters(character_names)]
+
+    async def iter_characters(
+        self, character_names: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape characters one by one, yielding each result as soon as it is parsed.
+
+        Unlike scrape(), nothing is accumulated here: the caller decides how
+        long a character dict lives, so peak memory stays at one page plus
+        whatever the consumer buffers (see DataStorageService.store_character_stream).
+
+        Args:
+            character_names: List of character names (Chinese) to scrape.
+                           If None, will use the default production list (all characters).
+
+        Yields:
+            Character data dictionaries
+        """
         if character_names is None:
             # Production default: all characters (5.2 version)
             character_names = self._get_default_character_list()
 
+        # Drop duplicate names (alias rows) while keeping the original order
+        character_names = list(dict.fromkeys(character_names))
+
         logger.info(f"Starting character scraping for {len(character_names)} characters...")
 
-        characters = []
+        scraped_count = 0
         for char_name in character_names:
             try:
                 char_data = await self.scrape_character(char_name)
-                if char_data:
-                    characters.append(char_data)
-                    logger.info(f"✅ Scraped: {char_name}")
-                else:
-                    logger.warning(f"⚠️  No data for: {char_name}")
             except Exception as e:
+                # Isolate every character: a fetch or parse failure must not end
+                # the stream, since earlier batches may already be committed
                 logger.error(f"❌ Error scraping {char_name}: {e}", exc_info=True)
                 self._stats["errors"] += 1
+                continue
+
+            if char_data:
+                scraped_count += 1
+                logger.info(f"✅ Scraped: {char_name}")
+                yield char_data
+            else:
+                logger.warning(f"⚠️  No data for: {char_name}")
 
-        logger.info(f"Successfully scraped {len(characters)}/{len(character_names)} characters")
-        return characters
+        logger.info(f"Successfully scraped {scraped_count}/{len(character_names)} characters")
 
     def _get_default_character_list(self) -> List[str]:
         """
@@ -194,6 +334,10 @@ class CharacterScraper(BaseScraper):
         encoded_name = quote(char_name)
         url = f"{self.BILIBILI_BASE_URL}/{encoded_name}"
 
+        if url in self._visited_urls:
+            logger.debug(f"Using cached character data: {url}")
+            return self._character_cache.get(url)
+
         logger.debug(f"Fetching character page: {url}")
 
         # Fetch HTML
@@ -202,21 +346,61 @@ class CharacterScraper(BaseScraper):
             logger.error(f"Failed to fetch page for {char_name}")
             return None
 
-        # Parse HTML
-        soup = self.parse_html(html)
-        if not soup:
-            logger.error(f"Failed to parse HTML for {char_name}")
-            return None
+        cached = self.get_cached_response(url)
+        if cached is not None and cached.parsed is not None and self.is_not_modified(url):
+            # Page unchanged since it was last parsed
+            logger.debug(f"Page not modified, reusing parsed data: {url}")
+            char_data = cached.parsed
+        else:
+            # Parse off the event loop; the raw page is dropped once handed over
+            char_data = await self._parse_page(html, char_name)
+            del html
+            if char_data is None:
+                return None
+            if cached is not None:
+                cached.parsed = char_data
+
+        self._visited_urls.add(url)
+        self._character_cache[url] = char_data
+        return char_data
+
+    async def _parse_page(self, html: str, char_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a fetched character page without blocking the event loop.
 
-        # Extract character data
-        try:
-            char_data = self._extract_character_data(soup, char_name)
-            return char_data
-        except Exception as e:
-            logger.error(f"Failed to extract data for {char_name}: {e}", exc_info=True)
-            return None
+        By default the page is parsed in a worker thread (asyncio.to_thread):
+        characters are scraped one at a time, so only one parse is ever in
+        flight and a process pool would add pickling/IPC cost without any
+        parallelism. A positive ScraperConfig.parse_workers opts into a
+        process pool for callers that parse several pages concurrently.
 
-    def _extract_character_data(self, soup: BeautifulSoup, char_name: str) -> Dict[str, Any]:
+        Args:
+            html: Raw page HTML
+            char_name: Character name
+
+        Returns:
+            Character data dictionary or None if parsing failed
+        """
+        if not self.config.parse_workers:
+            return await asyncio.to_thread(_parse_character_page, html, char_name)
+
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.config.parse_workers)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_pool, _parse_character_page, html, char_name
+        )
+
+    async def close(self):
+        """Close the HTTP session and shut down the parse worker pool."""
+        await super().close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    @classmethod
+    def _extract_character_data(cls, soup: BeautifulSoup, char_name: str) -> Dict[str, Any]:
         """
         Extract character data from parsed HTML.
 
@@ -240,7 +424,7 @@ class CharacterScraper(BaseScraper):
         }
 
         # Find all wikitable tables
-        tables = soup.find_all("table", class_="wikitable")
+        tables = _WIKITABLE_SELECTOR.select(soup)
 
         if not tables:
             logger.warning(f"No wikitable found for {char_name}")
@@ -248,30 +432,34 @@ class CharacterScraper(BaseScraper):
 
         # Extract from first table (basic info)
         if len(tables) >= 1:
-            self._extract_basic_info(tables[0], data)
+            cls._extract_basic_info(tables[0], data)
 
         # Extract from second table (stats)
         if len(tables) >= 2:
-            self._extract_stats(tables[1], data)
+            cls._extract_stats(tables[1], data)
 
         # Extract description
-        self._extract_description(soup, data)
+        cls._extract_description(soup, data)
 
         # Extract English name from full name
-        self._extract_english_name(data)
+        cls._extract_english_name(data)
 
         # Handle special cases (Traveler)
-        self._handle_special_characters(data, char_name)
+        cls._handle_special_characters(data, char_name)
 
         return data
 
-    def _extract_basic_info(self, table: Tag, data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _extract_basic_info(table: Tag, data: Dict[str, Any]) -> None:
         """Extract basic character info from the first wikitable."""
-        rows = table.find_all("tr")
+        rows = _TR_SELECTOR.select(table)
+        region_get = _REGION_MAP.get
+        element_get = _ELEMENT_MAP.get
+        weapon_get = _WEAPON_MAP.get
 
         for row in rows:
-            th = row.find("th")
-            td = row.find("td")
+            th = _TH_SELECTOR.select_one(row)
+            td = _TD_SELECTOR.select_one(row)
 
             if not th or not td:
                 continue
@@ -280,23 +468,25 @@ class CharacterScraper(BaseScraper):
             value = td.get_text(strip=True)
 
             # Extract based on label
-            if "全名" in label or "本名" in label:
+            field_name = _resolve_basic_info_label(label)
+
+            if field_name == "full_name":
                 data["full_name"] = value
 
-            elif "所属地区" in label:
+            elif field_name == "region":
                 # Map Chinese region to English
-                data["region"] = self.REGION_MAP.get(value, value)
+                data["region"] = region_get(value, value)
 
-            elif "神之眼" in label or "神之心" in label or "古龙大权" in label:
+            elif field_name == "element":
                 # Extract element (remove "元素" suffix)
                 element_zh = value.replace("元素", "").strip()
-                data["element"] = self.ELEMENT_MAP.get(element_zh, element_zh)
+                data["element"] = element_get(element_zh, element_zh)
 
-            elif "武器类型" in label:
+            elif field_name == "weapon_type":
                 # Map weapon type
-                data["weapon_type"] = self.WEAPON_MAP.get(value, value)
+                data["weapon_type"] = weapon_get(value, value)
 
-            elif "稀有度" in label:
+            elif field_name == "rarity":
                 # Try to extract rarity from alt text or image filename
                 # Format: "5星.png" or "4星.png"
                 stars = td.find_all("img")
@@ -327,17 +517,18 @@ class CharacterScraper(BaseScraper):
                 if rarity:
                     data["rarity"] = rarity
 
-    def _extract_stats(self, table: Tag, data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _extract_stats(table: Tag, data: Dict[str, Any]) -> None:
         """Extract character stats from the second wikitable."""
         # Find all rows (including header)
-        all_rows = table.find_all("tr")
+        all_rows = _TR_SELECTOR.select(table)
 
         if len(all_rows) < 2:
             return
 
         # First row is header with stat names
         header_row = all_rows[0]
-        headers = [th.get_text(strip=True) for th in header_row.find_all("th")]
+        headers = [th.get_text(strip=True) for th in _TH_SELECTOR.iselect(header_row)]
 
         # Skip second row (it's "突破前/突破后" row)
         # Data rows start from index 2
@@ -350,9 +541,9 @@ class CharacterScraper(BaseScraper):
         target_row = None
 
         for row in reversed(data_rows):  # Search from end
-            cells = row.find_all("td")
-            if cells:
-                level_text = cells[0].get_text(strip=True)
+            first_cell = _TD_SELECTOR.select_one(row)
+            if first_cell:
+                level_text = first_cell.get_text(strip=True)
                 # Match "90" exactly
                 if level_text == "90" or level_text == "90级":
                     target_row = row
@@ -365,7 +556,7 @@ class CharacterScraper(BaseScraper):
         if not target_row:
             return
 
-        cells = target_row.find_all("td")
+        cells = _TD_SELECTOR.select(target_row)
 
         # For level 90 row, cells structure is:
         # [level, hp, '-', atk, '-', def, '-', bonus_stat, '-']
@@ -392,54 +583,27 @@ class CharacterScraper(BaseScraper):
             if not value_text or value_text == "-":
                 continue
 
-            # Try to extract numeric value
-            try:
-                # Remove percentage signs, commas, spaces
-                value_clean = value_text.replace("%", "").replace(",", "").replace("，", "").replace(" ", "")
-                # Extract number
-                match = re.search(r"([\d.]+)", value_clean)
-                if match:
-                    num_str = match.group(1)
-                    value = float(num_str) if "." in num_str else int(num_str)
-                else:
-                    continue
-            except Exception as e:
-                logger.debug(f"Failed to parse value '{value_text}' for header '{header}': {e}")
+            value = _parse_stat_number(value_text)
+            if value is None:
+                logger.debug(f"Failed to parse value '{value_text}' for header '{header}'")
                 continue
 
             # Map header to field
-            header_lower = header.lower()
-
-            if "生命" in header or "hp" in header_lower:
-                data["base_stats"]["hp"] = value
-            elif "攻击" in header or "atk" in header_lower or "attack" in header_lower:
-                data["base_stats"]["atk"] = value
-            elif "防御" in header or "def" in header_lower or "defense" in header_lower:
-                data["base_stats"]["def"] = value
-            elif "暴击率" in header or ("暴击" in header and "率" in header):
-                data["ascension_stats"]["stat"] = "crit_rate"
-                data["ascension_stats"]["value"] = value
-            elif "暴击伤害" in header or ("暴击" in header and "伤" in header):
-                data["ascension_stats"]["stat"] = "crit_dmg"
-                data["ascension_stats"]["value"] = value
-            elif "元素充能" in header or "energy" in header_lower:
-                data["ascension_stats"]["stat"] = "energy_recharge"
-                data["ascension_stats"]["value"] = value
-            elif "治疗" in header or "heal" in header_lower:
-                data["ascension_stats"]["stat"] = "healing_bonus"
-                data["ascension_stats"]["value"] = value
-            elif "元素精通" in header or "mastery" in header_lower:
-                data["ascension_stats"]["stat"] = "elemental_mastery"
-                data["ascension_stats"]["value"] = int(value)
-            elif "物理伤害" in header:
-                data["ascension_stats"]["stat"] = "physical_dmg_bonus"
-                data["ascension_stats"]["value"] = value
-            elif "元素伤害" in header or "伤害加成" in header:
-                # Generic elemental damage bonus
-                data["ascension_stats"]["stat"] = "elemental_dmg_bonus"
-                data["ascension_stats"]["value"] = value
-
-    def _extract_description(self, soup: BeautifulSoup, data: Dict[str, Any]) -> None:
+            target = _resolve_stat_header(header)
+            if target is None:
+                continue
+
+            section, key = target
+            if section == "base_stats":
+                data["base_stats"][key] = value
+            else:
+                data["ascension_stats"]["stat"] = key
+                data["ascension_stats"]["value"] = (
+                    int(value) if key == "elemental_mastery" else value
+                )
+
+    @staticmethod
+    def _extract_description(soup: BeautifulSoup, data: Dict[str, Any]) -> None:
         """Extract character description from page content."""
         content_div = soup.find("div", class_="mw-parser-output")
 
@@ -464,7 +628,8 @@ class CharacterScraper(BaseScraper):
             data["description"] = text[:200]  # Limit to 200 chars
             break
 
-    def _extract_english_name(self, data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _extract_english_name(data: Dict[str, Any]) -> None:
         """Extract English name from full_name field."""
         full_name = data.get("full_name", "")
 
@@ -480,7 +645,8 @@ class CharacterScraper(BaseScraper):
             name_en = match.group(1) or match.group(2)
             data["name_en"] = name_en.strip()
 
-    def _handle_special_characters(self, data: Dict[str, Any], char_name: str) -> None:
+    @staticmethod
+    def _handle_special_characters(data: Dict[str, Any], char_name: str) -> None:
         """
         Handle special character cases (e.g., Traveler with no fixed element).
 
@@ -510,3 +676,34 @@ class CharacterScraper(BaseScraper):
             Statistics dictionary
         """
         return self._stats.copy()
+
+
+def _parse_character_page(html: str, char_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a character page into a character data dictionary.
+
+    Kept at module level so it can be pickled into a worker process; only
+    the HTML string and the resulting plain dict cross the process boundary.
+
+    Args:
+        html: Raw page HTML
+        char_name: Character name
+
+    Returns:
+        Character data dictionary or None if parsing failed
+    """
+    try:
+        soup = BeautifulSoup(html, "lxml")
+    except Exception as e:
+        logger.error(f"Failed to parse HTML for {char_name}: {e}", exc_info=True)
+        return None
+
+    try:
+        return CharacterScraper._extract_character_data(soup, char_name)
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+        logger.error(f"Failed to extract data for {char_name}: {e}", exc_info=True)
+        return None
+    finally:
+        # BeautifulSoup trees are full of parent/child reference cycles and
+        # would otherwise linger until the cyclic GC runs
+        soup.decompose()
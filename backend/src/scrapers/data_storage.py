@@ -9,12 +9,17 @@ Handles:
 """
 
 import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import JSON, Row, Table, func, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
+from sqlalchemy.sql import column as sql_column, table as sql_table
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..db.session import json_serializer
 from ..models.character import Character
 from ..models.weapon import Weapon
 from ..models.artifact import Artifact
@@ -22,6 +27,89 @@ from ..models.artifact_set import ArtifactSet
 
 logger = logging.getLogger(__name__)
 
+# Batches at least this large are upserted through a COPY staging table
+COPY_THRESHOLD = 1000
+# Rows per COPY + merge round, bounding memory for very large batches
+COPY_CHUNK_SIZE = 10_000
+# Number of recently written rows remembered per process (see _drop_cached_rows)
+WRITE_CACHE_SIZE = 4096
+
+# LRU of (table, key) -> (last committed row values, updated_at they were
+# written with), shared by every DataStorageService so repeated scrapes in one
+# worker skip identical rows
+_write_cache: "OrderedDict[Tuple[str, Any], Tuple[Dict[str, Any], datetime]]" = OrderedDict()
+
+# Upserted columns per model as (column, scraped key)
+_CHARACTER_FIELDS = (
+    ("name", "name"),
+    ("name_en", "name_en"),
+    ("rarity", "rarity"),
+    ("element", "element"),
+    ("weapon_type", "weapon_type"),
+    ("region", "region"),
+    ("description", "description"),
+    ("base_stats", "base_stats"),
+    ("ascension_stats", "ascension_stats"),
+)
+_WEAPON_FIELDS = (
+    ("name", "name"),
+    ("name_en", "name_en"),
+    ("weapon_type", "weapon_type"),
+    ("rarity", "rarity"),
+    ("base_attack", "base_attack"),
+    ("secondary_stat", "secondary_stat"),
+    ("secondary_stat_value", "secondary_stat_value"),
+    ("description", "description"),
+    ("passive_name", "passive_name"),
+    ("passive_description", "passive_description"),
+    ("source", "source"),
+)
+_ARTIFACT_SET_FIELDS = (
+    ("set_name", "name"),
+    ("set_name_en", "name_en"),
+    ("tags", "tags"),
+    ("max_rarity", "max_rarity"),
+    ("two_piece_bonus", "two_piece_bonus"),
+    ("four_piece_bonus", "four_piece_bonus"),
+    ("description", "description"),
+    ("source", "source"),
+    ("domain_name", "domain_name"),
+    ("pieces", "pieces"),  # 直接存储为JSONB
+)
+
+
+def _build_row(data: Dict[str, Any], fields: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """
+    Build upsert parameters from scraped data following a field spec.
+
+    Missing and empty scraped values ("", [], {}, 0) become None, which the
+    upsert treats as "keep the stored value", so a page that failed to yield
+    a field never blanks out data scraped earlier.
+    """
+    return {column: data.get(key) or None for column, key in fields}
+
+
+def _check_required(row: Dict[str, Any], table: Table) -> Dict[str, Any]:
+    """
+    Reject a row that has no value for a NOT NULL column without a default.
+
+    A NULL there fails the whole multi-row INSERT ... ON CONFLICT statement,
+    even for keys that already exist, so one incomplete scrape would lose
+    the entire batch. Raising here lets the batch loop count the row as an
+    error and upsert the rest.
+    """
+    missing = [
+        column.name for column in table.c
+        if not column.nullable
+        and column.default is None
+        and column.server_default is None
+        and not column.primary_key
+        and row.get(column.name) is None
+    ]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    return row
+
 
 class DataStorageService:
     """Service for storing scraped data in the database."""
@@ -34,6 +122,12 @@ class DataStorageService:
             db_session: Database session for operations
         """
         self.db = db_session
+        # Ingest only writes; keep every statement (including raw COPY) on the primary
+        self.db.info["use_primary"] = True
+        # Rows written in the current transaction, promoted to _write_cache on commit
+        self._pending_writes: Dict[Tuple[str, Any], Tuple[Dict[str, Any], datetime]] = {}
+        # Whether the current transaction already runs with synchronous_commit off
+        self._relaxed_commit = False
         self._stats = {
             "created": 0,
             "updated": 0,
@@ -55,17 +149,52 @@ class DataStorageService:
         """
         logger.info(f"Storing {len(characters)} characters...")
 
-        for char_data in characters:
-            try:
-                await self._store_single_character(char_data)
-            except Exception as e:
-                self._stats["errors"] += 1
-                logger.error(
-                    f"Error storing character {char_data.get('name')}: {e}",
-                    exc_info=True
-                )
+        async with self._rollback_on_error():
+            await self._store_character_batch(characters)
+            await self._commit()
 
-        await self.db.commit()
+        logger.info(
+            f"Character storage complete. "
+            f"Created: {self._stats['created']}, "
+            f"Updated: {self._stats['updated']}, "
+            f"Skipped: {self._stats['skipped']}, "
+            f"Errors: {self._stats['errors']}"
+        )
+
+        return self._stats.copy()
+
+    async def store_character_stream(
+        self,
+        characters: AsyncIterable[Dict[str, Any]],
+        batch_size: int = 100,
+    ) -> Dict[str, int]:
+        """
+        Store characters from an async iterable, committing every batch_size rows.
+
+        Pairs with CharacterScraper.iter_characters so that only one batch of
+        scraped characters is held in memory at a time.
+
+        Args:
+            characters: Async iterable of character dictionaries from scraper
+            batch_size: Number of characters to buffer before flushing
+
+        Returns:
+            Statistics dict with counts of created, updated, skipped, errors
+        """
+        logger.info("Storing streamed characters...")
+
+        batch: List[Dict[str, Any]] = []
+        async with self._rollback_on_error():
+            async for char_data in characters:
+                batch.append(char_data)
+                if len(batch) >= batch_size:
+                    await self._store_character_batch(batch)
+                    await self._commit()
+                    batch.clear()
+
+            if batch:
+                await self._store_character_batch(batch)
+            await self._commit()
 
         logger.info(
             f"Character storage complete. "
@@ -77,157 +206,373 @@ class DataStorageService:
 
         return self._stats.copy()
 
-    async def _store_single_character(self, char_data: Dict[str, Any]):
+    async def _store_character_batch(self, characters: List[Dict[str, Any]]):
         """
-        Store or update a single character.
+        Store a batch of characters without committing.
+
+        The whole batch is written with a single INSERT ... ON CONFLICT (name)
+        DO UPDATE, so the database does the create-or-update decision and no
+        existence lookup is needed.
 
         Args:
-            char_data: Character data dictionary
+            characters: List of character dictionaries from scraper
         """
-        name = char_data.get("name")
-        if not name:
-            logger.warning("Character data missing name, skipping")
-            self._stats["skipped"] += 1
-            return
-
-        # Check if character already exists
-        stmt = select(Character).where(Character.name == name)
-        result = await self.db.execute(stmt)
-        existing_char = result.scalar_one_or_none()
+        # Keyed by name so duplicate rows within a batch collapse to the last one
+        rows: Dict[str, Dict[str, Any]] = {}
 
-        if existing_char:
-            # Update if data has changed
-            if self._character_has_changes(existing_char, char_data):
-                self._update_character(existing_char, char_data)
-                self._stats["updated"] += 1
-                logger.info(f"Updated character: {name}")
-            else:
+        for char_data in characters:
+            name = char_data.get("name")
+            if not name:
+                logger.warning("Character data missing name, skipping")
                 self._stats["skipped"] += 1
-                logger.debug(f"No changes for character: {name}")
-        else:
-            # Create new character
-            new_char = self._create_character(char_data)
-            self.db.add(new_char)
-            self._stats["created"] += 1
-            logger.info(f"Created new character: {name}")
-
-    def _character_has_changes(
-        self, existing: Character, new_data: Dict[str, Any]
-    ) -> bool:
+                continue
+
+            try:
+                rows[name] = self._character_to_row(self._normalize_character(char_data))
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Error storing character {name}: {e}", exc_info=True)
+
+        if rows:
+            upserted = await self._upsert_rows(
+                Character.__table__, "name", list(rows.values()), merge_json=("base_stats",)
+            )
+            self._count_upserted("character", upserted, len(rows))
+
+    def _normalize_character(self, char_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Check if character data has changes compared to existing record.
+        Reshape scraped character data to match the Character model once.
+
+        The stats remapping happens exactly once per character, before the
+        row is built. The scraper's dict is left untouched (it may be shared
+        with the scraper cache).
 
         Args:
-            existing: Existing character from database
-            new_data: New character data from scraper
+            char_data: Character data dictionary from scraper
 
         Returns:
-            True if there are changes, False otherwise
+            Copy of char_data with base_stats as {hp, atk, def} (or None when
+            nothing was scraped) and ascension_stats as a dict or None
         """
-        # Compare key fields
-        fields_to_compare = [
-            "rarity",
-            "element",
-            "weapon_type",
-            "region",
-            "description",
-        ]
+        normalized = dict(char_data)
 
-        for field in fields_to_compare:
-            new_value = new_data.get(field)
-            existing_value = getattr(existing, field, None)
+        # Prepare base_stats in the format expected by the model
+        scraped_stats = char_data.get("base_stats") or {}
+        if scraped_stats:
+            normalized["base_stats"] = {
+                "hp": scraped_stats.get("hp"),
+                "atk": scraped_stats.get("atk", scraped_stats.get("attack")),
+                "def": scraped_stats.get("def", scraped_stats.get("defense")),
+            }
+        else:
+            normalized["base_stats"] = None
+
+        normalized["ascension_stats"] = char_data.get("ascension_stats") or None
+        return normalized
 
-            # Handle None values
-            if new_value is not None and new_value != existing_value:
-                return True
+    def _character_to_row(self, char_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the upsert parameter dict for a character.
 
-        # Compare stats (if present)
-        base_stats = new_data.get("base_stats", {})
-        existing_stats = existing.base_stats or {}
-        if base_stats:
-            if (
-                base_stats.get("hp") and base_stats["hp"] != existing_stats.get("hp") or
-                base_stats.get("atk") and base_stats["atk"] != existing_stats.get("atk") or
-                base_stats.get("def") and base_stats["def"] != existing_stats.get("def")
-            ):
-                return True
+        Args:
+            char_data: Normalized character data (see _normalize_character)
 
-        return False
+        Returns:
+            Column values keyed by Character attribute name
 
-    def _create_character(self, char_data: Dict[str, Any]) -> Character:
+        Raises:
+            ValueError: If a required column (e.g. element) has no value
+        """
+        row = _build_row(char_data, _CHARACTER_FIELDS)
+
+        # base_stats is NOT NULL, so store an empty stat block when none was
+        # scraped; on conflict it is merged with nulls stripped, leaving the
+        # stored stats untouched
+        if not row["base_stats"]:
+            row["base_stats"] = {"hp": None, "atk": None, "def": None}
+
+        return _check_required(row, Character.__table__)
+
+    async def _upsert_rows(
+        self,
+        table: Table,
+        key_column: str,
+        rows: List[Dict[str, Any]],
+        merge_json: Tuple[str, ...] = (),
+    ) -> List[Row]:
         """
-        Create a new Character model instance from scraped data.
+        Upsert rows with INSERT ... ON CONFLICT (key_column) DO UPDATE.
+
+        On conflict each column takes the scraped value, except that NULLs
+        keep the stored value; _build_row turns missing and empty scraped
+        values into NULL, so only real data overwrites a stored column. JSONB
+        columns listed in merge_json are merged key-by-key instead, ignoring
+        null keys.
+
+        NULLs in NOT NULL columns that have a default (e.g.
+        ArtifactSet.max_rarity) are left out of the statement entirely: new
+        rows get the column default and existing rows keep their value. Rows
+        are grouped by the columns they carry and each group is upserted
+        separately.
+
+        The update only happens when at least one column would actually
+        change (IS DISTINCT FROM), so unchanged rows are neither written nor
+        returned; the caller counts them as skipped.
+
+        Batches of COPY_THRESHOLD rows or more are loaded through a COPY
+        staging table instead (see _copy_upsert_rows), COPY_CHUNK_SIZE rows
+        at a time.
 
         Args:
-            char_data: Character data dictionary
+            table: Target table
+            key_column: Unique column identifying a row (e.g. "name")
+            rows: Column values for each row
+            merge_json: JSONB columns to merge rather than replace
+
+        Rows identical to what this process last committed for the same key
+        are dropped before the upsert (see _drop_cached_rows).
 
         Returns:
-            Character model instance
+            One row per inserted or changed record with ``key``, ``inserted``
+            (True for newly created rows, via the xmax = 0 system column
+            trick) and the new ``updated_at``
         """
-        # Prepare base_stats in the format expected by the model
-        scraped_stats = char_data.get("base_stats", {})
-        base_stats = {
-            "hp": scraped_stats.get("hp"),
-            "atk": scraped_stats.get("atk"),  # Fixed: scraper uses 'atk' not 'attack'
-            "def": scraped_stats.get("def"),  # Fixed: scraper uses 'def' not 'defense'
-        }
+        defaulted = [
+            column.name for column in table.c
+            if not column.nullable and column.default is not None and column.name != key_column
+        ]
+        if defaulted:
+            rows = [
+                {column: value for column, value in row.items() if value is not None or column not in defaulted}
+                for row in rows
+            ]
+
+        rows = await self._drop_cached_rows(table, key_column, rows)
+        if not rows:
+            return []
+
+        await self._relax_commit()
+
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+
+        upserted = []
+        for columns, group in groups.items():
+            if len(group) < COPY_THRESHOLD:
+                stmt = self._build_upsert(pg_insert(table), table, key_column, list(columns), merge_json)
+                result = await self.db.execute(stmt, group)
+                upserted.extend(result.all())
+            else:
+                for start in range(0, len(group), COPY_CHUNK_SIZE):
+                    chunk = group[start:start + COPY_CHUNK_SIZE]
+                    upserted.extend(await self._copy_upsert_rows(table, key_column, chunk, merge_json))
+
+        # Only rows the database actually wrote come back with an updated_at
+        # to validate against later; no-op rows are simply sent again next time
+        by_key = {row[key_column]: row for row in rows}
+        for written in upserted:
+            self._pending_writes[(table.name, written.key)] = (by_key[written.key], written.updated_at)
+        return upserted
+
+    async def _drop_cached_rows(
+        self, table: Table, key_column: str, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter out rows equal to the last committed values for their key.
+
+        Incremental re-scrapes mostly produce rows this worker has already
+        written; those would be no-ops in the database (and counted as
+        skipped either way), so they are not upserted at all. Hits are moved
+        to the most-recently-used end of the shared LRU.
+
+        A cached row only counts while the stored updated_at still equals the
+        one it was written with, checked with a single key lookup. Rows that
+        were edited or deleted since (by the API, another worker, ...) are
+        dropped from the cache and upserted again.
+        """
+        candidates = {}
+        fresh = []
+        for row in rows:
+            cached = _write_cache.get((table.name, row[key_column]))
+            if cached is not None and cached[0] == row:
+                candidates[row[key_column]] = (row, cached[1])
+            else:
+                fresh.append(row)
 
-        # Prepare ascension_stats from scraped data
-        ascension_stats = char_data.get("ascension_stats", {})
-        if not ascension_stats:
-            ascension_stats = None
-
-        character = Character(
-            name=char_data["name"],
-            name_en=char_data.get("name_en"),  # Added: include English name
-            rarity=char_data.get("rarity"),
-            element=char_data.get("element"),
-            weapon_type=char_data.get("weapon_type"),
-            region=char_data.get("region"),
-            description=char_data.get("description"),
-            base_stats=base_stats,
-            ascension_stats=ascension_stats if ascension_stats else None,
+        if not candidates:
+            return fresh
+
+        key = table.c[key_column]
+        result = await self.db.execute(
+            select(key, table.c.updated_at).where(key.in_(list(candidates)))
         )
+        stored = dict(result.all())
 
-        return character
+        for value, (row, updated_at) in candidates.items():
+            cache_key = (table.name, value)
+            if stored.get(value) == updated_at:
+                _write_cache.move_to_end(cache_key)
+            else:
+                _write_cache.pop(cache_key, None)
+                fresh.append(row)
+        return fresh
 
-    def _update_character(self, existing: Character, new_data: Dict[str, Any]):
+    async def _relax_commit(self) -> None:
         """
-        Update existing character with new data.
+        Turn off synchronous_commit for the current ingest transaction.
 
-        Args:
-            existing: Existing character model
-            new_data: New character data from scraper
+        Scraped data is re-derivable, so losing the last batch to a crash
+        only means re-running the scrape, while each commit no longer waits
+        for the WAL flush. SET LOCAL reverts on commit or rollback.
         """
-        # Update basic fields
-        if new_data.get("name_en"):
-            existing.name_en = new_data["name_en"]
-        if new_data.get("rarity"):
-            existing.rarity = new_data["rarity"]
-        if new_data.get("element"):
-            existing.element = new_data["element"]
-        if new_data.get("weapon_type"):
-            existing.weapon_type = new_data["weapon_type"]
-        if new_data.get("region"):
-            existing.region = new_data["region"]
-        if new_data.get("description"):
-            existing.description = new_data["description"]
-
-        # Update stats
-        scraped_stats = new_data.get("base_stats", {})
-        if scraped_stats:
-            existing.base_stats = {
-                "hp": scraped_stats.get("hp"),
-                "atk": scraped_stats.get("atk"),  # Fixed: scraper uses 'atk' not 'attack'
-                "def": scraped_stats.get("def"),  # Fixed: scraper uses 'def' not 'defense'
-            }
+        if not self._relaxed_commit:
+            await self.db.execute(text("SET LOCAL synchronous_commit = OFF"))
+            self._relaxed_commit = True
+
+    async def _commit(self) -> None:
+        """Commit the session, then remember the rows it wrote."""
+        self._relaxed_commit = False
+        try:
+            await self.db.commit()
+        except BaseException:
+            self._pending_writes.clear()
+            raise
+
+        for cache_key, entry in self._pending_writes.items():
+            _write_cache[cache_key] = entry
+            _write_cache.move_to_end(cache_key)
+        self._pending_writes.clear()
+
+        while len(_write_cache) > WRITE_CACHE_SIZE:
+            _write_cache.popitem(last=False)
+
+    @asynccontextmanager
+    async def _rollback_on_error(self) -> AsyncIterator[None]:
+        """
+        Roll back the open transaction if a store fails part-way.
+
+        Rows upserted in the failed transaction are never remembered, and the
+        next transaction sets synchronous_commit again.
+        """
+        try:
+            yield
+        except BaseException:
+            self._pending_writes.clear()
+            self._relaxed_commit = False
+            await self.db.rollback()
+            raise
+
+    @staticmethod
+    def clear_write_cache() -> None:
+        """
+        Forget all remembered rows so the next store rewrites everything.
+
+        Services call this after editing or deleting scraped rows; the
+        updated_at check in _drop_cached_rows covers writes it cannot see.
+        """
+        _write_cache.clear()
+
+    def _build_upsert(
+        self,
+        stmt: Insert,
+        table: Table,
+        key_column: str,
+        columns: List[str],
+        merge_json: Tuple[str, ...],
+    ) -> Insert:
+        """Attach the ON CONFLICT DO UPDATE ... WHERE ... RETURNING clauses to an INSERT."""
+        excluded = stmt.excluded
+
+        set_ = {}
+        for column in columns:
+            if column == key_column:
+                continue
+            if column in merge_json:
+                set_[column] = table.c[column].op("||")(func.jsonb_strip_nulls(excluded[column]))
+            else:
+                set_[column] = func.coalesce(excluded[column], table.c[column])
+
+        # Let Postgres skip the write when nothing would change. JSONB columns
+        # (tags, pieces, base_stats, ...) are compared whole by jsonb equality,
+        # so edits inside nested pieces are detected too
+        changed = or_(*(table.c[column].is_distinct_from(value) for column, value in set_.items()))
+
+        # Python-side onupdate does not fire for ON CONFLICT updates
+        set_["updated_at"] = func.now()
+
+        return stmt.on_conflict_do_update(
+            index_elements=[table.c[key_column]],
+            set_=set_,
+            where=changed,
+        ).returning(
+            table.c[key_column].label("key"),
+            literal_column("xmax = 0").label("inserted"),
+            table.c.updated_at,
+        )
+
+    async def _copy_upsert_rows(
+        self,
+        table: Table,
+        key_column: str,
+        rows: List[Dict[str, Any]],
+        merge_json: Tuple[str, ...],
+    ) -> List[Row]:
+        """
+        Upsert a large chunk of rows through a COPY-loaded staging table.
 
-        # Update ascension stats
-        ascension_stats = new_data.get("ascension_stats", {})
-        if ascension_stats:
-            existing.ascension_stats = ascension_stats
+        The rows are streamed into a temp table with asyncpg's binary COPY
+        and merged with a single INSERT ... SELECT ... ON CONFLICT, avoiding
+        bind-parameter limits and per-row statement overhead. The staging
+        table is dropped on commit.
+        """
+        columns = list(rows[0])
+        stage_name = f"stage_{table.name}"
+        column_list = ", ".join(columns)
+
+        # CREATE ... AS ... WITH NO DATA copies column types without constraints.
+        # Recreate it per chunk since row groups may carry different columns
+        await self.db.execute(text(f"DROP TABLE IF EXISTS {stage_name}"))
+        await self.db.execute(text(
+            f"CREATE TEMP TABLE {stage_name} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table.name} WITH NO DATA"
+        ))
+
+        # The asyncpg JSONB codec installed by SQLAlchemy expects JSON text
+        json_columns = {column for column in columns if isinstance(table.c[column].type, JSON)}
+        records = [
+            tuple(
+                json_serializer(row[column])
+                if column in json_columns and row[column] is not None
+                else row[column]
+                for column in columns
+            )
+            for row in rows
+        ]
+
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            stage_name, records=records, columns=columns
+        )
 
-        existing.updated_at = datetime.utcnow()
+        stage = sql_table(stage_name, *(sql_column(column) for column in columns))
+        stmt = pg_insert(table).from_select(columns, select(*(stage.c[column] for column in columns)))
+        stmt = self._build_upsert(stmt, table, key_column, columns, merge_json)
+
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    def _count_upserted(self, kind: str, upserted: List[Row], total: int) -> None:
+        """Update created/updated/skipped statistics from _upsert_rows results."""
+        self._stats["skipped"] += total - len(upserted)
+        for row in upserted:
+            if row.inserted:
+                self._stats["created"] += 1
+                logger.info(f"Created new {kind}: {row.key}")
+            else:
+                self._stats["updated"] += 1
+                logger.info(f"Updated {kind}: {row.key}")
 
     def get_stats(self) -> Dict[str, int]:
         """Get storage statistics."""
@@ -257,17 +602,9 @@ class DataStorageService:
         logger.info(f"Storing {len(weapons)} weapons...")
         self.reset_stats()
 
-        for weapon_data in weapons:
-            try:
-                await self._store_single_weapon(weapon_data)
-            except Exception as e:
-                self._stats["errors"] += 1
-                logger.error(
-                    f"Error storing weapon {weapon_data.get('name')}: {e}",
-                    exc_info=True
-                )
-
-        await self.db.commit()
+        async with self._rollback_on_error():
+            await self._store_weapon_batch(weapons)
+            await self._commit()
 
         logger.info(
             f"Weapon storage complete. "
@@ -279,83 +616,31 @@ class DataStorageService:
 
         return self._stats.copy()
 
-    async def _store_single_weapon(self, weapon_data: Dict[str, Any]):
-        """Store or update a single weapon."""
-        name = weapon_data.get("name")
-        if not name:
-            logger.warning("Weapon data missing name, skipping")
-            self._stats["skipped"] += 1
-            return
-
-        stmt = select(Weapon).where(Weapon.name == name)
-        result = await self.db.execute(stmt)
-        existing_weapon = result.scalar_one_or_none()
+    async def _store_weapon_batch(self, weapons: List[Dict[str, Any]]):
+        """Store a batch of weapons with a single upsert, without committing."""
+        # Keyed by name so duplicate rows within a batch collapse to the last one
+        rows: Dict[str, Dict[str, Any]] = {}
 
-        if existing_weapon:
-            if self._weapon_has_changes(existing_weapon, weapon_data):
-                self._update_weapon(existing_weapon, weapon_data)
-                self._stats["updated"] += 1
-                logger.info(f"Updated weapon: {name}")
-            else:
+        for weapon_data in weapons:
+            name = weapon_data.get("name")
+            if not name:
+                logger.warning("Weapon data missing name, skipping")
                 self._stats["skipped"] += 1
-                logger.debug(f"No changes for weapon: {name}")
-        else:
-            new_weapon = self._create_weapon(weapon_data)
-            self.db.add(new_weapon)
-            self._stats["created"] += 1
-            logger.info(f"Created new weapon: {name}")
-
-    def _weapon_has_changes(self, existing: Weapon, new_data: Dict[str, Any]) -> bool:
-        """Check if weapon data has changes."""
-        fields_to_compare = ["rarity", "weapon_type", "base_attack", "description"]
-        for field in fields_to_compare:
-            new_value = new_data.get(field)
-            existing_value = getattr(existing, field, None)
-            if new_value is not None and new_value != existing_value:
-                return True
-        return False
-
-    def _create_weapon(self, weapon_data: Dict[str, Any]) -> Weapon:
-        """Create a new Weapon model instance."""
-        weapon = Weapon(
-            name=weapon_data["name"],
-            name_en=weapon_data.get("name_en"),
-            weapon_type=weapon_data.get("weapon_type"),
-            rarity=weapon_data.get("rarity"),
-            base_attack=weapon_data.get("base_attack"),
-            secondary_stat=weapon_data.get("secondary_stat"),
-            secondary_stat_value=weapon_data.get("secondary_stat_value"),
-            description=weapon_data.get("description"),
-            passive_name=weapon_data.get("passive_name"),
-            passive_description=weapon_data.get("passive_description"),
-            source=weapon_data.get("source"),
-        )
-        return weapon
-
-    def _update_weapon(self, existing: Weapon, new_data: Dict[str, Any]):
-        """Update existing weapon with new data."""
-        if new_data.get("name_en"):
-            existing.name_en = new_data["name_en"]
-        if new_data.get("weapon_type"):
-            existing.weapon_type = new_data["weapon_type"]
-        if new_data.get("rarity"):
-            existing.rarity = new_data["rarity"]
-        if new_data.get("base_attack"):
-            existing.base_attack = new_data["base_attack"]
-        if new_data.get("secondary_stat"):
-            existing.secondary_stat = new_data["secondary_stat"]
-        if new_data.get("secondary_stat_value"):
-            existing.secondary_stat_value = new_data["secondary_stat_value"]
-        if new_data.get("description"):
-            existing.description = new_data["description"]
-        if new_data.get("passive_name"):
-            existing.passive_name = new_data["passive_name"]
-        if new_data.get("passive_description"):
-            existing.passive_description = new_data["passive_description"]
-        if new_data.get("source"):
-            existing.source = new_data["source"]
-
-        existing.updated_at = datetime.utcnow()
+                continue
+
+            try:
+                rows[name] = self._weapon_to_row(weapon_data)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Error storing weapon {name}: {e}", exc_info=True)
+
+        if rows:
+            upserted = await self._upsert_rows(Weapon.__table__, "name", list(rows.values()))
+            self._count_upserted("weapon", upserted, len(rows))
+
+    def _weapon_to_row(self, weapon_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the upsert parameter dict for a weapon."""
+        return _check_required(_build_row(weapon_data, _WEAPON_FIELDS), Weapon.__table__)
 
     # ===== Artifact Set Storage Methods (New) =====
 
@@ -375,17 +660,9 @@ class DataStorageService:
         logger.info(f"Storing {len(artifacts)} artifact sets...")
         self.reset_stats()
 
-        for artifact_data in artifacts:
-            try:
-                await self._store_single_artifact_set(artifact_data)
-            except Exception as e:
-                self._stats["errors"] += 1
-                logger.error(
-                    f"Error storing artifact {artifact_data.get('name')}: {e}",
-                    exc_info=True
-                )
-
-        await self.db.commit()
+        async with self._rollback_on_error():
+            await self._store_artifact_set_batch(artifacts)
+            await self._commit()
 
         logger.info(
             f"Artifact storage complete. "
@@ -397,110 +674,28 @@ class DataStorageService:
 
         return self._stats.copy()
 
-    async def _store_single_artifact_set(self, artifact_data: Dict[str, Any]):
-        """Store or update a single artifact set with its pieces."""
-        set_name = artifact_data.get("name")
-        if not set_name:
-            logger.warning("Artifact data missing name, skipping")
-            self._stats["skipped"] += 1
-            return
-
-        # Check if artifact set already exists
-        stmt = select(ArtifactSet).where(ArtifactSet.set_name == set_name)
-        result = await self.db.execute(stmt)
-        existing_set = result.scalar_one_or_none()
+    async def _store_artifact_set_batch(self, artifacts: List[Dict[str, Any]]):
+        """Store a batch of artifact sets with a single upsert, without committing."""
+        # Keyed by name so duplicate rows within a batch collapse to the last one
+        rows: Dict[str, Dict[str, Any]] = {}
 
-        if existing_set:
-            # Update existing set
-            if self._artifact_set_has_changes(existing_set, artifact_data):
-                self._update_artifact_set(existing_set, artifact_data)
-                self._stats["updated"] += 1
-                logger.info(f"Updated artifact set: {set_name}")
-            else:
+        for artifact_data in artifacts:
+            set_name = artifact_data.get("name")
+            if not set_name:
+                logger.warning("Artifact data missing name, skipping")
                 self._stats["skipped"] += 1
-                logger.debug(f"No changes for artifact set: {set_name}")
-        else:
-            # Create new set
-            new_set = self._create_artifact_set(artifact_data)
-            self.db.add(new_set)
-
-            pieces_count = len(artifact_data.get("pieces", []))
-            self._stats["created"] += 1
-            logger.info(f"Created new artifact set: {set_name} with {pieces_count} pieces")
-
-    def _artifact_set_has_changes(self, existing: ArtifactSet, new_data: Dict[str, Any]) -> bool:
-        """Check if artifact set data has changes."""
-        # Check rarity
-        if new_data.get("max_rarity") and new_data["max_rarity"] != existing.max_rarity:
-            return True
-
-        # Check tags
-        new_tags = new_data.get("tags", [])
-        existing_tags = existing.tags or []
-        if set(new_tags) != set(existing_tags):
-            return True
-
-        # Check description
-        if new_data.get("description") and new_data["description"] != existing.description:
-            return True
-
-        # Check set effects
-        if new_data.get("two_piece_bonus") and new_data["two_piece_bonus"] != existing.two_piece_bonus:
-            return True
-        if new_data.get("four_piece_bonus") and new_data["four_piece_bonus"] != existing.four_piece_bonus:
-            return True
-
-        # Check if pieces data has changed
-        new_pieces = new_data.get("pieces", [])
-        if len(new_pieces) != len(existing.pieces):
-            return True
-
-        return False
-
-    def _create_artifact_set(self, artifact_data: Dict[str, Any]) -> ArtifactSet:
-        """Create a new ArtifactSet model instance."""
-        artifact_set = ArtifactSet(
-            set_name=artifact_data["name"],
-            set_name_en=artifact_data.get("name_en"),
-            tags=artifact_data.get("tags", []),
-            max_rarity=artifact_data.get("max_rarity", 5),
-            two_piece_bonus=artifact_data.get("two_piece_bonus"),
-            four_piece_bonus=artifact_data.get("four_piece_bonus"),
-            description=artifact_data.get("description"),
-            source=artifact_data.get("source"),
-            domain_name=artifact_data.get("domain_name"),
-            pieces=artifact_data.get("pieces", []),  # 直接存储为JSONB
-        )
-        return artifact_set
-
-    def _update_artifact_set(self, existing: ArtifactSet, new_data: Dict[str, Any]):
-        """Update existing artifact set with new data."""
-        if new_data.get("name_en"):
-            existing.set_name_en = new_data["name_en"]
-
-        if new_data.get("tags"):
-            existing.tags = new_data["tags"]
+                continue
 
-        if new_data.get("max_rarity"):
-            existing.max_rarity = new_data["max_rarity"]
-
-        if new_data.get("two_piece_bonus"):
-            existing.two_piece_bonus = new_data["two_piece_bonus"]
-
-        if new_data.get("four_piece_bonus"):
-            existing.four_piece_bonus = new_data["four_piece_bonus"]
-
-        if new_data.get("description"):
-            existing.description = new_data["description"]
-
-        if new_data.get("source"):
-            existing.source = new_data["source"]
-
-        if new_data.get("domain_name"):
-            existing.domain_name = new_data["domain_name"]
+            try:
+                rows[set_name] = self._artifact_set_to_row(artifact_data)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Error storing artifact {set_name}: {e}", exc_info=True)
 
-        # Update pieces (直接更新JSONB字段)
-        if new_data.get("pieces"):
-            existing.pieces = new_data["pieces"]
+        if rows:
+            upserted = await self._upsert_rows(ArtifactSet.__table__, "set_name", list(rows.values()))
+            self._count_upserted("artifact set", upserted, len(rows))
 
-        existing.updated_at = datetime.utcnow()
+    def _artifact_set_to_row(self, artifact_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the upsert parameter dict for an artifact set."""
+        return _check_required(_build_row(artifact_data, _ARTIFACT_SET_FIELDS), ArtifactSet.__table__)
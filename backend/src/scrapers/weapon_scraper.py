@@ -5,17 +5,86 @@
 URL模式: https://wiki.biligame.com/ys/{武器中文名}
 """
 
+import asyncio
 import logging
+import os
 import re
-from typing import Any, Dict, List, Optional
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
-from bs4 import BeautifulSoup, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from .base_scraper import BaseScraper, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
+# 预编译正则（避免每个武器重复查找re缓存）
+_SECONDARY_STAT_RE = re.compile(r"([^\d]+)")
+_ATK_RE = re.compile(r"(\d+)")
+_STAT_VALUE_RE = re.compile(r"([\d.]+)%?")
+
+# 副属性中文名到英文名的映射（子串匹配时按此顺序）
+_STAT_MAP: Dict[str, str] = {
+    "攻击力": "ATK%",
+    "暴击率": "CRIT Rate",
+    "暴击伤害": "CRIT DMG",
+    "元素充能效率": "Energy Recharge",
+    "元素精通": "Elemental Mastery",
+    "物理伤害": "Physical DMG Bonus",
+    "生命值": "HP%",
+    "防御力": "DEF%",
+}
+_STAT_MAP_ITEMS = tuple(_STAT_MAP.items())
+
+# 无法导入武器列表配置时使用的5星武器列表
+_FALLBACK_WEAPONS = (
+    # 单手剑
+    "苍古自由之誓", "雾切之回光", "波乱月白经津", "圣显之钥", "裁叶萃光",
+    "静水流涌之辉", "有乐御簾切", "赦罪", "苍耀",
+    "风鹰剑", "天空之刃", "斫峰之刃", "磐岩结绿",
+
+    # 双手剑
+    "无工之剑", "松籁响起之时", "苇海信标", "裁断", "焚曜千阳",
+    "狼的末路", "天空之傲", "赤角石溃杵",
+
+    # 长柄武器
+    "护摩之杖", "薙草之稻光", "贯虹之槊", "息灾", "赤沙之杖",
+    "支离轮光", "香韵奏者", "血染荒城",
+    "和璞鸢", "天空之脊",
+
+    # 弓
+    "终末嗟叹之诗", "飞雷之弦振", "若水", "猎人之径", "最初的大魔术", "白雨心弦",
+    "天空之翼", "阿莫斯之弓", "冬极白星",
+
+    # 法器
+    "神乐之真意", "千夜浮梦", "图莱杜拉的回忆", "万世流涌大典", "鹤鸣余音",
+    "金流监督", "祭星者之望", "纺夜天镜", "溢彩心念", "寝正月初晴", "真语秘匣",
+    "天空之卷", "四风原典",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_default_weapon_list() -> Tuple[str, ...]:
+    """
+    导入 config/weapons_list.py 中的完整武器列表
+
+    只在进程内执行一次（修改sys.path并导入模块），之后直接返回缓存结果
+    """
+    try:
+        # 添加config目录到路径
+        config_path = Path(__file__).parent.parent.parent / "config"
+        sys.path.insert(0, str(config_path))
+
+        from weapons_list import get_all_weapons
+        return tuple(get_all_weapons())
+    except ImportError:
+        logger.warning("无法导入武器列表配置，使用默认列表")
+        # 降级到5星武器列表
+        return _FALLBACK_WEAPONS
+
 
 class WeaponScraper(BaseScraper):
     """
@@ -39,6 +108,10 @@ class WeaponScraper(BaseScraper):
         "弓箭": "Bow",
         "法器": "Catalyst",
     }
+    # 所有武器类型关键词的交替正则，一次扫描卡片文本（长词优先，如"弓箭"先于"弓"）
+    _WEAPON_TYPE_RE = re.compile(
+        "|".join(map(re.escape, sorted(WEAPON_MAP, key=len, reverse=True)))
+    )
 
     def __init__(self, config: Optional[ScraperConfig] = None):
         """初始化武器爬虫"""
@@ -67,68 +140,44 @@ class WeaponScraper(BaseScraper):
 
         logger.info(f"Starting weapon scraping for {len(weapon_names)} weapons...")
 
+        # 并发抓取（信号量限制同时进行的页面数，速率限制仍由fetch控制）
+        semaphore = asyncio.Semaphore(self.config.max_concurrency or 8)
+
+        async def _scrape_one(weapon_name: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_weapon(weapon_name)
+
+        results = await asyncio.gather(
+            *(_scrape_one(weapon_name) for weapon_name in weapon_names),
+            return_exceptions=True,
+        )
+
         weapons = []
-        for weapon_name in weapon_names:
-            try:
-                weapon_data = await self.scrape_weapon(weapon_name)
-                if weapon_data:
-                    weapons.append(weapon_data)
-                    logger.info(f"✅ Scraped: {weapon_name}")
-                else:
-                    logger.warning(f"⚠️  No data for: {weapon_name}")
-            except Exception as e:
-                logger.error(f"❌ Error scraping {weapon_name}: {e}", exc_info=True)
+        for weapon_name, result in zip(weapon_names, results):
+            # return_exceptions also returns CancelledError (a BaseException),
+            # which must propagate instead of being counted or stored as data
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.error(f"❌ Error scraping {weapon_name}: {result}", exc_info=result)
                 self._stats["errors"] += 1
+            elif result:
+                weapons.append(result)
+                logger.info(f"✅ Scraped: {weapon_name}")
+            else:
+                logger.warning(f"⚠️  No data for: {weapon_name}")
 
         logger.info(f"Successfully scraped {len(weapons)}/{len(weapon_names)} weapons")
         return weapons
 
     def _get_default_weapon_list(self) -> List[str]:
         """获取默认武器列表（截止到6.1版本的所有武器）"""
-        import os
-        import sys
-        from pathlib import Path
-
         # 优先使用环境变量
         env_weapons = os.getenv("SCRAPER_WEAPONS")
         if env_weapons:
             return [name.strip() for name in env_weapons.split(",")]
 
-        # 导入武器列表配置
-        try:
-            # 添加config目录到路径
-            config_path = Path(__file__).parent.parent.parent / "config"
-            sys.path.insert(0, str(config_path))
-
-            from weapons_list import get_all_weapons
-            return get_all_weapons()
-        except ImportError:
-            logger.warning("无法导入武器列表配置，使用默认列表")
-            # 降级到5星武器列表
-            return [
-                # 单手剑
-                "苍古自由之誓", "雾切之回光", "波乱月白经津", "圣显之钥", "裁叶萃光",
-                "静水流涌之辉", "有乐御簾切", "赦罪", "苍耀",
-                "风鹰剑", "天空之刃", "斫峰之刃", "磐岩结绿",
-
-                # 双手剑
-                "无工之剑", "松籁响起之时", "苇海信标", "裁断", "焚曜千阳",
-                "狼的末路", "天空之傲", "赤角石溃杵",
-
-                # 长柄武器
-                "护摩之杖", "薙草之稻光", "贯虹之槊", "息灾", "赤沙之杖",
-                "支离轮光", "香韵奏者", "血染荒城",
-                "和璞鸢", "天空之脊",
-
-                # 弓
-                "终末嗟叹之诗", "飞雷之弦振", "若水", "猎人之径", "最初的大魔术", "白雨心弦",
-                "天空之翼", "阿莫斯之弓", "冬极白星",
-
-                # 法器
-                "神乐之真意", "千夜浮梦", "图莱杜拉的回忆", "万世流涌大典", "鹤鸣余音",
-                "金流监督", "祭星者之望", "纺夜天镜", "溢彩心念", "寝正月初晴", "真语秘匣",
-                "天空之卷", "四风原典",
-            ]
+        return list(_load_default_weapon_list())
 
     async def scrape_weapon(self, weapon_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -145,24 +194,25 @@ class WeaponScraper(BaseScraper):
 
         logger.debug(f"Fetching weapon page: {url}")
 
-        html = await self.fetch(url)
+        html = await self.fetch_cached(url)
         if not html:
             logger.error(f"Failed to fetch page for {weapon_name}")
             return None
 
-        soup = self.parse_html(html)
-        if not soup:
-            logger.error(f"Failed to parse HTML for {weapon_name}")
+        try:
+            tree = LexborHTMLParser(html)
+        except Exception as e:
+            logger.error(f"Failed to parse HTML for {weapon_name}: {e}", exc_info=True)
             return None
 
         try:
-            weapon_data = self._extract_weapon_data(soup, weapon_name)
+            weapon_data = self._extract_weapon_data(tree, weapon_name)
             return weapon_data
         except Exception as e:
             logger.error(f"Failed to extract data for {weapon_name}: {e}", exc_info=True)
             return None
 
-    def _extract_weapon_data(self, soup: BeautifulSoup, weapon_name: str) -> Dict[str, Any]:
+    def _extract_weapon_data(self, tree: LexborHTMLParser, weapon_name: str) -> Dict[str, Any]:
         """从解析的HTML中提取武器数据"""
         data = {
             "name": weapon_name,
@@ -179,46 +229,43 @@ class WeaponScraper(BaseScraper):
         }
 
         # 查找YSCard容器来提取基础信息
-        ys_cards = soup.find_all("div", class_="YSCard")
+        ys_cards = tree.css("div.YSCard")
         if not ys_cards:
             logger.warning(f"No YSCard found for {weapon_name}")
             return data
 
+        # 先取正文描述；找到后基础信息中不再遍历卡片段落
+        self._extract_description(tree, data)
+
         # 从第一个YSCard提取基础信息
         self._extract_basic_info(ys_cards[0], data)
 
         # 查找武器数据表格 (YS-WeaponData)
-        weapon_data_card = soup.find("div", class_="YS-WeaponData")
+        weapon_data_card = tree.css_first("div.YS-WeaponData")
         if weapon_data_card:
-            data_table = weapon_data_card.find("table", class_="YS-DataTable")
+            data_table = weapon_data_card.css_first("table.YS-DataTable")
             if data_table:
                 self._extract_stats(data_table, data)
 
-        # 提取描述
-        self._extract_description(soup, data)
-
-        # 提取英文名
-        self._extract_english_name(data)
-
         return data
 
-    def _extract_basic_info(self, card: Tag, data: Dict[str, Any]) -> None:
+    def _extract_basic_info(self, card: LexborNode, data: Dict[str, Any]) -> None:
         """从YSCard容器中提取武器基础信息"""
         # 查找card-title1来提取稀有度（通过★数量）
-        card_title = card.find("div", class_="card-title1")
+        card_title = card.css_first("div.card-title1")
         if card_title:
-            title_text = card_title.get_text()
+            title_text = card_title.text()
             star_count = title_text.count("★")
             if star_count > 0:
                 data["rarity"] = star_count
 
         # 查找card-title2来提取副属性类型
-        card_title2 = card.find("div", class_="card-title2")
+        card_title2 = card.css_first("div.card-title2")
         if card_title2:
             # 在card-title2的p标签中找到副属性名称
-            p_tag = card_title2.find("p")
+            p_tag = card_title2.css_first("p")
             if p_tag:
-                stat_text = p_tag.get_text(strip=True)
+                stat_text = p_tag.text(strip=True)
                 # 文本格式: "攻击力 48-674 /// 物理伤害加成 9.0%-41.3%"
                 # 提取 "///" 后面的副属性名称部分
                 if "///" in stat_text:
@@ -227,43 +274,42 @@ class WeaponScraper(BaseScraper):
                         # 取第二部分并提取属性名（去掉数值）
                         secondary_part = parts[1].strip()
                         # 使用正则提取属性名（中文部分）
-                        match = re.match(r"([^\d]+)", secondary_part)
+                        match = _SECONDARY_STAT_RE.match(secondary_part)
                         if match:
                             stat_name = match.group(1).strip()
                             data["secondary_stat"] = self._normalize_stat_name(stat_name)
 
         # 查找内容区域的所有div和p标签来提取文本信息
-        content = card.get_text(strip=True)
+        content = card.text(strip=True)
 
-        # 提取武器类型 - 查找包含武器类型关键词的文本
-        for weapon_cn, weapon_en in self.WEAPON_MAP.items():
-            if weapon_cn in content:
-                data["weapon_type"] = weapon_en
-                break
+        # 提取武器类型 - 取文本中最先出现的武器类型关键词
+        match = self._WEAPON_TYPE_RE.search(content)
+        if match:
+            data["weapon_type"] = self.WEAPON_MAP[match.group(0)]
 
-        # 提取描述文本（通常在YSCard的段落中）
-        paragraphs = card.find_all("p")
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if text and len(text) >= 20 and "突破" not in text and "材料" not in text:
-                if not data.get("description"):
+        # 正文中没有描述时，退而从YSCard的段落中提取
+        if not data.get("description"):
+            for p in card.css("p"):
+                text = p.text(strip=True)
+                if text and len(text) >= 20 and "突破" not in text and "材料" not in text:
                     data["description"] = text[:200]
+                    break
 
-    def _extract_stats(self, table: Tag, data: Dict[str, Any]) -> None:
+    def _extract_stats(self, table: LexborNode, data: Dict[str, Any]) -> None:
         """从YS-DataTable中提取武器属性数据"""
-        rows = table.find_all("tr")
+        rows = table.css("tr")
         if len(rows) < 2:
             return
 
         # 第一行是表头
-        headers = [th.get_text(strip=True) for th in rows[0].find_all(["th", "td"])]
+        headers = [th.text(strip=True) for th in rows[0].css("th, td")]
 
         # 找到90级的数据行
         target_row = None
         for row in rows:
-            cells = row.find_all("td")
+            cells = row.css("td")
             if cells and len(cells) >= 3:
-                level_text = cells[0].get_text(strip=True)
+                level_text = cells[0].text(strip=True)
                 if "90" in level_text:
                     target_row = row
                     break
@@ -271,7 +317,7 @@ class WeaponScraper(BaseScraper):
         if not target_row:
             return
 
-        cells = target_row.find_all("td")
+        cells = target_row.css("td")
         if len(cells) < 3:
             return
 
@@ -279,9 +325,9 @@ class WeaponScraper(BaseScraper):
         # 90级行: <td><b>90级</b></td><td>674</td><td>-</td><td>41.3%</td>
         try:
             # 提取基础攻击力（第2列，即cells[1]）
-            atk_text = cells[1].get_text(strip=True)
+            atk_text = cells[1].text(strip=True)
             if atk_text and atk_text != "-":
-                match = re.search(r"(\d+)", atk_text)
+                match = _ATK_RE.search(atk_text)
                 if match:
                     data["base_attack"] = int(match.group(1))
         except Exception as e:
@@ -290,9 +336,9 @@ class WeaponScraper(BaseScraper):
         # 提取副属性（最后一列）
         try:
             stat_cell = cells[-1]
-            stat_text = stat_cell.get_text(strip=True)
+            stat_text = stat_cell.text(strip=True)
             # 解析数值
-            match = re.search(r"([\d.]+)%?", stat_text)
+            match = _STAT_VALUE_RE.search(stat_text)
             if match:
                 data["secondary_stat_value"] = match.group(1)
 
@@ -305,47 +351,31 @@ class WeaponScraper(BaseScraper):
 
     def _normalize_stat_name(self, stat_header: str) -> str:
         """Normalize Chinese stat names to English."""
-        stat_map = {
-            "攻击力": "ATK%",
-            "暴击率": "CRIT Rate",
-            "暴击伤害": "CRIT DMG",
-            "元素充能效率": "Energy Recharge",
-            "元素精通": "Elemental Mastery",
-            "物理伤害": "Physical DMG Bonus",
-            "生命值": "HP%",
-            "防御力": "DEF%",
-        }
+        # 精确匹配优先，表头带有额外文字时再按顺序做子串匹配
+        hit = _STAT_MAP.get(stat_header.strip())
+        if hit:
+            return hit
 
-        for cn_name, en_name in stat_map.items():
+        for cn_name, en_name in _STAT_MAP_ITEMS:
             if cn_name in stat_header:
                 return en_name
 
         return stat_header
 
-    def _extract_description(self, soup: BeautifulSoup, data: Dict[str, Any]) -> None:
+    def _extract_description(self, tree: LexborHTMLParser, data: Dict[str, Any]) -> None:
         """Extract weapon description."""
-        content_div = soup.find("div", class_="mw-parser-output")
+        content_div = tree.css_first("div.mw-parser-output")
         if not content_div:
             return
 
-        paragraphs = content_div.find_all("p", recursive=False)
+        # 只取直接子级 p 标签（等价于 recursive=False）
+        paragraphs = (child for child in content_div.iter() if child.tag == "p")
         for p in paragraphs:
-            text = p.get_text(strip=True)
+            text = p.text(strip=True)
             if text and len(text) >= 20:
                 data["description"] = text[:200]
                 break
 
-    def _extract_english_name(self, data: Dict[str, Any]) -> None:
-        """Extract English name from full_name field."""
-        full_name = data.get("full_name", "")
-        if not full_name:
-            return
-
-        match = re.search(r"\(([A-Za-z\s]+)\)|（([A-Za-z\s]+)）", full_name)
-        if match:
-            name_en = match.group(1) or match.group(2)
-            data["name_en"] = name_en.strip()
-
     def get_stats(self) -> Dict[str, Any]:
         """Get scraping statistics."""
         return self._stats.copy()
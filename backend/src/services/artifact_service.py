@@ -3,13 +3,18 @@
 
 提供圣遗物数据的增删改查、搜索、统计等业务逻辑
 """
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, update, delete, func, or_, and_, desc, asc, exists, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import load_only
 
+from src.cache.cache_manager import cache_manager, CacheKeys
+from src.db.session import use_primary
 from src.models.artifact import Artifact
 from src.schemas.artifact import (
     ArtifactCreate, ArtifactUpdate, ArtifactQueryParams,
@@ -19,6 +24,10 @@ from src.utils.logging import LoggerMixin, log_database_operation
 from src.utils.exceptions import NotFoundError, ValidationException, DatabaseException
 from src.utils.validators import validate_page_params
 
+# 统计结果缓存键与过期时间（数据只在同步任务或管理操作时变化）
+ARTIFACT_STATS_CACHE_KEY = f"genshin:{CacheKeys.ARTIFACT_STATS}:v1"
+ARTIFACT_STATS_CACHE_TTL = 1800
+
 
 class ArtifactService(LoggerMixin):
     """
@@ -27,6 +36,20 @@ class ArtifactService(LoggerMixin):
     提供圣遗物相关的所有业务逻辑操作
     """
 
+    # 排序字段 → 列映射（未知字段按ID排序）
+    _SORT_COLUMNS = {
+        "name": Artifact.name,
+        "set_name": Artifact.set_name,
+        "rarity": Artifact.rarity,
+        "slot": Artifact.slot,
+        "main_stat_type": Artifact.main_stat_type,
+        "created_at": Artifact.created_at,
+    }
+    # 排序方向映射（非 asc 一律降序）
+    _SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+    # 卡片视图只加载 SUMMARY_COLUMNS，可由带 INCLUDE 的复合索引直接返回
+    _SUMMARY_LOAD = load_only(*(getattr(Artifact, column) for column in Artifact.SUMMARY_COLUMNS))
+
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
 
@@ -45,28 +68,29 @@ class ArtifactService(LoggerMixin):
         Returns:
             (圣遗物列表, 总数)
         """
+        # 查询参数只序列化一次，成功和失败日志共用
+        params_data = params.model_dump(exclude_unset=True) if hasattr(params, 'model_dump') else params.__dict__
+
         try:
             # 验证分页参数
             page, per_page = validate_page_params(params.page, params.per_page)
 
-            # 构建查询
-            query = select(Artifact)
-
-            # 应用过滤条件
+            # 构建过滤条件
+            filters = []
             if params.set_name:
-                query = query.where(Artifact.set_name == params.set_name)
+                filters.append(Artifact.set_name == params.set_name)
             if params.slot:
-                query = query.where(Artifact.slot == params.slot)
+                filters.append(Artifact.slot == params.slot)
             if params.rarity:
-                query = query.where(Artifact.rarity == params.rarity)
+                filters.append(Artifact.rarity == params.rarity)
             if params.source:
-                query = query.where(Artifact.source == params.source)
+                filters.append(Artifact.source == params.source)
             if params.main_stat_type:
-                query = query.where(Artifact.main_stat_type == params.main_stat_type)
+                filters.append(Artifact.main_stat_type == params.main_stat_type)
             if params.search:
                 # 使用PostgreSQL全文搜索
                 search_term = f"%{params.search}%"
-                query = query.where(
+                filters.append(
                     or_(
                         Artifact.name.ilike(search_term),
                         Artifact.name_en.ilike(search_term),
@@ -76,53 +100,101 @@ class ArtifactService(LoggerMixin):
                     )
                 )
 
-            # 应用排序
-            if params.sort_by == "name":
-                order_col = Artifact.name
-            elif params.sort_by == "set_name":
-                order_col = Artifact.set_name
-            elif params.sort_by == "rarity":
-                order_col = Artifact.rarity
-            elif params.sort_by == "slot":
-                order_col = Artifact.slot
-            elif params.sort_by == "main_stat_type":
-                order_col = Artifact.main_stat_type
-            elif params.sort_by == "created_at":
-                order_col = Artifact.created_at
-            else:
-                order_col = Artifact.id
-
-            if params.sort_order == "asc":
-                query = query.order_by(asc(order_col))
+            # 应用排序（以ID作为次级排序，保证翻页顺序稳定）
+            order_col = self._SORT_COLUMNS.get(params.sort_by, Artifact.id)
+            direction = self._SORT_DIRECTIONS.get(params.sort_order, desc)
+            order_by = [direction(order_col)] if order_col is Artifact.id else [direction(order_col), direction(Artifact.id)]
+
+            if params.cursor_id is not None:
+                # 游标（keyset）分页：从上一页最后一行之后继续读取，
+                # 成本只与 per_page 有关，不随页码加深而增长
+                if order_col is Artifact.id:
+                    after = Artifact.id > params.cursor_id
+                    if direction is desc:
+                        after = Artifact.id < params.cursor_id
+                else:
+                    cursor_key = tuple_(order_col, Artifact.id)
+                    cursor_value = (self._decode_cursor_value(order_col, params.cursor_value), params.cursor_id)
+                    after = cursor_key > cursor_value if direction is asc else cursor_key < cursor_value
+
+                query = select(Artifact).where(*filters, after).order_by(*order_by).limit(per_page)
+                artifacts = (await self.db.execute(query)).scalars().all()
+
+                # 游标条件会改变窗口计数，总数按过滤条件单独统计（不排序、不投影列）
+                count_query = select(func.count(Artifact.id)).where(*filters)
+                total = (await self.db.execute(count_query)).scalar()
             else:
-                query = query.order_by(desc(order_col))
-
-            # 获取总数
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
-
-            # 应用分页
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
-
-            # 执行查询
-            result = await self.db.execute(query)
-            artifacts = result.scalars().all()
+                # 偏移分页（窗口函数在同一条语句中返回过滤后的总数）
+                query = select(Artifact, func.count().over().label("total")).where(*filters)
+                offset = (page - 1) * per_page
+                paged_query = query.order_by(*order_by).offset(offset).limit(per_page)
+
+                # 执行查询
+                result = await self.db.execute(paged_query)
+                rows = result.all()
+                artifacts = [row.Artifact for row in rows]
+
+                if rows:
+                    total = rows[0].total
+                elif offset > 0:
+                    # 页码超出范围时没有行可读取总数，单独统计
+                    count_query = select(func.count(Artifact.id)).where(*filters)
+                    total = (await self.db.execute(count_query)).scalar()
+                else:
+                    total = 0
 
             log_database_operation(
                 "select", "artifacts",
-                filters=params.model_dump(exclude_unset=True) if hasattr(params, 'model_dump') else params.__dict__,
+                filters=params_data,
                 total=total
             )
 
-            return list(artifacts), total
+            return artifacts, total
 
+        except ValidationException:
+            raise
         except Exception as e:
-            params_data = params.model_dump() if hasattr(params, 'model_dump') else params.__dict__
             self.log_error("获取圣遗物列表失败", error=e, params=params_data)
             raise DatabaseException("获取圣遗物列表失败") from e
 
+    def get_next_cursor(
+        self,
+        artifacts: List[Artifact],
+        params: ArtifactQueryParams
+    ) -> Optional[Dict[str, Any]]:
+        """
+        根据当前页最后一行生成下一页游标
+
+        Args:
+            artifacts: 当前页圣遗物列表
+            params: 查询参数
+
+        Returns:
+            {"cursor_value": ..., "cursor_id": ...}；当前页未满时返回 None
+        """
+        if not artifacts or len(artifacts) < params.per_page:
+            return None
+
+        last = artifacts[-1]
+        order_col = self._SORT_COLUMNS.get(params.sort_by, Artifact.id)
+        value = getattr(last, order_col.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return {"cursor_value": value, "cursor_id": last.id}
+
+    @staticmethod
+    def _decode_cursor_value(order_col, raw_value: Optional[str]):
+        """将查询字符串中的游标值转换为排序列的类型"""
+        if raw_value is None:
+            raise ValidationException("cursor_value", "使用游标分页时必须提供 cursor_value")
+        try:
+            python_type = order_col.type.python_type
+            if python_type is datetime:
+                return datetime.fromisoformat(raw_value)
+            return python_type(raw_value)
+        except ValueError as e:
+            raise ValidationException("cursor_value", f"无效的游标值: {raw_value}") from e
+
     async def get_artifact_by_id(
         self,
         artifact_id: int
@@ -166,19 +238,25 @@ class ArtifactService(LoggerMixin):
         Returns:
             创建的圣遗物对象
         """
+        use_primary(self.db)
+        artifact_dict = artifact_data.model_dump() if hasattr(artifact_data, 'model_dump') else artifact_data.__dict__
+
         try:
-            # 检查圣遗物名称是否已存在
-            existing = await self._check_artifact_name_exists(artifact_data.name)
-            if existing:
-                raise ValidationException("name", f"圣遗物名称 '{artifact_data.name}' 已存在")
+            # 单条 INSERT ... ON CONFLICT DO NOTHING：名称已存在时不返回行，
+            # 由唯一约束判重，无需先查询（也没有查询与插入之间的竞态）
+            stmt = (
+                pg_insert(Artifact)
+                .values(**artifact_dict)
+                .on_conflict_do_nothing(index_elements=[Artifact.name])
+                .returning(Artifact)
+            )
+            artifact = (await self.db.scalars(stmt)).first()
 
-            # 创建圣遗物对象
-            artifact_dict = artifact_data.model_dump() if hasattr(artifact_data, 'model_dump') else artifact_data.__dict__
-            artifact = Artifact(**artifact_dict)
-            self.db.add(artifact)
+            if artifact is None:
+                await self.db.rollback()
+                raise ValidationException("name", f"圣遗物名称 '{artifact_data.name}' 已存在")
 
             await self.db.commit()
-            await self.db.refresh(artifact)
 
             log_database_operation("insert", "artifacts", id=artifact.id)
             self.log_info("圣遗物创建成功", artifact_id=artifact.id, name=artifact.name)
@@ -192,7 +270,6 @@ class ArtifactService(LoggerMixin):
             raise
         except Exception as e:
             await self.db.rollback()
-            artifact_dict = artifact_data.model_dump() if hasattr(artifact_data, 'model_dump') else artifact_data.__dict__
             self.log_error("创建圣遗物失败", error=e, data=artifact_dict)
             raise DatabaseException("创建圣遗物失败") from e
 
@@ -211,17 +288,35 @@ class ArtifactService(LoggerMixin):
         Returns:
             更新后的圣遗物对象
         """
+        use_primary(self.db)
         try:
-            artifact = await self.get_artifact_by_id(artifact_id)
-
-            # 更新字段
             update_data = artifact_data.model_dump(exclude_unset=True) if hasattr(artifact_data, 'model_dump') else artifact_data.__dict__
-            for field, value in update_data.items():
-                if hasattr(artifact, field):
-                    setattr(artifact, field, value)
+            # 只保留表中存在的列
+            columns = Artifact.__table__.columns
+            values = {field: value for field, value in update_data.items() if field in columns}
+
+            if not values:
+                return await self.get_artifact_by_id(artifact_id)
+
+            # 改名时检查新名称是否已被其他圣遗物占用
+            new_name = values.get("name")
+            if new_name and await self._check_artifact_name_exists(new_name, exclude_id=artifact_id):
+                raise ValidationException("name", f"圣遗物名称 '{new_name}' 已存在")
+
+            # 单条 UPDATE ... RETURNING 完成更新并取回新行，无需先查询再刷新
+            stmt = (
+                update(Artifact)
+                .where(Artifact.id == artifact_id)
+                .values(**values)
+                .returning(Artifact)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            artifact = (await self.db.scalars(stmt)).one_or_none()
+            if artifact is None:
+                await self.db.rollback()
+                raise NotFoundError("圣遗物", artifact_id)
 
             await self.db.commit()
-            await self.db.refresh(artifact)
 
             log_database_operation("update", "artifacts", id=artifact_id)
             self.log_info("圣遗物更新成功", artifact_id=artifact_id, updates=update_data)
@@ -231,7 +326,7 @@ class ArtifactService(LoggerMixin):
 
             return artifact
 
-        except NotFoundError:
+        except (NotFoundError, ValidationException):
             raise
         except Exception as e:
             await self.db.rollback()
@@ -248,10 +343,15 @@ class ArtifactService(LoggerMixin):
         Returns:
             删除是否成功
         """
+        use_primary(self.db)
         try:
-            artifact = await self.get_artifact_by_id(artifact_id)
+            # 单条 DELETE ... RETURNING，按返回的ID判断圣遗物是否存在
+            stmt = delete(Artifact).where(Artifact.id == artifact_id).returning(Artifact.id)
+            deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+            if deleted_id is None:
+                await self.db.rollback()
+                raise NotFoundError("圣遗物", artifact_id)
 
-            await self.db.delete(artifact)
             await self.db.commit()
 
             log_database_operation("delete", "artifacts", id=artifact_id)
@@ -274,7 +374,8 @@ class ArtifactService(LoggerMixin):
     async def search_artifacts(
         self,
         query: str,
-        limit: int = 20
+        limit: int = 20,
+        detail: bool = True
     ) -> List[Artifact]:
         """
         搜索圣遗物
@@ -282,6 +383,8 @@ class ArtifactService(LoggerMixin):
         Args:
             query: 搜索关键词
             limit: 结果数量限制
+            detail: 是否加载全部列；为 False 时只加载卡片视图所需的列
+                （Artifact.SUMMARY_COLUMNS），不读取描述、背景故事等大字段
 
         Returns:
             匹配的圣遗物列表
@@ -303,12 +406,14 @@ class ArtifactService(LoggerMixin):
                     Artifact.slot.ilike(search_term)
                 )
             ).limit(limit)
+            if not detail:
+                sql_query = sql_query.options(self._SUMMARY_LOAD)
 
             result = await self.db.execute(sql_query)
             artifacts = result.scalars().all()
 
             self.log_info("圣遗物搜索完成", query=query, results_count=len(artifacts))
-            return list(artifacts)
+            return artifacts
 
         except Exception as e:
             self.log_error("圣遗物搜索失败", error=e, query=query)
@@ -319,7 +424,8 @@ class ArtifactService(LoggerMixin):
     async def get_artifacts_by_set(
         self,
         set_name: str,
-        limit: int = 20
+        limit: int = 20,
+        detail: bool = True
     ) -> List[Artifact]:
         """
         根据套装名称获取圣遗物列表
@@ -327,6 +433,8 @@ class ArtifactService(LoggerMixin):
         Args:
             set_name: 套装名称
             limit: 数量限制
+            detail: 是否加载全部列；为 False 时只加载卡片视图列，
+                可由复合索引的 INCLUDE 列完成仅索引扫描
 
         Returns:
             圣遗物列表
@@ -335,12 +443,14 @@ class ArtifactService(LoggerMixin):
             query = select(Artifact).where(
                 Artifact.set_name == set_name
             ).order_by(Artifact.slot, desc(Artifact.rarity)).limit(limit)
+            if not detail:
+                query = query.options(self._SUMMARY_LOAD)
 
             result = await self.db.execute(query)
             artifacts = result.scalars().all()
 
             self.log_info("按套装获取圣遗物列表成功", set_name=set_name, count=len(artifacts))
-            return list(artifacts)
+            return artifacts
 
         except Exception as e:
             self.log_error("按套装获取圣遗物列表失败", error=e, set_name=set_name)
@@ -349,7 +459,8 @@ class ArtifactService(LoggerMixin):
     async def get_artifacts_by_slot(
         self,
         slot: str,
-        limit: int = 20
+        limit: int = 20,
+        detail: bool = True
     ) -> List[Artifact]:
         """
         根据部位获取圣遗物列表
@@ -357,6 +468,8 @@ class ArtifactService(LoggerMixin):
         Args:
             slot: 圣遗物部位
             limit: 数量限制
+            detail: 是否加载全部列；为 False 时只加载卡片视图列，
+                可由复合索引的 INCLUDE 列完成仅索引扫描
 
         Returns:
             圣遗物列表
@@ -365,12 +478,14 @@ class ArtifactService(LoggerMixin):
             query = select(Artifact).where(
                 Artifact.slot == slot
             ).order_by(desc(Artifact.rarity), Artifact.set_name).limit(limit)
+            if not detail:
+                query = query.options(self._SUMMARY_LOAD)
 
             result = await self.db.execute(query)
             artifacts = result.scalars().all()
 
             self.log_info("按部位获取圣遗物列表成功", slot=slot, count=len(artifacts))
-            return list(artifacts)
+            return artifacts
 
         except Exception as e:
             self.log_error("按部位获取圣遗物列表失败", error=e, slot=slot)
@@ -379,44 +494,39 @@ class ArtifactService(LoggerMixin):
     # ===== 统计功能 =====
 
     async def get_artifact_stats(self) -> ArtifactStats:
-        """获取圣遗物统计信息"""
+        """获取圣遗物统计信息（Redis缓存，增删改时失效）"""
+        cached_stats = await cache_manager.redis.get(ARTIFACT_STATS_CACHE_KEY)
+        if isinstance(cached_stats, ArtifactStats):
+            return cached_stats
+
         try:
-            # 总数统计
-            total_query = select(func.count(Artifact.id))
-            total_result = await self.db.execute(total_query)
-            total_count = total_result.scalar()
-
-            # 按套装分组统计
-            set_query = select(
-                Artifact.set_name,
-                func.count(Artifact.id)
-            ).group_by(Artifact.set_name)
-            set_result = await self.db.execute(set_query)
-            by_set = dict(set_result.fetchall())
-
-            # 按部位分组统计
-            slot_query = select(
-                Artifact.slot,
-                func.count(Artifact.id)
-            ).group_by(Artifact.slot)
-            slot_result = await self.db.execute(slot_query)
-            by_slot = dict(slot_result.fetchall())
-
-            # 按稀有度分组统计
-            rarity_query = select(
-                Artifact.rarity,
-                func.count(Artifact.id)
-            ).group_by(Artifact.rarity)
-            rarity_result = await self.db.execute(rarity_query)
-            by_rarity = {str(k): v for k, v in rarity_result.fetchall()}
-
-            # 按获取方式分组统计
-            source_query = select(
-                Artifact.source,
-                func.count(Artifact.id)
-            ).where(Artifact.source.is_not(None)).group_by(Artifact.source)
-            source_result = await self.db.execute(source_query)
-            by_source = dict(source_result.fetchall())
+            # 单条 GROUPING SETS 查询同时得到总数和各维度分组统计
+            dimensions = (Artifact.set_name, Artifact.slot, Artifact.rarity, Artifact.source)
+            stats_query = select(
+                func.grouping(*dimensions).label("grouping_id"),
+                *dimensions,
+                func.count(Artifact.id).label("artifact_count")
+            ).group_by(
+                func.grouping_sets(*(tuple_(column) for column in dimensions), tuple_())
+            )
+            stats_result = await self.db.execute(stats_query)
+
+            # grouping() 位掩码：参与分组的列对应位为0（按 set_name, slot, rarity, source 顺序）
+            total_count = 0
+            by_set, by_slot, by_rarity, by_source = {}, {}, {}, {}
+            # 按位置解包原始元组，避免逐行按列名查找属性
+            for grouping_id, set_name, slot, rarity, source, artifact_count in stats_result.tuples():
+                if grouping_id == 0b0111:
+                    by_set[set_name] = artifact_count
+                elif grouping_id == 0b1011:
+                    by_slot[slot] = artifact_count
+                elif grouping_id == 0b1101:
+                    by_rarity[str(rarity)] = artifact_count
+                elif grouping_id == 0b1110:
+                    if source is not None:
+                        by_source[source] = artifact_count
+                else:
+                    total_count = artifact_count
 
             stats = ArtifactStats(
                 total_artifacts=total_count,
@@ -427,6 +537,7 @@ class ArtifactService(LoggerMixin):
             )
 
             self.log_info("圣遗物统计信息获取成功", total=total_count)
+            await cache_manager.redis.set(ARTIFACT_STATS_CACHE_KEY, stats, ARTIFACT_STATS_CACHE_TTL)
             return stats
 
         except Exception as e:
@@ -435,24 +546,32 @@ class ArtifactService(LoggerMixin):
 
     # ===== 辅助方法 =====
 
-    async def _check_artifact_name_exists(self, name: str) -> bool:
-        """检查圣遗物名称是否已存在"""
-        query = select(Artifact.id).where(Artifact.name == name)
+    async def _check_artifact_name_exists(self, name: str, exclude_id: Optional[int] = None) -> bool:
+        """检查圣遗物名称是否已存在（EXISTS 在唯一索引上找到首条即返回）"""
+        condition = Artifact.name == name
+        if exclude_id is not None:
+            condition = and_(condition, Artifact.id != exclude_id)
+        query = select(exists().where(condition))
         result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
     async def _invalidate_artifact_cache(self, artifact_id: Optional[int] = None):
-        """清除圣遗物相关缓存 - TODO: Implement caching"""
-        # TODO: Implement cache invalidation when cache is properly configured
-        pass
+        """清除圣遗物相关缓存"""
+        await cache_manager.redis.delete(ARTIFACT_STATS_CACHE_KEY)
 
     @classmethod
-    def get_available_filters(cls) -> Dict[str, List[str]]:
-        """获取可用的过滤选项"""
-        return {
-            "slots": Artifact.get_artifact_slots(),
-            "main_stat_types": Artifact.get_main_stat_types(),
-            "sub_stat_types": Artifact.get_sub_stat_types(),
-            "sources": Artifact.get_sources(),
-            "rarities": Artifact.get_rarities()
-        }
\ No newline at end of file
+    @lru_cache(maxsize=1)
+    def get_available_filters(cls) -> Mapping[str, tuple]:
+        """
+        获取可用的过滤选项
+
+        选项均为常量，进程内只构建一次；返回只读映射和元组，
+        避免调用方修改缓存的共享对象
+        """
+        return MappingProxyType({
+            "slots": tuple(Artifact.get_artifact_slots()),
+            "main_stat_types": tuple(Artifact.get_main_stat_types()),
+            "sub_stat_types": tuple(Artifact.get_sub_stat_types()),
+            "sources": tuple(Artifact.get_sources()),
+            "rarities": tuple(Artifact.get_rarities())
+        })
\ No newline at end of file
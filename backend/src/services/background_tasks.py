@@ -7,10 +7,12 @@ import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-from celery import Celery
+from celery import Celery, chain, chord
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 import structlog
 
+from src.cache.cache_manager import cache_manager
 from src.config import get_settings
 from src.utils.logging import log_scraper_activity, log_cache_operation
 
@@ -47,6 +49,8 @@ celery_app.conf.update(
         "sync_*": {"queue": "sync"},
         "scrape_*": {"queue": "scraping"},
         "process_*": {"queue": "processing"},
+        "generate_thumbnail*": {"queue": "processing"},
+        "finalize_thumbnails": {"queue": "processing"},
         "cleanup_*": {"queue": "maintenance"},
     },
 
@@ -67,23 +71,11 @@ celery_app.conf.update(
             "schedule": crontab(minute=0, hour="*/6"),
             "args": (),
         },
-        # 每天同步武器数据
-        "sync-weapons-data": {
-            "task": "sync_weapons_data",
+        # 每天并发同步武器、圣遗物、怪物数据（失败项派发单项同步任务重试）
+        "sync-daily-data": {
+            "task": "sync_all_data",
             "schedule": crontab(minute=30, hour=2),  # 凌晨2:30
-            "args": (),
-        },
-        # 每天同步圣遗物数据
-        "sync-artifacts-data": {
-            "task": "sync_artifacts_data",
-            "schedule": crontab(minute=0, hour=3),  # 凌晨3:00
-            "args": (),
-        },
-        # 每天同步怪物数据
-        "sync-monsters-data": {
-            "task": "sync_monsters_data",
-            "schedule": crontab(minute=30, hour=3),  # 凌晨3:30
-            "args": (),
+            "args": (["weapons", "artifacts", "monsters"],),
         },
         # 每周同步游戏机制数据
         "sync-game-mechanics-data": {
@@ -113,150 +105,170 @@ celery_app.conf.update(
 )
 
 
-# 数据同步任务
-@celery_app.task(bind=True, name="sync_characters_data")
-def sync_characters_data(self, force_refresh: bool = False):
-    """
-    同步角色数据任务
+# 每个工作进程复用一个事件循环，避免每个任务都新建/销毁事件循环；
+# 数据库连接池中的连接也绑定在该循环上，可以跨任务复用
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    Args:
-        force_refresh: 是否强制刷新
-    """
-    try:
-        logger.info("开始同步角色数据", force_refresh=force_refresh)
-        log_scraper_activity("characters_sync", "start", force_refresh=force_refresh)
 
-        # 这里会导入和调用实际的同步逻辑
-        # 为了避免循环导入，在任务内部导入
-        from src.services.data_sync_service import DataSyncService
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """获取（必要时创建）当前工作进程的事件循环"""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
 
-        async def run_sync():
-            sync_service = DataSyncService()
-            return await sync_service.sync_characters(force_refresh=force_refresh)
 
-        # 在新的事件循环中运行异步任务
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_sync())
-            logger.info("角色数据同步完成", result=result)
-            log_scraper_activity("characters_sync", "complete", result=result)
-            return result
-        finally:
-            loop.close()
+@worker_process_init.connect
+def _init_worker_loop(**kwargs):
+    """工作进程启动时创建事件循环"""
+    _get_worker_loop()
 
-    except Exception as exc:
-        logger.error("角色数据同步失败", error=str(exc))
-        log_scraper_activity("characters_sync", "error", error=str(exc))
-        # 重试机制
-        raise self.retry(exc=exc, countdown=60, max_retries=3)
 
+@worker_process_shutdown.connect
+def _close_worker_loop(**kwargs):
+    """工作进程退出时关闭事件循环"""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+        _worker_loop.close()
+    _worker_loop = None
 
-@celery_app.task(bind=True, name="sync_weapons_data")
-def sync_weapons_data(self, force_refresh: bool = False):
-    """同步武器数据任务"""
-    try:
-        logger.info("开始同步武器数据", force_refresh=force_refresh)
-        log_scraper_activity("weapons_sync", "start", force_refresh=force_refresh)
 
-        from src.services.data_sync_service import DataSyncService
+def _run(coro):
+    """在工作进程的事件循环中运行协程并返回结果"""
+    return _get_worker_loop().run_until_complete(coro)
 
-        async def run_sync():
-            sync_service = DataSyncService()
-            return await sync_service.sync_weapons(force_refresh=force_refresh)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_sync())
-            logger.info("武器数据同步完成", result=result)
-            return result
-        finally:
-            loop.close()
+# 数据同步任务：实体类型 → 日志中的中文名称
+SYNC_ENTITY_LABELS = {
+    "characters": "角色",
+    "weapons": "武器",
+    "artifacts": "圣遗物",
+    "monsters": "怪物",
+    "game_mechanics": "游戏机制",
+}
+SYNC_ENTITY_TYPES = tuple(SYNC_ENTITY_LABELS)
 
-    except Exception as exc:
-        logger.error("武器数据同步失败", error=str(exc))
-        raise self.retry(exc=exc, countdown=60, max_retries=3)
 
+def _make_sync_task(entity_type: str):
+    """
+    生成单一实体的数据同步任务（任务名为 sync_<entity_type>_data）
 
-@celery_app.task(bind=True, name="sync_artifacts_data")
-def sync_artifacts_data(self, force_refresh: bool = False):
-    """同步圣遗物数据任务"""
-    try:
-        logger.info("开始同步圣遗物数据", force_refresh=force_refresh)
-        log_scraper_activity("artifacts_sync", "start", force_refresh=force_refresh)
+    Args:
+        entity_type: 实体类型，对应 DataSyncService.sync_<entity_type>
+    """
+    label = SYNC_ENTITY_LABELS[entity_type]
+    activity = f"{entity_type}_sync"
 
-        from src.services.data_sync_service import DataSyncService
+    def sync_task(self, force_refresh: bool = False):
+        try:
+            logger.info(f"开始同步{label}数据", force_refresh=force_refresh)
+            log_scraper_activity(activity, "start", force_refresh=force_refresh)
 
-        async def run_sync():
-            sync_service = DataSyncService()
-            return await sync_service.sync_artifacts(force_refresh=force_refresh)
+            # 同步服务模块尚未随本仓库提供（Celery include 中同样列出），放在任务内部导入：
+            # 缺少该模块时本模块与 worker 仍可正常加载，只有执行同步任务时才报错
+            from src.services.data_sync_service import DataSyncService
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_sync())
-            logger.info("圣遗物数据同步完成", result=result)
+            sync_method = getattr(DataSyncService(), f"sync_{entity_type}")
+            result = _run(sync_method(force_refresh=force_refresh))
+            logger.info(f"{label}数据同步完成", result=result)
+            log_scraper_activity(activity, "complete", result=result)
             return result
-        finally:
-            loop.close()
 
-    except Exception as exc:
-        logger.error("圣遗物数据同步失败", error=str(exc))
-        raise self.retry(exc=exc, countdown=60, max_retries=3)
+        except Exception as exc:
+            logger.error(f"{label}数据同步失败", error=str(exc))
+            log_scraper_activity(activity, "error", error=str(exc))
+            # 重试机制
+            raise self.retry(exc=exc, countdown=60, max_retries=3)
 
+    sync_task.__doc__ = f"""
+    同步{label}数据任务
 
-@celery_app.task(bind=True, name="sync_monsters_data")
-def sync_monsters_data(self, force_refresh: bool = False):
-    """同步怪物数据任务"""
-    try:
-        logger.info("开始同步怪物数据", force_refresh=force_refresh)
-        log_scraper_activity("monsters_sync", "start", force_refresh=force_refresh)
+    Args:
+        force_refresh: 是否强制刷新
+    """
+    return celery_app.task(bind=True, name=f"sync_{entity_type}_data")(sync_task)
 
-        from src.services.data_sync_service import DataSyncService
 
-        async def run_sync():
-            sync_service = DataSyncService()
-            return await sync_service.sync_monsters(force_refresh=force_refresh)
+sync_characters_data = _make_sync_task("characters")
+sync_weapons_data = _make_sync_task("weapons")
+sync_artifacts_data = _make_sync_task("artifacts")
+sync_monsters_data = _make_sync_task("monsters")
+sync_game_mechanics_data = _make_sync_task("game_mechanics")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_sync())
-            logger.info("怪物数据同步完成", result=result)
-            return result
-        finally:
-            loop.close()
+# 实体类型 → 单项同步任务，供 sync_all_data 重新派发失败项
+SYNC_TASKS = {
+    "characters": sync_characters_data,
+    "weapons": sync_weapons_data,
+    "artifacts": sync_artifacts_data,
+    "monsters": sync_monsters_data,
+    "game_mechanics": sync_game_mechanics_data,
+}
 
-    except Exception as exc:
-        logger.error("怪物数据同步失败", error=str(exc))
-        raise self.retry(exc=exc, countdown=60, max_retries=3)
 
+@celery_app.task(bind=True, name="sync_all_data")
+def sync_all_data(self, entity_types: Optional[List[str]] = None, force_refresh: bool = False):
+    """
+    在一个任务中并发同步多种数据
+
+    各实体的同步协程通过 asyncio.gather 同时运行，共享同一事件循环和数据库连接池，
+    网络等待相互重叠，总耗时约等于最慢的一项。单项失败不影响其他项；
+    失败项会各自派发对应的 sync_<entity_type>_data 任务，沿用单项任务的重试策略。
+
+    Args:
+        entity_types: 要同步的实体类型列表，默认全部（见 SYNC_ENTITY_TYPES）
+        force_refresh: 是否强制刷新
+    """
+    entity_types = list(entity_types or SYNC_ENTITY_TYPES)
+    unknown = [t for t in entity_types if t not in SYNC_ENTITY_TYPES]
+    if unknown:
+        raise ValueError(f"不支持的实体类型: {', '.join(unknown)}")
 
-@celery_app.task(bind=True, name="sync_game_mechanics_data")
-def sync_game_mechanics_data(self, force_refresh: bool = False):
-    """同步游戏机制数据任务"""
     try:
-        logger.info("开始同步游戏机制数据", force_refresh=force_refresh)
-        log_scraper_activity("game_mechanics_sync", "start", force_refresh=force_refresh)
+        logger.info("开始并发同步数据", entity_types=entity_types, force_refresh=force_refresh)
+        log_scraper_activity("all_sync", "start", entity_types=entity_types, force_refresh=force_refresh)
 
+        # 与单项同步任务相同，在任务内部导入尚未提供的同步服务模块
         from src.services.data_sync_service import DataSyncService
 
         async def run_sync():
-            sync_service = DataSyncService()
-            return await sync_service.sync_game_mechanics(force_refresh=force_refresh)
+            # 每项使用独立的同步服务实例，避免并发共用同一个数据库会话
+            results = await asyncio.gather(
+                *(
+                    getattr(DataSyncService(), f"sync_{entity_type}")(force_refresh=force_refresh)
+                    for entity_type in entity_types
+                ),
+                return_exceptions=True,
+            )
+            # return_exceptions 同样会返回 CancelledError（BaseException），需继续抛出而不是记为结果
+            for r in results:
+                if isinstance(r, asyncio.CancelledError):
+                    raise r
+            return results
+
+        result = {}
+        for entity_type, r in zip(entity_types, _run(run_sync())):
+            if not isinstance(r, BaseException):
+                result[entity_type] = r
+                continue
+            # 失败项改由单项同步任务重试，结果中记录派发的任务ID
+            retry = SYNC_TASKS[entity_type].apply_async(
+                kwargs={"force_refresh": force_refresh}, countdown=60
+            )
+            result[entity_type] = {"error": str(r), "retry_task_id": retry.id}
+            logger.warning(
+                "数据同步失败，已派发单项同步任务重试",
+                entity_type=entity_type, error=str(r), task_id=retry.id
+            )
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_sync())
-            logger.info("游戏机制数据同步完成", result=result)
-            return result
-        finally:
-            loop.close()
+        logger.info("并发数据同步完成", result=result)
+        log_scraper_activity("all_sync", "complete", result=result)
+        return result
 
     except Exception as exc:
-        logger.error("游戏机制数据同步失败", error=str(exc))
+        logger.error("并发数据同步失败", error=str(exc))
+        log_scraper_activity("all_sync", "error", error=str(exc))
         raise self.retry(exc=exc, countdown=60, max_retries=3)
 
 
@@ -278,24 +290,22 @@ def process_uploaded_image(self, image_id: int):
             image_service = ImageService()
             return await image_service.process_uploaded_image(image_id)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_process())
-            logger.info("图片处理完成", image_id=image_id, result=result)
-            return result
-        finally:
-            loop.close()
+        result = _run(run_process())
+        logger.info("图片处理完成", image_id=image_id, result=result)
+        return result
 
     except Exception as exc:
         logger.error("图片处理失败", image_id=image_id, error=str(exc))
         raise self.retry(exc=exc, countdown=30, max_retries=2)
 
 
+DEFAULT_THUMBNAIL_SIZES = [(150, 150), (300, 300), (600, 600)]
+
+
 @celery_app.task(bind=True, name="generate_thumbnails")
 def generate_thumbnails(self, image_id: int, sizes: List[tuple] = None):
     """
-    生成缩略图任务
+    生成缩略图任务（在一个任务中依次生成所有尺寸）
 
     Args:
         image_id: 图片ID
@@ -303,7 +313,7 @@ def generate_thumbnails(self, image_id: int, sizes: List[tuple] = None):
     """
     try:
         if sizes is None:
-            sizes = [(150, 150), (300, 300), (600, 600)]
+            sizes = DEFAULT_THUMBNAIL_SIZES
 
         logger.info("开始生成缩略图", image_id=image_id, sizes=sizes)
 
@@ -313,20 +323,83 @@ def generate_thumbnails(self, image_id: int, sizes: List[tuple] = None):
             image_service = ImageService()
             return await image_service.generate_thumbnails(image_id, sizes)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_generate())
-            logger.info("缩略图生成完成", image_id=image_id, result=result)
-            return result
-        finally:
-            loop.close()
+        result = _run(run_generate())
+        logger.info("缩略图生成完成", image_id=image_id, result=result)
+        return result
 
     except Exception as exc:
         logger.error("缩略图生成失败", image_id=image_id, error=str(exc))
         raise self.retry(exc=exc, countdown=30, max_retries=2)
 
 
+@celery_app.task(bind=True, name="generate_thumbnail")
+def generate_thumbnail(self, image_id: int, width: int, height: int):
+    """
+    生成单一尺寸缩略图任务（由 process_image_pipeline 并行分发）
+
+    Args:
+        image_id: 图片ID
+        width: 缩略图宽度
+        height: 缩略图高度
+    """
+    try:
+        logger.info("开始生成缩略图", image_id=image_id, size=(width, height))
+
+        from src.services.image_service import ImageService
+
+        async def run_generate():
+            image_service = ImageService()
+            return await image_service.generate_thumbnails(image_id, [(width, height)])
+
+        result = _run(run_generate())
+        logger.info("缩略图生成完成", image_id=image_id, size=(width, height), result=result)
+        return result
+
+    except Exception as exc:
+        logger.error("缩略图生成失败", image_id=image_id, size=(width, height), error=str(exc))
+        raise self.retry(exc=exc, countdown=30, max_retries=2)
+
+
+@celery_app.task(name="finalize_thumbnails")
+def finalize_thumbnails(results: List, image_id: int):
+    """
+    汇总各尺寸缩略图的生成结果（chord 回调）
+
+    Args:
+        results: 各 generate_thumbnail 子任务的结果
+        image_id: 图片ID
+    """
+    logger.info("全部缩略图生成完成", image_id=image_id, count=len(results))
+    return {"image_id": image_id, "thumbnails": results}
+
+
+def process_image_pipeline(image_id: int, sizes: Optional[List[tuple]] = None):
+    """
+    提交图片处理流水线：处理原图后并行生成各尺寸缩略图
+
+    process_uploaded_image 完成后，每个尺寸作为独立的 generate_thumbnail 子任务
+    分发到 processing 队列并行执行，全部完成后由 finalize_thumbnails 汇总。
+
+    Args:
+        image_id: 图片ID
+        sizes: 缩略图尺寸列表，默认 DEFAULT_THUMBNAIL_SIZES
+
+    Returns:
+        流水线的 AsyncResult
+    """
+    sizes = sizes or DEFAULT_THUMBNAIL_SIZES
+    pipeline = chain(
+        process_uploaded_image.si(image_id),
+        chord(
+            [generate_thumbnail.si(image_id, width, height) for width, height in sizes],
+            finalize_thumbnails.s(image_id),
+        ),
+    )
+    result = pipeline.apply_async()
+    logger.info("提交图片处理流水线", image_id=image_id, task_id=result.id)
+    return result
+
+
 # 维护任务
 @celery_app.task(name="cleanup_expired_cache")
 def cleanup_expired_cache():
@@ -335,8 +408,6 @@ def cleanup_expired_cache():
         logger.info("开始清理过期缓存")
         log_cache_operation("cleanup", "start")
 
-        from src.cache.cache_manager import cache_manager
-
         async def run_cleanup():
             # 清理过期的搜索结果
             search_count = await cache_manager.invalidate_pattern("search:*")
@@ -344,15 +415,10 @@ def cleanup_expired_cache():
             temp_count = await cache_manager.invalidate_pattern("temp:*")
             return {"search_cleared": search_count, "temp_cleared": temp_count}
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_cleanup())
-            logger.info("过期缓存清理完成", result=result)
-            log_cache_operation("cleanup", "complete", result=result)
-            return result
-        finally:
-            loop.close()
+        result = _run(run_cleanup())
+        logger.info("过期缓存清理完成", result=result)
+        log_cache_operation("cleanup", "complete", result=result)
+        return result
 
     except Exception as exc:
         logger.error("清理过期缓存失败", error=str(exc))
@@ -366,7 +432,6 @@ def update_system_stats():
         logger.info("开始更新系统统计")
 
         from src.services.stats_service import StatsService
-        from src.cache.cache_manager import cache_manager
 
         async def run_update():
             stats_service = StatsService()
@@ -380,14 +445,9 @@ def update_system_stats():
             )
             return stats
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_update())
-            logger.info("系统统计更新完成", result=result)
-            return result
-        finally:
-            loop.close()
+        result = _run(run_update())
+        logger.info("系统统计更新完成", result=result)
+        return result
 
     except Exception as exc:
         logger.error("系统统计更新失败", error=str(exc))
@@ -406,14 +466,9 @@ def backup_critical_data():
             backup_service = BackupService()
             return await backup_service.create_daily_backup()
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_backup())
-            logger.info("关键数据备份完成", result=result)
-            return result
-        finally:
-            loop.close()
+        result = _run(run_backup())
+        logger.info("关键数据备份完成", result=result)
+        return result
 
     except Exception as exc:
         logger.error("数据备份失败", error=str(exc))
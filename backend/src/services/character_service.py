@@ -3,24 +3,51 @@
 
 提供角色数据的增删改查、搜索、统计等业务逻辑
 """
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Any, Mapping, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, func, or_, and_, desc, asc
+import orjson
+from sqlalchemy import (
+    select, insert, update, delete, lambda_stmt, func, or_, and_, desc, asc, tuple_, cast, column, table, BigInteger
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
-from src.models.character import Character
+from src.db.session import use_primary
+from src.models.character import Character, SEARCH_DOCUMENT_SEPARATOR
 from src.models.character_skill import CharacterSkill
 from src.models.character_talent import CharacterTalent
 from src.schemas.character import (
     CharacterCreate, CharacterUpdate, CharacterQueryParams,
     CharacterStats, PopularCharacter
 )
+from src.scrapers.data_storage import DataStorageService
 from src.utils.logging import LoggerMixin, log_database_operation
 from src.utils.exceptions import NotFoundError, ValidationException, DatabaseException
 from src.utils.validators import validate_character_data, validate_page_params
-# from src.cache.cache_manager import cached, cache_invalidate, CacheKeys  # TODO: Implement cache
+from src.cache.cache_manager import cache_manager, CacheKeys
+
+def _escape_like(value: str) -> str:
+    """转义 LIKE 通配符（PostgreSQL 默认转义字符为反斜杠）"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_pattern(keyword: str) -> str:
+    """
+    构建匹配搜索文档的 ILIKE 模式
+
+    去掉列分隔符并转义通配符，保证关键词只能在单个列内连续匹配
+    """
+    keyword = keyword.replace(SEARCH_DOCUMENT_SEPARATOR, "")
+    return f"%{_escape_like(keyword)}%"
+
+
+# 统计结果缓存键与过期时间（数据只在同步任务或管理操作时变化）
+CHARACTER_STATS_CACHE_KEY = f"genshin:{CacheKeys.CHARACTER_STATS}:v1"
+CHARACTER_STATS_CACHE_TTL = 1800
 
 
 class CharacterService(LoggerMixin):
@@ -30,6 +57,16 @@ class CharacterService(LoggerMixin):
     提供角色相关的所有业务逻辑操作
     """
 
+    # 排序字段 → 列映射（未知字段按ID排序）
+    _SORT_COLUMNS = {
+        "name": Character.name,
+        "rarity": Character.rarity,
+        "element": Character.element,
+        "created_at": Character.created_at,
+    }
+    # 排序方向映射（非 asc 一律降序）
+    _SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
 
@@ -46,75 +83,63 @@ class CharacterService(LoggerMixin):
             params: 查询参数
 
         Returns:
-            (角色列表, 总数)
+            (角色列表, 总数)；params.detail 为 False 时列表元素是
+            只含 SUMMARY_COLUMNS 的行映射而不是 Character 实体
         """
         try:
             # 验证分页参数
             page, per_page = validate_page_params(params.page, params.per_page)
 
-            # 构建查询
-            query = select(Character)
-
-            # 应用过滤条件
+            # 构建过滤条件（数据查询和总数查询共用）
+            filters = []
             if params.element:
-                query = query.where(Character.element == params.element)
+                filters.append(Character.element == params.element)
             if params.weapon_type:
-                query = query.where(Character.weapon_type == params.weapon_type)
+                filters.append(Character.weapon_type == params.weapon_type)
             if params.rarity:
-                query = query.where(Character.rarity == params.rarity)
+                filters.append(Character.rarity == params.rarity)
             if params.region:
-                query = query.where(Character.region == params.region)
+                filters.append(Character.region == params.region)
             if params.search:
-                # 使用PostgreSQL全文搜索
-                search_term = f"%{params.search}%"
-                query = query.where(
-                    or_(
-                        Character.name.ilike(search_term),
-                        Character.name_en.ilike(search_term),
-                        Character.description.ilike(search_term),
-                        Character.title.ilike(search_term)
-                    )
-                )
+                # 在拼接的搜索文档上做单个 ILIKE（trigram GIN 表达式索引）
+                search_term = _search_pattern(params.search)
+                filters.append(Character.search_document().ilike(search_term))
 
             # 应用排序
-            if params.sort_by == "name":
-                order_col = Character.name
-            elif params.sort_by == "rarity":
-                order_col = Character.rarity
-            elif params.sort_by == "element":
-                order_col = Character.element
-            elif params.sort_by == "created_at":
-                order_col = Character.created_at
-            else:
-                order_col = Character.id
+            order_col = self._SORT_COLUMNS.get(params.sort_by, Character.id)
+            direction = self._SORT_DIRECTIONS.get(params.sort_order, desc)
 
-            if params.sort_order == "asc":
-                query = query.order_by(asc(order_col))
+            if params.detail:
+                query = select(Character).where(*filters)
             else:
-                query = query.order_by(desc(order_col))
+                # 卡片视图直接查询 SUMMARY_COLUMNS 并返回行映射，
+                # 不构造ORM实体，跳过身份映射和属性插桩；也不传输描述等大字段
+                query = select(
+                    *(getattr(Character, column) for column in Character.SUMMARY_COLUMNS)
+                ).where(*filters)
+            query = query.order_by(direction(order_col))
 
-            # 获取总数
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
 
             # 应用分页
             offset = (page - 1) * per_page
             query = query.offset(offset).limit(per_page)
 
-            # 预加载关联数据
-            query = query.options(
-                selectinload(Character.skills),
-                selectinload(Character.talents)
-            )
+            # 关联数据按需加载：只在 include 中声明时发出 selectin 查询，
+            # 卡片列表默认不加载技能和天赋（卡片视图不含关联数据）
+            if params.detail and "skills" in params.include:
+                query = query.options(selectinload(Character.skills))
+            if params.detail and "talents" in params.include:
+                query = query.options(selectinload(Character.talents))
 
-            # 执行查询
+            # 总数与数据查询在同一会话（同一连接、同一事务）中依次执行，
+            # 避免另开会话时两条查询看到不同快照导致总数与列表不一致
+            total = await self._count_characters(filters, exact=params.exact_count)
             result = await self.db.execute(query)
-            characters = result.scalars().all()
+            characters = result.scalars().all() if params.detail else result.mappings().all()
 
             log_database_operation(
                 "select", "characters",
-                filters=params.model_dump(exclude_unset=True) if hasattr(params, 'model_dump') else params.__dict__,
+                filters=lambda: params.model_dump(exclude_unset=True) if hasattr(params, 'model_dump') else params.__dict__,
                 total=total
             )
 
@@ -177,6 +202,7 @@ class CharacterService(LoggerMixin):
         Returns:
             创建的角色对象
         """
+        use_primary(self.db)
         try:
             # 验证数据
             char_data = character_data.model_dump() if hasattr(character_data, 'model_dump') else character_data.__dict__
@@ -187,17 +213,18 @@ class CharacterService(LoggerMixin):
                     "; ".join(validation_result.errors)
                 )
 
-            # 检查角色名称是否已存在
-            existing = await self._check_character_name_exists(character_data.name)
-            if existing:
-                raise ValidationException("name", f"角色名称 '{character_data.name}' 已存在")
-
-            # 创建角色对象
-            character = Character(**char_data)
-            self.db.add(character)
+            # 单条 INSERT ... RETURNING 插入并取回含服务端默认值的新行，无需提交后再刷新；
+            # 名称唯一性由 characters.name 的唯一约束保证，无需先查询（也没有查询与插入之间的竞态）
+            stmt = insert(Character).values(**char_data).returning(Character)
+            try:
+                character = (await self.db.scalars(stmt)).one()
+            except IntegrityError as e:
+                await self.db.rollback()
+                if getattr(e.orig, "sqlstate", None) == "23505":  # unique_violation
+                    raise ValidationException("name", f"角色名称 '{character_data.name}' 已存在") from e
+                raise
 
             await self.db.commit()
-            await self.db.refresh(character)
 
             log_database_operation("insert", "characters", id=character.id)
             self.log_info("角色创建成功", character_id=character.id, name=character.name)
@@ -230,17 +257,32 @@ class CharacterService(LoggerMixin):
         Returns:
             更新后的角色对象
         """
+        use_primary(self.db)
         try:
-            character = await self.get_character_by_id(character_id, include_relations=False)
-
-            # 更新字段
             update_data = character_data.model_dump(exclude_unset=True) if hasattr(character_data, 'model_dump') else character_data.__dict__
-            for field, value in update_data.items():
-                if hasattr(character, field):
-                    setattr(character, field, value)
+            # 只保留表中存在的列
+            columns = Character.__table__.columns
+            values = {field: value for field, value in update_data.items() if field in columns}
+
+            if not values:
+                return await self.get_character_by_id(character_id, include_relations=False)
+
+            # 单条 UPDATE ... RETURNING 完成更新并取回新行，无需先查询再刷新
+            stmt = (
+                update(Character)
+                .where(Character.id == character_id)
+                .values(**values)
+                .returning(Character)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            character = (await self.db.scalars(stmt)).one_or_none()
+            if character is None:
+                await self.db.rollback()
+                raise NotFoundError("角色", character_id)
 
             await self.db.commit()
-            await self.db.refresh(character)
+            # 爬虫入库会跳过本进程写过的相同行，手工修改后需让下次爬取重新写入
+            DataStorageService.clear_write_cache()
 
             log_database_operation("update", "characters", id=character_id)
             self.log_info("角色更新成功", character_id=character_id, updates=update_data)
@@ -267,11 +309,19 @@ class CharacterService(LoggerMixin):
         Returns:
             删除是否成功
         """
+        use_primary(self.db)
         try:
-            character = await self.get_character_by_id(character_id, include_relations=False)
+            # 单条 DELETE ... RETURNING，按返回的ID判断角色是否存在；
+            # 技能、天赋、推荐等子表由外键 ON DELETE CASCADE 级联删除
+            stmt = delete(Character).where(Character.id == character_id).returning(Character.id)
+            deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+            if deleted_id is None:
+                await self.db.rollback()
+                raise NotFoundError("角色", character_id)
 
-            await self.db.delete(character)
             await self.db.commit()
+            # 让下次爬取重新写入被删除的行
+            DataStorageService.clear_write_cache()
 
             log_database_operation("delete", "characters", id=character_id)
             self.log_info("角色删除成功", character_id=character_id)
@@ -342,24 +392,45 @@ class CharacterService(LoggerMixin):
             if not query or len(query.strip()) < 2:
                 return []
 
-            search_term = f"%{query.strip()}%"
-
-            # 构建搜索查询
-            sql_query = select(Character).where(
-                or_(
-                    Character.name.ilike(search_term),
-                    Character.name_en.ilike(search_term),
-                    Character.title.ilike(search_term),
-                    Character.affiliation.ilike(search_term),
-                    Character.constellation_name.ilike(search_term)
+            keyword = query.strip()
+            characters = []
+
+            if len(keyword) < 3:
+                # 不足3个字符时 trigram 索引无法过滤，先按名称前缀匹配，
+                # 由 lower(name)/lower(name_en) 的 text_pattern_ops B-tree 索引完成
+                prefix_pattern = f"{_escape_like(keyword.lower())}%"
+                prefix_query = lambda_stmt(
+                    lambda: select(Character).where(
+                        or_(
+                            func.lower(Character.name).like(prefix_pattern),
+                            func.lower(Character.name_en).like(prefix_pattern)
+                        )
+                    ).order_by(Character.name).limit(limit)
+                )
+                characters = (await self.db.execute(prefix_query)).scalars().all()
+
+            characters = list(characters)
+            if len(characters) < limit:
+                # 前缀匹配只是可走索引的第一轮，名称中间、称号、描述等处包含关键词的角色
+                # 仍需子串匹配补足；排除已命中的角色，结果不重复
+                search_term = _search_pattern(keyword)
+                found_ids = [character.id for character in characters]
+                remaining = limit - len(characters)
+
+                # 构建搜索查询（单个 ILIKE 匹配拼接的搜索文档）；lambda_stmt 只在首次调用时
+                # 构造语句，之后按代码位置命中缓存，search_term 等作为绑定参数传入
+                sql_query = lambda_stmt(
+                    lambda: select(Character).where(
+                        Character.search_document().ilike(search_term),
+                        Character.id.not_in(found_ids)
+                    ).limit(remaining)
                 )
-            ).limit(limit)
 
-            result = await self.db.execute(sql_query)
-            characters = result.scalars().all()
+                result = await self.db.execute(sql_query)
+                characters.extend(result.scalars().all())
 
             self.log_info("角色搜索完成", query=query, results_count=len(characters))
-            return list(characters)
+            return characters
 
         except Exception as e:
             self.log_error("角色搜索失败", error=e, query=query)
@@ -367,46 +438,40 @@ class CharacterService(LoggerMixin):
 
     # ===== 统计功能 =====
 
-    # @cached(ttl=1800, key_prefix="character_stats")  # TODO: Enable caching
     async def get_character_stats(self) -> CharacterStats:
-        """获取角色统计信息"""
+        """获取角色统计信息（Redis缓存，增删改时失效）"""
+        cached_stats = await cache_manager.redis.get(CHARACTER_STATS_CACHE_KEY)
+        if isinstance(cached_stats, CharacterStats):
+            return cached_stats
+
         try:
-            # 总数统计
-            total_query = select(func.count(Character.id))
-            total_result = await self.db.execute(total_query)
-            total_count = total_result.scalar()
-
-            # 按元素分组统计
-            element_query = select(
-                Character.element,
-                func.count(Character.id)
-            ).group_by(Character.element)
-            element_result = await self.db.execute(element_query)
-            by_element = dict(element_result.fetchall())
-
-            # 按武器类型分组统计
-            weapon_query = select(
-                Character.weapon_type,
-                func.count(Character.id)
-            ).group_by(Character.weapon_type)
-            weapon_result = await self.db.execute(weapon_query)
-            by_weapon_type = dict(weapon_result.fetchall())
-
-            # 按稀有度分组统计
-            rarity_query = select(
-                Character.rarity,
-                func.count(Character.id)
-            ).group_by(Character.rarity)
-            rarity_result = await self.db.execute(rarity_query)
-            by_rarity = {str(k): v for k, v in rarity_result.fetchall()}
-
-            # 按地区分组统计
-            region_query = select(
-                Character.region,
-                func.count(Character.id)
-            ).where(Character.region.is_not(None)).group_by(Character.region)
-            region_result = await self.db.execute(region_query)
-            by_region = dict(region_result.fetchall())
+            # 单条 GROUPING SETS 查询同时得到总数和各维度分组统计，只扫描一次表
+            dimensions = (Character.element, Character.weapon_type, Character.rarity, Character.region)
+            stats_query = select(
+                func.grouping(*dimensions).label("grouping_id"),
+                *dimensions,
+                func.count(Character.id).label("character_count")
+            ).group_by(
+                func.grouping_sets(*(tuple_(column) for column in dimensions), tuple_())
+            )
+            stats_result = await self.db.execute(stats_query)
+
+            # grouping() 位掩码：参与分组的列对应位为0（按 element, weapon_type, rarity, region 顺序）
+            total_count = 0
+            by_element, by_weapon_type, by_rarity, by_region = {}, {}, {}, {}
+            # 按位置解包原始元组，避免逐行按列名查找属性
+            for grouping_id, element, weapon_type, rarity, region, character_count in stats_result.tuples():
+                if grouping_id == 0b0111:
+                    by_element[element] = character_count
+                elif grouping_id == 0b1011:
+                    by_weapon_type[weapon_type] = character_count
+                elif grouping_id == 0b1101:
+                    by_rarity[str(rarity)] = character_count
+                elif grouping_id == 0b1110:
+                    if region is not None:
+                        by_region[region] = character_count
+                else:
+                    total_count = character_count
 
             stats = CharacterStats(
                 total_characters=total_count,
@@ -417,6 +482,7 @@ class CharacterService(LoggerMixin):
             )
 
             self.log_info("角色统计信息获取成功", total=total_count)
+            await cache_manager.redis.set(CHARACTER_STATS_CACHE_KEY, stats, CHARACTER_STATS_CACHE_TTL)
             return stats
 
         except Exception as e:
@@ -425,36 +491,60 @@ class CharacterService(LoggerMixin):
 
     # ===== 辅助方法 =====
 
-    async def _check_character_name_exists(self, name: str) -> bool:
-        """检查角色名称是否已存在"""
-        query = select(Character.id).where(Character.name == name)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
-
-    async def _invalidate_character_cache(self, character_id: Optional[int] = None):
-        """清除角色相关缓存 - 暂时禁用"""
-        # TODO: Implement cache invalidation when cache system is ready
-        pass
-        # from src.cache.cache_manager import cache_manager
+    async def _count_characters(self, filters: list, exact: bool = True) -> int:
+        """
+        统计满足过滤条件的角色数
 
-        # # 清除列表缓存
-        # await cache_manager.invalidate_pattern(f"{CacheKeys.CHARACTER_LIST}:*")
-        # await cache_manager.invalidate_pattern(f"{CacheKeys.CHARACTER_SEARCH}:*")
+        Args:
+            filters: 过滤条件列表
+            exact: 是否精确计数；为 False 时使用规划器估算值（无过滤条件时读
+                pg_class.reltuples，有过滤条件时读 EXPLAIN 的行数估算），
+                开销与匹配行数无关，估算不可用时退回精确计数
+        """
+        # 总数查询直接按过滤条件计数，不经过排序子查询
+        count_query = select(func.count(Character.id)).where(*filters)
+        if exact:
+            return await self.db.scalar(count_query)
+
+        if not filters:
+            estimate = await self.db.scalar(
+                select(cast(column("reltuples"), BigInteger))
+                .select_from(table("pg_class"))
+                .where(column("relname") == Character.__tablename__)
+            )
+        else:
+            # 过滤条件以字面量内联（由方言负责转义），取规划器对结果行数的估算
+            statement = select(Character.id).where(*filters).compile(
+                dialect=self.db.bind.dialect,
+                compile_kwargs={"literal_binds": True}
+            )
+            connection = await self.db.connection()
+            plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}")).scalar()
+            if isinstance(plan, (str, bytes)):
+                plan = orjson.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"] if plan else None
 
-        # # 清除特定角色缓存
-        # if character_id:
-        #     await cache_manager.invalidate_pattern(f"{CacheKeys.CHARACTER_DETAIL}:*{character_id}*")
-        #     await cache_manager.invalidate_pattern(f"{CacheKeys.CHARACTER_SKILLS}:*{character_id}*")
+        # 从未 ANALYZE 的表 reltuples 为 -1（旧版本为 0），估算不可信时精确计数
+        if estimate is None or estimate <= 0:
+            return await self.db.scalar(count_query)
+        return int(estimate)
 
-        # # 清除统计缓存
-        # await cache_manager.invalidate_pattern("character_stats:*")
+    async def _invalidate_character_cache(self, character_id: Optional[int] = None):
+        """清除角色相关缓存"""
+        await cache_manager.redis.delete(CHARACTER_STATS_CACHE_KEY)
 
     @classmethod
-    def get_available_filters(cls) -> Dict[str, List[str]]:
-        """获取可用的过滤选项"""
-        return {
-            "elements": Character.get_element_types(),
-            "weapon_types": Character.get_weapon_types(),
-            "regions": Character.get_regions(),
-            "rarities": [4, 5]
-        }
\ No newline at end of file
+    @lru_cache(maxsize=1)
+    def get_available_filters(cls) -> Mapping[str, tuple]:
+        """
+        获取可用的过滤选项
+
+        选项均为常量，进程内只构建一次；返回只读映射和元组，
+        避免调用方修改缓存的共享对象
+        """
+        return MappingProxyType({
+            "elements": tuple(Character.get_element_types()),
+            "weapon_types": tuple(Character.get_weapon_types()),
+            "regions": tuple(Character.get_regions()),
+            "rarities": (4, 5)
+        })
\ No newline at end of file
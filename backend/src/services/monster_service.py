@@ -3,13 +3,18 @@
 
 提供怪物数据的增删改查、搜索、统计等业务逻辑
 """
-from typing import List, Optional, Dict, Any, Tuple
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Any, Mapping, Tuple
 from datetime import datetime
 
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, insert, update, delete, lambda_stmt, func, or_, and_, case, desc, asc, exists, literal_column, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
 
+from src.cache.cache_manager import cache_manager, CacheKeys
+from src.db.session import use_primary
 from src.models.monster import Monster
 from src.schemas.monster import (
     MonsterCreate, MonsterUpdate, MonsterQueryParams,
@@ -19,6 +24,19 @@ from src.utils.logging import LoggerMixin, log_database_operation
 from src.utils.exceptions import NotFoundError, ValidationException, DatabaseException
 from src.utils.validators import validate_page_params
 
+# 统计结果缓存键与过期时间（全表聚合，数据分钟级内基本不变，增删改时主动失效）
+MONSTER_STATS_CACHE_KEY = f"genshin:{CacheKeys.MONSTER_STATS}:v1"
+MONSTER_STATS_CACHE_TTL = 120
+
+
+def _search_filter(search_term: str):
+    """
+    构建文本搜索条件
+
+    各搜索列均有 trigram GIN 索引，ILIKE 的 OR 条件由规划器合并为 BitmapOr 索引扫描
+    """
+    return or_(*(getattr(Monster, column).ilike(search_term) for column in Monster.SEARCH_COLUMNS))
+
 
 class MonsterService(LoggerMixin):
     """
@@ -27,6 +45,18 @@ class MonsterService(LoggerMixin):
     提供怪物相关的所有业务逻辑操作
     """
 
+    # 排序字段 → 列映射（未知字段按ID排序）
+    _SORT_COLUMNS = {
+        "name": Monster.name,
+        "category": Monster.category,
+        "family": Monster.family,
+        "level": Monster.level,
+        "world_level": Monster.world_level,
+        "created_at": Monster.created_at,
+    }
+    # 排序方向映射（非 asc 一律降序）
+    _SORT_DIRECTIONS = {"asc": asc, "desc": desc}
+
     def __init__(self, db_session: AsyncSession):
         self.db = db_session
 
@@ -35,7 +65,7 @@ class MonsterService(LoggerMixin):
     async def get_monster_list(
         self,
         params: MonsterQueryParams
-    ) -> Tuple[List[Monster], int]:
+    ) -> Tuple[List[Monster], Optional[int], bool]:
         """
         获取怪物列表（分页）
 
@@ -43,76 +73,88 @@ class MonsterService(LoggerMixin):
             params: 查询参数
 
         Returns:
-            (怪物列表, 总数)
+            (怪物列表, 总数, 是否有下一页)；不统计总数（with_total=False 或游标分页）时总数为 None；
+            detail=False 时列表元素为 SUMMARY_COLUMNS 的字典/行映射而非ORM实体
         """
         try:
             # 验证分页参数
             page, per_page = validate_page_params(params.page, params.per_page)
 
-            # 构建查询
-            query = select(Monster)
-
-            # 应用过滤条件
+            # 构建过滤条件，最后一次性应用到查询上（避免每个条件都复制一次 Select）
+            filters = []
             if params.category:
-                query = query.where(Monster.category == params.category)
+                filters.append(Monster.category == params.category)
             if params.family:
-                query = query.where(Monster.family == params.family)
+                filters.append(Monster.family == params.family)
             if params.element:
-                query = query.where(Monster.element == params.element)
-            if params.level:
-                query = query.where(Monster.level == params.level)
-            if params.world_level:
-                query = query.where(Monster.world_level == params.world_level)
+                filters.append(Monster.element == params.element)
+            if params.level is not None:
+                filters.append(Monster.level == params.level)
+            if params.world_level is not None:
+                filters.append(Monster.world_level == params.world_level)
             if params.region:
                 # 检查地区是否在regions数组中
-                query = query.where(Monster.regions.contains([params.region]))
+                filters.append(Monster.regions.contains([params.region]))
             if params.search:
-                # 使用PostgreSQL全文搜索
+                # 多列 ILIKE（各列 trigram GIN 索引）
                 search_term = f"%{params.search}%"
-                query = query.where(
-                    or_(
-                        Monster.name.ilike(search_term),
-                        Monster.name_en.ilike(search_term),
-                        Monster.category.ilike(search_term),
-                        Monster.family.ilike(search_term),
-                        Monster.description.ilike(search_term),
-                        Monster.behavior.ilike(search_term)
-                    )
-                )
+                filters.append(_search_filter(search_term))
 
             # 应用排序
-            if params.sort_by == "name":
-                order_col = Monster.name
-            elif params.sort_by == "category":
-                order_col = Monster.category
-            elif params.sort_by == "family":
-                order_col = Monster.family
-            elif params.sort_by == "level":
-                order_col = Monster.level
-            elif params.sort_by == "world_level":
-                order_col = Monster.world_level
-            elif params.sort_by == "created_at":
-                order_col = Monster.created_at
+            order_col = self._SORT_COLUMNS.get(params.sort_by, Monster.id)
+            direction = self._SORT_DIRECTIONS.get(params.sort_order, desc)
+
+            # 游标分页（仅按ID排序）：从上一页最后一条之后继续，代价与翻页深度无关
+            if params.cursor_id is not None:
+                if order_col is not Monster.id:
+                    raise ValidationException("cursor_id", "游标分页仅支持按ID排序")
+                if params.sort_order == "asc":
+                    filters.append(Monster.id > params.cursor_id)
+                else:
+                    filters.append(Monster.id < params.cursor_id)
+                offset = 0
             else:
-                order_col = Monster.id
+                offset = (page - 1) * per_page
 
-            if params.sort_order == "asc":
-                query = query.order_by(asc(order_col))
+            # 构建查询；卡片视图直接查询 SUMMARY_COLUMNS，不构造ORM实体，
+            # 跳过身份映射和属性插桩，也不传输描述、背景故事等大字段
+            if params.detail:
+                query = select(Monster)
             else:
-                query = query.order_by(desc(order_col))
-
-            # 获取总数
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
-
-            # 应用分页
-            offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
-
-            # 执行查询
-            result = await self.db.execute(query)
-            monsters = result.scalars().all()
+                query = select(*(getattr(Monster, column) for column in Monster.SUMMARY_COLUMNS))
+            query = query.where(*filters).order_by(direction(order_col))
+
+            if params.with_total and params.cursor_id is None:
+                # 总数用窗口函数在同一次扫描中算出，省去单独的 COUNT 查询
+                query = query.add_columns(
+                    func.count().over().label('total')
+                ).offset(offset).limit(per_page)
+
+                # 执行查询
+                result = await self.db.execute(query)
+                rows = result.all()
+                if params.detail:
+                    monsters = [row[0] for row in rows]
+                else:
+                    # 末尾的窗口总数列不属于卡片字段，zip 按 SUMMARY_COLUMNS 截断
+                    monsters = [dict(zip(Monster.SUMMARY_COLUMNS, row)) for row in rows]
+
+                if rows:
+                    total = rows[0].total
+                elif offset > 0:
+                    # 页码越界时窗口函数没有返回行，单独统计总数
+                    count_query = select(func.count(Monster.id)).where(*filters)
+                    total = (await self.db.execute(count_query)).scalar()
+                else:
+                    total = 0
+                has_more = page * per_page < total
+            else:
+                # 不统计总数：多取一条哨兵行判断是否还有下一页，只扫描 per_page + 1 行
+                result = await self.db.execute(query.offset(offset).limit(per_page + 1))
+                monsters = result.scalars().all() if params.detail else result.mappings().all()
+                has_more = len(monsters) > per_page
+                monsters = monsters[:per_page]
+                total = None
 
             log_database_operation(
                 "select", "monsters",
@@ -120,8 +162,10 @@ class MonsterService(LoggerMixin):
                 total=total
             )
 
-            return list(monsters), total
+            return list(monsters), total, has_more
 
+        except ValidationException:
+            raise
         except Exception as e:
             params_data = params.model_dump() if hasattr(params, 'model_dump') else params.__dict__
             self.log_error("获取怪物列表失败", error=e, params=params_data)
@@ -144,7 +188,7 @@ class MonsterService(LoggerMixin):
             NotFoundError: 怪物不存在
         """
         try:
-            query = select(Monster).where(Monster.id == monster_id)
+            query = lambda_stmt(lambda: select(Monster).where(Monster.id == monster_id))
             result = await self.db.execute(query)
             monster = result.scalar_one_or_none()
 
@@ -170,6 +214,7 @@ class MonsterService(LoggerMixin):
         Returns:
             创建的怪物对象
         """
+        use_primary(self.db)
         try:
             # 检查怪物名称是否已存在
             existing = await self._check_monster_name_exists(monster_data.name)
@@ -181,7 +226,14 @@ class MonsterService(LoggerMixin):
             monster = Monster(**monster_dict)
             self.db.add(monster)
 
-            await self.db.commit()
+            try:
+                await self.db.commit()
+            except IntegrityError as e:
+                # 查重与插入之间被并发写入同名怪物，由唯一约束拦截
+                await self.db.rollback()
+                if getattr(e.orig, "sqlstate", None) == "23505":  # unique_violation
+                    raise ValidationException("name", f"怪物名称 '{monster_data.name}' 已存在") from e
+                raise
             await self.db.refresh(monster)
 
             log_database_operation("insert", "monsters", id=monster.id)
@@ -200,6 +252,70 @@ class MonsterService(LoggerMixin):
             self.log_error("创建怪物失败", error=e, data=monster_dict)
             raise DatabaseException("创建怪物失败") from e
 
+    async def create_monsters(self, monsters_data: List[MonsterCreate]) -> List[int]:
+        """
+        批量创建怪物
+
+        一次查询完成名称查重，再以多行 INSERT ... RETURNING 插入
+        （SQLAlchemy 按批次合并为多值 INSERT），避免逐条往返
+
+        Args:
+            monsters_data: 怪物创建数据列表
+
+        Returns:
+            新建怪物的ID列表（与输入顺序一致）
+        """
+        use_primary(self.db)
+        if not monsters_data:
+            return []
+
+        rows = [
+            monster_data.model_dump() if hasattr(monster_data, 'model_dump') else monster_data.__dict__
+            for monster_data in monsters_data
+        ]
+        names = [row["name"] for row in rows]
+
+        try:
+            # 批次内重名
+            duplicated = sorted(name for name, count in Counter(names).items() if count > 1)
+            if duplicated:
+                raise ValidationException("name", f"批量数据中怪物名称重复: {', '.join(duplicated)}")
+
+            # 与已有数据重名（单条 IN 查询，而不是逐条检查）
+            existing = (await self.db.scalars(
+                select(Monster.name).where(Monster.name.in_(names))
+            )).all()
+            if existing:
+                raise ValidationException("name", f"怪物名称已存在: {', '.join(existing)}")
+
+            try:
+                # sort_by_parameter_order 保证批量 INSERT ... RETURNING 的ID与输入行一一对应
+                monster_ids = (await self.db.scalars(
+                    insert(Monster).returning(Monster.id, sort_by_parameter_order=True), rows
+                )).all()
+                await self.db.commit()
+            except IntegrityError as e:
+                # 查重与插入之间被并发写入同名怪物，由唯一约束拦截
+                await self.db.rollback()
+                if getattr(e.orig, "sqlstate", None) == "23505":  # unique_violation
+                    raise ValidationException("name", "怪物名称已存在") from e
+                raise
+
+            log_database_operation("insert", "monsters", count=len(monster_ids))
+            self.log_info("怪物批量创建成功", count=len(monster_ids))
+
+            # 清除相关缓存
+            await self._invalidate_monster_cache()
+
+            return list(monster_ids)
+
+        except (ValidationException, DatabaseException):
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            self.log_error("批量创建怪物失败", error=e, count=len(rows))
+            raise DatabaseException("批量创建怪物失败") from e
+
     async def update_monster(
         self,
         monster_id: int,
@@ -215,17 +331,30 @@ class MonsterService(LoggerMixin):
         Returns:
             更新后的怪物对象
         """
+        use_primary(self.db)
         try:
-            monster = await self.get_monster_by_id(monster_id)
-
-            # 更新字段
             update_data = monster_data.model_dump(exclude_unset=True) if hasattr(monster_data, 'model_dump') else monster_data.__dict__
-            for field, value in update_data.items():
-                if hasattr(monster, field):
-                    setattr(monster, field, value)
+            # 只保留表中存在的列
+            columns = Monster.__table__.columns
+            values = {field: value for field, value in update_data.items() if field in columns}
+
+            if not values:
+                return await self.get_monster_by_id(monster_id)
+
+            # 单条 UPDATE ... RETURNING 完成更新并取回新行，无需先查询再刷新
+            stmt = (
+                update(Monster)
+                .where(Monster.id == monster_id)
+                .values(**values)
+                .returning(Monster)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            monster = (await self.db.scalars(stmt)).one_or_none()
+            if monster is None:
+                await self.db.rollback()
+                raise NotFoundError("怪物", monster_id)
 
             await self.db.commit()
-            await self.db.refresh(monster)
 
             log_database_operation("update", "monsters", id=monster_id)
             self.log_info("怪物更新成功", monster_id=monster_id, updates=update_data)
@@ -252,10 +381,15 @@ class MonsterService(LoggerMixin):
         Returns:
             删除是否成功
         """
+        use_primary(self.db)
         try:
-            monster = await self.get_monster_by_id(monster_id)
+            # 单条 DELETE ... RETURNING，按返回的ID判断怪物是否存在
+            stmt = delete(Monster).where(Monster.id == monster_id).returning(Monster.id)
+            deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
+            if deleted_id is None:
+                await self.db.rollback()
+                raise NotFoundError("怪物", monster_id)
 
-            await self.db.delete(monster)
             await self.db.commit()
 
             log_database_operation("delete", "monsters", id=monster_id)
@@ -294,23 +428,27 @@ class MonsterService(LoggerMixin):
             if not query or len(query.strip()) < 2:
                 return []
 
-            search_term = f"%{query.strip()}%"
-
-            # 构建搜索查询
-            sql_query = select(Monster).where(
-                or_(
-                    Monster.name.ilike(search_term),
-                    Monster.name_en.ilike(search_term),
-                    Monster.category.ilike(search_term),
-                    Monster.family.ilike(search_term),
-                    Monster.description.ilike(search_term),
-                    Monster.behavior.ilike(search_term),
-                    Monster.lore.ilike(search_term)
-                )
-            ).limit(limit)
-
-            result = await self.db.execute(sql_query)
-            monsters = result.scalars().all()
+            keyword = query.strip()
+            monsters = []
+
+            if len(keyword.split()) >= 2:
+                # 多词查询走全文检索（GIN 索引），按相关度排序
+                ts_query = func.plainto_tsquery(literal_column("'simple'"), keyword)
+                search_vector = Monster.search_vector()
+                fts_query = select(Monster).where(
+                    search_vector.op('@@')(ts_query)
+                ).order_by(
+                    desc(func.ts_rank_cd(search_vector, ts_query))
+                ).limit(limit)
+                monsters = (await self.db.execute(fts_query)).scalars().all()
+
+            if not monsters:
+                # 单词查询或全文检索无结果（如未分词的中文）时回退到 trigram 子串匹配
+                search_term = f"%{keyword}%"
+                sql_query = select(Monster).where(_search_filter(search_term)).limit(limit)
+
+                result = await self.db.execute(sql_query)
+                monsters = result.scalars().all()
 
             self.log_info("怪物搜索完成", query=query, results_count=len(monsters))
             return list(monsters)
@@ -320,6 +458,8 @@ class MonsterService(LoggerMixin):
             raise DatabaseException("怪物搜索失败") from e
 
     # ===== 分类相关功能 =====
+    # 以下按条件查询均为固定结构，使用 lambda_stmt 按代码位置缓存语句构造与编译结果，
+    # 每次调用只替换绑定参数
 
     async def get_monsters_by_category(
         self,
@@ -337,9 +477,11 @@ class MonsterService(LoggerMixin):
             怪物列表
         """
         try:
-            query = select(Monster).where(
-                Monster.category == category
-            ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            query = lambda_stmt(
+                lambda: select(Monster).where(
+                    Monster.category == category
+                ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            )
 
             result = await self.db.execute(query)
             monsters = result.scalars().all()
@@ -367,9 +509,11 @@ class MonsterService(LoggerMixin):
             怪物列表
         """
         try:
-            query = select(Monster).where(
-                Monster.family == family
-            ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            query = lambda_stmt(
+                lambda: select(Monster).where(
+                    Monster.family == family
+                ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            )
 
             result = await self.db.execute(query)
             monsters = result.scalars().all()
@@ -397,9 +541,11 @@ class MonsterService(LoggerMixin):
             怪物列表
         """
         try:
-            query = select(Monster).where(
-                Monster.element == element
-            ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            query = lambda_stmt(
+                lambda: select(Monster).where(
+                    Monster.element == element
+                ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            )
 
             result = await self.db.execute(query)
             monsters = result.scalars().all()
@@ -427,9 +573,13 @@ class MonsterService(LoggerMixin):
             怪物列表
         """
         try:
-            query = select(Monster).where(
-                Monster.regions.contains([region])
-            ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            # 列表需在 lambda 外构造，作为绑定参数传入（lambda 内只能引用闭包变量本身）
+            regions = [region]
+            query = lambda_stmt(
+                lambda: select(Monster).where(
+                    Monster.regions.contains(regions)
+                ).order_by(Monster.level, desc(Monster.created_at)).limit(limit)
+            )
 
             result = await self.db.execute(query)
             monsters = result.scalars().all()
@@ -459,12 +609,14 @@ class MonsterService(LoggerMixin):
             怪物列表
         """
         try:
-            query = select(Monster).where(
-                and_(
-                    Monster.level >= min_level,
-                    Monster.level <= max_level
-                )
-            ).order_by(Monster.level).limit(limit)
+            query = lambda_stmt(
+                lambda: select(Monster).where(
+                    and_(
+                        Monster.level >= min_level,
+                        Monster.level <= max_level
+                    )
+                ).order_by(Monster.level).limit(limit)
+            )
 
             result = await self.db.execute(query)
             monsters = result.scalars().all()
@@ -485,37 +637,12 @@ class MonsterService(LoggerMixin):
     # ===== 统计功能 =====
 
     async def get_monster_stats(self) -> MonsterStats:
-        """获取怪物统计信息"""
-        try:
-            # 总数统计
-            total_query = select(func.count(Monster.id))
-            total_result = await self.db.execute(total_query)
-            total_count = total_result.scalar()
-
-            # 按类别分组统计
-            category_query = select(
-                Monster.category,
-                func.count(Monster.id)
-            ).group_by(Monster.category)
-            category_result = await self.db.execute(category_query)
-            by_category = dict(category_result.fetchall())
-
-            # 按族群分组统计
-            family_query = select(
-                Monster.family,
-                func.count(Monster.id)
-            ).group_by(Monster.family)
-            family_result = await self.db.execute(family_query)
-            by_family = dict(family_result.fetchall())
-
-            # 按元素分组统计
-            element_query = select(
-                Monster.element,
-                func.count(Monster.id)
-            ).where(Monster.element.is_not(None)).group_by(Monster.element)
-            element_result = await self.db.execute(element_query)
-            by_element = dict(element_result.fetchall())
+        """获取怪物统计信息（Redis缓存，增删改时失效）"""
+        cached_stats = await cache_manager.redis.get(MONSTER_STATS_CACHE_KEY)
+        if isinstance(cached_stats, MonsterStats):
+            return cached_stats
 
+        try:
             # 按等级范围分组统计
             level_ranges = {
                 "1-20": (1, 20),
@@ -524,23 +651,59 @@ class MonsterService(LoggerMixin):
                 "61-80": (61, 80),
                 "81-100": (81, 100)
             }
-            by_level_range = {}
-            for range_name, (min_level, max_level) in level_ranges.items():
-                level_query = select(func.count(Monster.id)).where(
-                    and_(Monster.level >= min_level, Monster.level <= max_level)
-                )
-                level_result = await self.db.execute(level_query)
-                by_level_range[range_name] = level_result.scalar()
-
-            # 按地区统计（需要处理JSONB数组）
-            # 这里简化处理，实际可能需要更复杂的JSONB查询
-            region_query = select(Monster.regions).where(Monster.regions.is_not(None))
-            region_result = await self.db.execute(region_query)
-            by_region = {}
-            for (regions,) in region_result.fetchall():
-                if regions:
-                    for region in regions:
-                        by_region[region] = by_region.get(region, 0) + 1
+
+            # 等级范围先在子查询中算成一列，外层 GROUPING SETS 直接按该列分组
+            # （CASE 中的绑定参数只出现一次，GROUP BY 与 grouping() 引用的是同一列）
+            level_range = case(
+                *[
+                    (and_(Monster.level >= min_level, Monster.level <= max_level), range_name)
+                    for range_name, (min_level, max_level) in level_ranges.items()
+                ],
+                else_=None
+            ).label("level_range")
+            monsters = select(
+                Monster.id, Monster.category, Monster.family, Monster.element, level_range
+            ).subquery()
+
+            # 单条 GROUPING SETS 查询同时得到总数和各维度分组统计，各项计数出自同一快照
+            dimensions = (monsters.c.category, monsters.c.family, monsters.c.element, monsters.c.level_range)
+            stats_query = select(
+                func.grouping(*dimensions).label("grouping_id"),
+                *dimensions,
+                func.count(monsters.c.id).label("monster_count")
+            ).group_by(
+                func.grouping_sets(*(tuple_(column) for column in dimensions), tuple_())
+            )
+            stats_result = await self.db.execute(stats_query)
+
+            # grouping() 位掩码：参与分组的列对应位为0（按 category, family, element, level_range 顺序）
+            total_count = 0
+            by_category, by_family, by_element = {}, {}, {}
+            by_level_range = dict.fromkeys(level_ranges, 0)
+            for grouping_id, category, family, element, range_name, monster_count in stats_result.tuples():
+                if grouping_id == 0b0111:
+                    by_category[category] = monster_count
+                elif grouping_id == 0b1011:
+                    by_family[family] = monster_count
+                elif grouping_id == 0b1101:
+                    if element is not None:
+                        by_element[element] = monster_count
+                elif grouping_id == 0b1110:
+                    if range_name is not None:
+                        by_level_range[range_name] = monster_count
+                else:
+                    total_count = monster_count
+
+            # 按地区统计：在数据库中展开 JSONB 数组后分组计数。展开会让一个怪物
+            # 对应多行，不能并入上面的分组集合；各地区计数本就不与总数相加对应
+            region = func.jsonb_array_elements_text(Monster.regions).table_valued('value')
+            region_query = select(
+                region.c.value,
+                func.count()
+            ).select_from(Monster).join(region, literal_column('true')).where(
+                func.jsonb_typeof(Monster.regions) == 'array'
+            ).group_by(region.c.value)
+            by_region = dict((await self.db.execute(region_query)).all())
 
             stats = MonsterStats(
                 total_monsters=total_count,
@@ -552,6 +715,7 @@ class MonsterService(LoggerMixin):
             )
 
             self.log_info("怪物统计信息获取成功", total=total_count)
+            await cache_manager.redis.set(MONSTER_STATS_CACHE_KEY, stats, MONSTER_STATS_CACHE_TTL)
             return stats
 
         except Exception as e:
@@ -561,22 +725,27 @@ class MonsterService(LoggerMixin):
     # ===== 辅助方法 =====
 
     async def _check_monster_name_exists(self, name: str) -> bool:
-        """检查怪物名称是否已存在"""
-        query = select(Monster.id).where(Monster.name == name)
+        """检查怪物名称是否已存在（EXISTS 在唯一索引上找到首条即返回）"""
+        query = lambda_stmt(lambda: select(exists().where(Monster.name == name)))
         result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
     async def _invalidate_monster_cache(self, monster_id: Optional[int] = None):
-        """清除怪物相关缓存 - TODO: Implement caching"""
-        # TODO: Implement cache invalidation when cache is properly configured
-        pass
+        """清除怪物相关缓存"""
+        await cache_manager.redis.delete(MONSTER_STATS_CACHE_KEY)
 
     @classmethod
-    def get_available_filters(cls) -> Dict[str, List[str]]:
-        """获取可用的过滤选项"""
-        return {
-            "categories": Monster.get_categories(),
-            "families": Monster.get_families(),
-            "elements": Monster.get_elements(),
-            "regions": Monster.get_regions()
-        }
\ No newline at end of file
+    @lru_cache(maxsize=1)
+    def get_available_filters(cls) -> Mapping[str, Tuple[str, ...]]:
+        """
+        获取可用的过滤选项
+
+        选项均为常量，进程内只构建一次；返回只读映射和元组，
+        避免调用方修改缓存的共享对象
+        """
+        return MappingProxyType({
+            "categories": tuple(Monster.get_categories()),
+            "families": tuple(Monster.get_families()),
+            "elements": tuple(Monster.get_elements()),
+            "regions": tuple(Monster.get_regions())
+        })
\ No newline at end of file
@@ -10,11 +10,13 @@ from sqlalchemy import select, func, or_, and_, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload
 
+from src.db.session import use_primary
 from src.models.weapon import Weapon
 from src.schemas.weapon import (
     WeaponCreate, WeaponUpdate, WeaponQueryParams,
     WeaponStats, PopularWeapon
 )
+from src.scrapers.data_storage import DataStorageService
 from src.utils.logging import LoggerMixin, log_database_operation
 from src.utils.exceptions import NotFoundError, ValidationException, DatabaseException
 from src.utils.validators import validate_page_params
@@ -91,18 +93,28 @@ class WeaponService(LoggerMixin):
             else:
                 query = query.order_by(desc(order_col))
 
-            # 获取总数
-            count_query = select(func.count()).select_from(query.subquery())
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar()
-
-            # 应用分页
+            # 应用分页；总数用窗口函数在同一次扫描中算出，省去单独的 COUNT 查询
             offset = (page - 1) * per_page
-            query = query.offset(offset).limit(per_page)
+            filtered_query = query
+            query = query.add_columns(
+                func.count().over().label('total')
+            ).offset(offset).limit(per_page)
 
             # 执行查询
             result = await self.db.execute(query)
-            weapons = result.scalars().all()
+            rows = result.all()
+            weapons = [row[0] for row in rows]
+
+            if rows:
+                total = rows[0].total
+            elif offset > 0:
+                # 页码越界时窗口函数没有返回行，单独统计总数
+                count_query = select(func.count()).select_from(
+                    filtered_query.order_by(None).subquery()
+                )
+                total = (await self.db.execute(count_query)).scalar()
+            else:
+                total = 0
 
             log_database_operation(
                 "select", "weapons",
@@ -160,6 +172,7 @@ class WeaponService(LoggerMixin):
         Returns:
             创建的武器对象
         """
+        use_primary(self.db)
         try:
             # 检查武器名称是否已存在
             existing = await self._check_weapon_name_exists(weapon_data.name)
@@ -205,6 +218,7 @@ class WeaponService(LoggerMixin):
         Returns:
             更新后的武器对象
         """
+        use_primary(self.db)
         try:
             weapon = await self.get_weapon_by_id(weapon_id)
 
@@ -215,6 +229,8 @@ class WeaponService(LoggerMixin):
                     setattr(weapon, field, value)
 
             await self.db.commit()
+            # 爬虫入库会跳过本进程写过的相同行，手工修改后需让下次爬取重新写入
+            DataStorageService.clear_write_cache()
             await self.db.refresh(weapon)
 
             log_database_operation("update", "weapons", id=weapon_id)
@@ -242,11 +258,14 @@ class WeaponService(LoggerMixin):
         Returns:
             删除是否成功
         """
+        use_primary(self.db)
         try:
             weapon = await self.get_weapon_by_id(weapon_id)
 
             await self.db.delete(weapon)
             await self.db.commit()
+            # 让下次爬取重新写入被删除的行
+            DataStorageService.clear_write_cache()
 
             log_database_operation("delete", "weapons", id=weapon_id)
             self.log_info("武器删除成功", weapon_id=weapon_id)
@@ -130,7 +130,15 @@ def log_api_response(method: str, path: str, status_code: int, process_time: flo
 
 
 def log_database_operation(operation: str, table: str, **kwargs):
-    """记录数据库操作日志"""
+    """
+    记录数据库操作日志（debug 级别）
+
+    debug 级别未启用时直接返回；kwargs 中的可调用对象延迟到确认需要输出时才求值，
+    调用方可传入 lambda 避免在热路径上构造只用于日志的字段
+    """
+    if not logging.getLogger("database").isEnabledFor(logging.DEBUG):
+        return
+    kwargs = {key: value() if callable(value) else value for key, value in kwargs.items()}
     logger = get_logger("database")
     logger.debug(
         "数据库操作",
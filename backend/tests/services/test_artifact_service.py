@@ -0,0 +1,103 @@
+"""
+ArtifactService 测试（需要 PostgreSQL）
+"""
+from typing import List
+
+import pytest
+
+from src.models.artifact import Artifact
+from src.schemas.artifact import ArtifactQueryParams
+from src.services.artifact_service import ArtifactService
+from src.utils.exceptions import ValidationException
+
+
+@pytest.fixture
+async def artifacts(pg_session) -> List[Artifact]:
+    """创建7件圣遗物，稀有度有重复，用于验证次级排序"""
+    created = [
+        Artifact(
+            name=f"圣遗物{index}",
+            set_name="绝缘之旗印",
+            slot="flower",
+            rarity=4 if index % 2 else 5,
+            main_stat_type="生命值",
+            main_stat_value="4780",
+            set_effects={"2": "元素充能效率提高20%"},
+        )
+        for index in range(7)
+    ]
+    pg_session.add_all(created)
+    await pg_session.commit()
+    return created
+
+
+async def _walk_cursor(service: ArtifactService, sort_by: str, sort_order: str) -> List[int]:
+    """按游标逐页读取全部结果，返回ID序列"""
+    ids = []
+    cursor_id = cursor_value = None
+    while True:
+        page, _ = await service.get_artifact_list(ArtifactQueryParams(
+            per_page=3, sort_by=sort_by, sort_order=sort_order,
+            cursor_id=cursor_id, cursor_value=cursor_value,
+        ))
+        if not page:
+            return ids
+        ids.extend(artifact.id for artifact in page)
+        cursor_id = page[-1].id
+        cursor_value = str(getattr(page[-1], sort_by))
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestArtifactListPagination:
+    """圣遗物列表分页测试"""
+
+    @pytest.mark.parametrize("sort_by", ["id", "name", "rarity"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_cursor_pages_match_offset_order(self, pg_session, artifacts, sort_by, sort_order):
+        """游标分页逐页读取的结果与一次性偏移分页的顺序一致，无重复无遗漏"""
+        service = ArtifactService(pg_session)
+        expected, total = await service.get_artifact_list(
+            ArtifactQueryParams(per_page=100, sort_by=sort_by, sort_order=sort_order)
+        )
+
+        assert total == len(artifacts)
+        assert await _walk_cursor(service, sort_by, sort_order) == [artifact.id for artifact in expected]
+
+    async def test_cursor_page_reports_filtered_total(self, pg_session, artifacts):
+        """游标分页时总数仍按过滤条件统计，而不是游标之后的行数"""
+        service = ArtifactService(pg_session)
+        first_page, _ = await service.get_artifact_list(
+            ArtifactQueryParams(per_page=3, sort_by="name", sort_order="asc")
+        )
+
+        _, total = await service.get_artifact_list(ArtifactQueryParams(
+            per_page=3, sort_by="name", sort_order="asc",
+            cursor_id=first_page[-1].id, cursor_value=first_page[-1].name,
+        ))
+        assert total == len(artifacts)
+
+    async def test_cursor_requires_value_for_non_id_sort(self, pg_session, artifacts):
+        """按非ID字段排序时游标必须带 cursor_value"""
+        service = ArtifactService(pg_session)
+
+        with pytest.raises(ValidationException):
+            await service.get_artifact_list(
+                ArtifactQueryParams(sort_by="rarity", cursor_id=artifacts[0].id)
+            )
+
+    async def test_out_of_range_page_still_reports_total(self, pg_session, artifacts):
+        """页码越界时窗口函数没有行，总数由单独的计数查询给出"""
+        service = ArtifactService(pg_session)
+
+        page, total = await service.get_artifact_list(ArtifactQueryParams(page=10, per_page=5))
+
+        assert page == []
+        assert total == len(artifacts)
+
+    async def test_empty_table_first_page(self, pg_session):
+        """空表第一页总数为0"""
+        service = ArtifactService(pg_session)
+
+        assert await service.get_artifact_list(ArtifactQueryParams()) == ([], 0)
@@ -0,0 +1,85 @@
+"""
+CharacterService 测试（需要 PostgreSQL）
+"""
+import pytest
+
+from src.models.character import Character
+from src.schemas.character import CharacterQueryParams
+from src.services.character_service import CharacterService
+
+
+@pytest.fixture
+async def raiden(pg_session) -> Character:
+    """创建用于搜索测试的角色"""
+    character = Character(
+        name="雷电将军",
+        name_en="Raiden Shogun",
+        element="Electro",
+        weapon_type="Polearm",
+        rarity=5,
+        region="Inazuma",
+        title="一心净土",
+        base_stats={"hp": 12907, "atk": 337, "def": 789},
+    )
+    pg_session.add(character)
+    await pg_session.commit()
+    return character
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCharacterSearch:
+    """角色搜索文档测试"""
+
+    async def test_search_matches_within_column(self, pg_session, raiden):
+        """关键词在单列内连续出现时命中"""
+        service = CharacterService(pg_session)
+
+        characters = await service.search_characters("Shogun")
+
+        assert [character.id for character in characters] == [raiden.id]
+
+    async def test_search_does_not_match_across_columns(self, pg_session, raiden):
+        """关键词不能跨越列边界匹配（name 结尾 + name_en 开头）"""
+        service = CharacterService(pg_session)
+
+        assert await service.search_characters("将军 Raiden") == []
+        assert await service.search_characters("将军Raiden") == []
+        assert await service.search_characters("将军\x1fRaiden") == []
+
+    async def test_search_wildcards_are_literal(self, pg_session, raiden):
+        """搜索词中的 % 和 _ 按字面匹配，不能借通配符跨列"""
+        service = CharacterService(pg_session)
+
+        assert await service.search_characters("将军%Shogun") == []
+        assert await service.search_characters("雷电将_") == []
+
+    async def test_list_search_does_not_match_across_columns(self, pg_session, raiden):
+        """列表查询的 search 参数同样只在单列内匹配"""
+        service = CharacterService(pg_session)
+
+        characters, total = await service.get_character_list(CharacterQueryParams(search="将军 Raiden"))
+        assert (characters, total) == ([], 0)
+
+        characters, total = await service.get_character_list(CharacterQueryParams(search="一心净土"))
+        assert total == 1
+        assert characters[0].id == raiden.id
+
+    async def test_short_keyword_merges_prefix_and_substring_matches(self, pg_session, raiden):
+        """短关键词：名称前缀命中之外，描述等处包含关键词的角色也会返回，且不重复"""
+        shogun_fan = Character(
+            name="早柚",
+            element="Anemo",
+            weapon_type="Claymore",
+            rarity=4,
+            description="终末番的忍者，时常躲懒，却很敬重雷电将军。",
+            base_stats={"hp": 11962, "atk": 244, "def": 751},
+        )
+        pg_session.add(shogun_fan)
+        await pg_session.commit()
+        service = CharacterService(pg_session)
+
+        characters = await service.search_characters("雷电")
+
+        assert [character.id for character in characters] == [raiden.id, shogun_fan.id]
@@ -0,0 +1,207 @@
+"""
+DataStorageService 测试（需要 PostgreSQL）
+"""
+import pytest
+from sqlalchemy import delete, select, update
+
+from src.models.artifact_set import ArtifactSet
+from src.models.character import Character
+from src.schemas.character import CharacterUpdate
+from src.scrapers import data_storage
+from src.scrapers.data_storage import DataStorageService
+from src.services.character_service import CharacterService
+
+
+ARTIFACT_SET = {
+    "name": "绝缘之旗印",
+    "name_en": "Emblem of Severed Fate",
+    "tags": ["元素充能效率", "元素爆发"],
+    "max_rarity": 4,
+    "two_piece_bonus": "元素充能效率提高20%。",
+    "four_piece_bonus": "基于元素充能效率的25%，提高元素爆发造成的伤害。",
+    "pieces": [{"slot": "flower", "slot_cn": "生之花", "piece_name": "明威之镡"}],
+}
+
+CHARACTER = {
+    "name": "雷电将军",
+    "name_en": "Raiden Shogun",
+    "rarity": 5,
+    "element": "Electro",
+    "weapon_type": "Polearm",
+    "region": "Inazuma",
+    "description": "御建鸣神主尊大御所大人。",
+    "base_stats": {"hp": 12907, "atk": 337, "def": 789},
+}
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestDataStorageUpsert:
+    """增量入库测试"""
+
+    async def test_empty_fields_keep_stored_artifact_set(self, pg_session):
+        """重新入库时空值/缺失字段不覆盖已有数据"""
+        await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+
+        DataStorageService.clear_write_cache()
+        stats = await DataStorageService(pg_session).store_artifacts([{
+            "name": ARTIFACT_SET["name"],
+            "name_en": "",
+            "tags": [],
+            "pieces": [],
+            "two_piece_bonus": "",
+            # max_rarity 缺失
+        }])
+
+        assert stats["skipped"] == 1
+        artifact_set = (await pg_session.execute(
+            select(ArtifactSet).where(ArtifactSet.set_name == ARTIFACT_SET["name"])
+        )).scalar_one()
+        await pg_session.refresh(artifact_set)
+        assert artifact_set.set_name_en == ARTIFACT_SET["name_en"]
+        assert artifact_set.tags == ARTIFACT_SET["tags"]
+        assert artifact_set.max_rarity == 4
+        assert artifact_set.two_piece_bonus == ARTIFACT_SET["two_piece_bonus"]
+        assert artifact_set.pieces == ARTIFACT_SET["pieces"]
+
+    async def test_missing_max_rarity_uses_default_on_insert(self, pg_session):
+        """新建时缺失的 max_rarity 使用模型默认值"""
+        data = {key: value for key, value in ARTIFACT_SET.items() if key != "max_rarity"}
+        stats = await DataStorageService(pg_session).store_artifacts([data])
+
+        assert stats["created"] == 1
+        artifact_set = (await pg_session.execute(
+            select(ArtifactSet).where(ArtifactSet.set_name == ARTIFACT_SET["name"])
+        )).scalar_one()
+        assert artifact_set.max_rarity == 5
+
+    async def test_empty_fields_keep_stored_character(self, pg_session):
+        """角色重新入库时空字段与空属性不覆盖已有数据"""
+        await DataStorageService(pg_session).store_characters([CHARACTER])
+
+        DataStorageService.clear_write_cache()
+        await DataStorageService(pg_session).store_characters([{
+            **CHARACTER,
+            "region": "",
+            "description": None,
+            "base_stats": {},
+        }])
+
+        character = (await pg_session.execute(
+            select(Character).where(Character.name == CHARACTER["name"])
+        )).scalar_one()
+        await pg_session.refresh(character)
+        assert character.region == CHARACTER["region"]
+        assert character.description == CHARACTER["description"]
+        assert character.base_stats == CHARACTER["base_stats"]
+
+    async def test_invalid_row_does_not_discard_batch(self, pg_session):
+        """缺少必填字段的行计为错误，同批次其余行照常入库"""
+        stats = await DataStorageService(pg_session).store_characters([
+            CHARACTER,
+            {**CHARACTER, "name": "八重神子", "element": ""},
+        ])
+
+        assert stats["created"] == 1
+        assert stats["errors"] == 1
+        names = (await pg_session.scalars(select(Character.name))).all()
+        assert names == [CHARACTER["name"]]
+
+    async def test_changed_fields_overwrite(self, pg_session):
+        """非空的新值仍会覆盖旧值"""
+        await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+
+        DataStorageService.clear_write_cache()
+        stats = await DataStorageService(pg_session).store_artifacts([
+            {**ARTIFACT_SET, "max_rarity": 5, "tags": ["暴击"]}
+        ])
+
+        assert stats["updated"] == 1
+        artifact_set = (await pg_session.execute(
+            select(ArtifactSet).where(ArtifactSet.set_name == ARTIFACT_SET["name"])
+        )).scalar_one()
+        await pg_session.refresh(artifact_set)
+        assert artifact_set.max_rarity == 5
+        assert artifact_set.tags == ["暴击"]
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestDataStorageWriteCache:
+    """进程内写入缓存测试"""
+
+    async def test_identical_rescrape_skipped_from_cache(self, pg_session):
+        """相同数据再次入库时命中缓存，不再执行 upsert"""
+        await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+        assert (ArtifactSet.__tablename__, ARTIFACT_SET["name"]) in data_storage._write_cache
+
+        stats = await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+        assert stats == {"created": 0, "updated": 0, "skipped": 1, "errors": 0}
+
+    async def test_outside_edit_invalidates_cached_row(self, pg_session):
+        """行在缓存之外被修改（updated_at 变化）后，再次入库会重新写入"""
+        await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+
+        await pg_session.execute(
+            update(ArtifactSet)
+            .where(ArtifactSet.set_name == ARTIFACT_SET["name"])
+            .values(max_rarity=3)
+        )
+        await pg_session.commit()
+
+        stats = await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+        assert stats["updated"] == 1
+        max_rarity = (await pg_session.execute(
+            select(ArtifactSet.max_rarity).where(ArtifactSet.set_name == ARTIFACT_SET["name"])
+        )).scalar_one()
+        assert max_rarity == 4
+
+    async def test_deleted_row_is_recreated(self, pg_session):
+        """缓存中的行被删除后，再次入库会重新创建"""
+        await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+
+        await pg_session.execute(delete(ArtifactSet))
+        await pg_session.commit()
+
+        stats = await DataStorageService(pg_session).store_artifacts([ARTIFACT_SET])
+        assert stats["created"] == 1
+
+    async def test_service_update_clears_cache(self, pg_session, fake_redis):
+        """通过服务层修改角色后清空写入缓存"""
+        await DataStorageService(pg_session).store_characters([CHARACTER])
+        character_id = (await pg_session.execute(
+            select(Character.id).where(Character.name == CHARACTER["name"])
+        )).scalar_one()
+        assert data_storage._write_cache
+
+        await CharacterService(pg_session).update_character(
+            character_id, CharacterUpdate(region="Snezhnaya")
+        )
+        assert not data_storage._write_cache
+
+        await DataStorageService(pg_session).store_characters([CHARACTER])
+        region = (await pg_session.execute(
+            select(Character.region).where(Character.id == character_id)
+        )).scalar_one()
+        assert region == CHARACTER["region"]
+
+    async def test_failed_commit_is_not_cached(self, pg_session, monkeypatch):
+        """提交失败时回滚，本事务写入的行不进入缓存"""
+        storage = DataStorageService(pg_session)
+
+        async def failing_commit():
+            raise RuntimeError("commit failed")
+
+        monkeypatch.setattr(pg_session, "commit", failing_commit)
+        with pytest.raises(RuntimeError):
+            await storage.store_artifacts([ARTIFACT_SET])
+        monkeypatch.undo()
+
+        assert not data_storage._write_cache
+        assert not storage._pending_writes
+        assert not storage._relaxed_commit
+
+        stats = await storage.store_artifacts([ARTIFACT_SET])
+        assert stats["created"] == 1
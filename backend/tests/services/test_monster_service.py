@@ -0,0 +1,214 @@
+"""
+MonsterService 测试（需要 PostgreSQL）
+"""
+from typing import List
+
+import pytest
+from sqlalchemy import select
+
+from src.models.monster import Monster
+from src.schemas.monster import MonsterCreate, MonsterQueryParams
+from src.services.monster_service import MonsterService
+from src.utils.exceptions import ValidationException
+
+
+def make_monster(name: str, **overrides) -> MonsterCreate:
+    """构造怪物创建数据"""
+    data = {
+        "name": name,
+        "category": "普通怪物",
+        "family": "丘丘人",
+        "level": 10,
+        "base_stats": {"hp": 1000},
+        "regions": ["Mondstadt"],
+    }
+    data.update(overrides)
+    return MonsterCreate(**data)
+
+
+@pytest.fixture
+async def monster_ids(pg_session, fake_redis) -> List[int]:
+    """批量创建6个怪物，返回按ID升序的ID列表"""
+    monster_ids = await MonsterService(pg_session).create_monsters(
+        [make_monster(f"深渊法师{index}") for index in range(6)]
+    )
+    return sorted(monster_ids)
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMonsterBulkCreate:
+    """怪物批量创建测试"""
+
+    async def test_create_monsters_returns_ids_in_input_order(self, pg_session, fake_redis):
+        """返回的ID与输入顺序一一对应"""
+        names = [f"丘丘人{index}" for index in range(20)]
+        service = MonsterService(pg_session)
+
+        monster_ids = await service.create_monsters([make_monster(name) for name in names])
+
+        assert len(monster_ids) == len(names)
+        stored = dict((await pg_session.execute(
+            select(Monster.id, Monster.name).where(Monster.id.in_(monster_ids))
+        )).all())
+        assert [stored[monster_id] for monster_id in monster_ids] == names
+
+    async def test_create_monsters_rejects_duplicates_in_batch(self, pg_session, fake_redis):
+        """批次内重名时整批拒绝"""
+        service = MonsterService(pg_session)
+
+        with pytest.raises(ValidationException):
+            await service.create_monsters([make_monster("史莱姆"), make_monster("史莱姆")])
+
+        monster_ids = (await pg_session.scalars(select(Monster.id))).all()
+        assert monster_ids == []
+
+    async def test_create_monsters_rejects_existing_names(self, pg_session, fake_redis):
+        """与已有怪物重名时整批拒绝"""
+        service = MonsterService(pg_session)
+        await service.create_monsters([make_monster("丘丘暴徒")])
+
+        with pytest.raises(ValidationException):
+            await service.create_monsters([make_monster("丘丘射手"), make_monster("丘丘暴徒")])
+
+        names = (await pg_session.scalars(select(Monster.name))).all()
+        assert names == ["丘丘暴徒"]
+
+    async def test_create_monsters_invalidates_stats_cache(self, pg_session, fake_redis):
+        """批量创建后清除统计缓存"""
+        service = MonsterService(pg_session)
+        await service.get_monster_stats()
+        assert fake_redis.store
+
+        await service.create_monsters([make_monster("火史莱姆")])
+
+        assert not fake_redis.store
+        stats = await service.get_monster_stats()
+        assert stats.total_monsters == 1
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMonsterListTotal:
+    """怪物列表总数测试"""
+
+    async def test_out_of_range_page_still_reports_total(self, pg_session, monster_ids):
+        """页码越界时窗口函数没有行，总数由单独的计数查询给出"""
+        service = MonsterService(pg_session)
+
+        monsters, total, has_more = await service.get_monster_list(MonsterQueryParams(page=5, per_page=4))
+
+        assert monsters == []
+        assert total == len(monster_ids)
+        assert has_more is False
+
+    async def test_window_total_matches_filtered_count(self, pg_session, monster_ids):
+        """窗口函数返回的总数是过滤后的总数，而不是当前页行数"""
+        service = MonsterService(pg_session)
+
+        monsters, total, has_more = await service.get_monster_list(MonsterQueryParams(per_page=4))
+
+        assert len(monsters) == 4
+        assert total == len(monster_ids)
+        assert has_more is True
+
+    async def test_empty_table_first_page(self, pg_session):
+        """空表第一页总数为0"""
+        service = MonsterService(pg_session)
+
+        assert await service.get_monster_list(MonsterQueryParams()) == ([], 0, False)
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMonsterListWithoutTotal:
+    """不统计总数与游标分页测试"""
+
+    async def test_has_more_from_sentinel_row(self, pg_session, monster_ids):
+        """with_total=False 时多取一条哨兵行判断是否有下一页"""
+        service = MonsterService(pg_session)
+
+        monsters, total, has_more = await service.get_monster_list(
+            MonsterQueryParams(per_page=4, with_total=False)
+        )
+        assert (len(monsters), total, has_more) == (4, None, True)
+
+        monsters, total, has_more = await service.get_monster_list(
+            MonsterQueryParams(page=2, per_page=4, with_total=False)
+        )
+        assert (len(monsters), total, has_more) == (2, None, False)
+
+    async def test_has_more_false_on_exact_last_page(self, pg_session, monster_ids):
+        """最后一页恰好填满时 has_more 为 False（哨兵行不存在）"""
+        service = MonsterService(pg_session)
+
+        monsters, _, has_more = await service.get_monster_list(
+            MonsterQueryParams(page=2, per_page=3, with_total=False)
+        )
+        assert len(monsters) == 3
+        assert has_more is False
+
+    async def test_summary_view_without_total(self, pg_session, monster_ids):
+        """卡片视图不统计总数时返回行映射"""
+        service = MonsterService(pg_session)
+
+        monsters, _, has_more = await service.get_monster_list(
+            MonsterQueryParams(per_page=10, with_total=False, detail=False, sort_by="id", sort_order="asc")
+        )
+        assert [monster["id"] for monster in monsters] == monster_ids
+        assert has_more is False
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_cursor_walk_visits_every_monster_once(self, pg_session, monster_ids, sort_order):
+        """按ID游标逐页读取，结果无重复无遗漏，且不统计总数"""
+        service = MonsterService(pg_session)
+        seen = []
+        cursor_id = None
+        has_more = True
+        while has_more:
+            monsters, total, has_more = await service.get_monster_list(MonsterQueryParams(
+                per_page=4, sort_by="id", sort_order=sort_order, cursor_id=cursor_id, with_total=False
+            ))
+            assert total is None
+            seen.extend(monster.id for monster in monsters)
+            cursor_id = monsters[-1].id
+
+        expected = monster_ids if sort_order == "asc" else monster_ids[::-1]
+        assert seen == expected
+
+    async def test_cursor_requires_id_sort(self, pg_session, monster_ids):
+        """游标分页只支持按ID排序"""
+        service = MonsterService(pg_session)
+
+        with pytest.raises(ValidationException):
+            await service.get_monster_list(MonsterQueryParams(sort_by="name", cursor_id=monster_ids[0]))
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestMonsterStats:
+    """怪物统计测试"""
+
+    async def test_grouping_sets_counts_are_consistent(self, pg_session, fake_redis):
+        """总数与各维度分组计数出自同一条 GROUPING SETS 查询，彼此一致"""
+        service = MonsterService(pg_session)
+        await service.create_monsters([
+            make_monster("丘丘人", level=5, regions=["Mondstadt", "Liyue"]),
+            make_monster("丘丘萨满", level=25, element="Dendro"),
+            make_monster("深渊法师", category="精英怪物", family="深渊法师", level=45, element="Pyro"),
+            make_monster("遗迹守卫", category="精英怪物", family="遗迹守卫", level=90),
+        ])
+
+        stats = await service.get_monster_stats()
+
+        assert stats.total_monsters == 4
+        assert sum(stats.by_category.values()) == stats.total_monsters
+        assert sum(stats.by_family.values()) == stats.total_monsters
+        assert stats.by_category == {"普通怪物": 2, "精英怪物": 2}
+        assert stats.by_element == {"Dendro": 1, "Pyro": 1}
+        assert stats.by_level_range == {"1-20": 1, "21-40": 1, "41-60": 1, "61-80": 0, "81-100": 1}
+        assert stats.by_region == {"Mondstadt": 4, "Liyue": 1}
@@ -0,0 +1,56 @@
+"""
+WeaponService 测试（需要 PostgreSQL）
+"""
+from typing import List
+
+import pytest
+
+from src.models.weapon import Weapon
+from src.schemas.weapon import WeaponQueryParams
+from src.services.weapon_service import WeaponService
+
+
+@pytest.fixture
+async def weapons(pg_session) -> List[Weapon]:
+    """创建5把单手剑和2把弓"""
+    created = [
+        Weapon(name=f"单手剑{index}", weapon_type="Sword", rarity=4, base_attack=44)
+        for index in range(5)
+    ] + [
+        Weapon(name=f"弓{index}", weapon_type="Bow", rarity=5, base_attack=46)
+        for index in range(2)
+    ]
+    pg_session.add_all(created)
+    await pg_session.commit()
+    return created
+
+
+@pytest.mark.service
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestWeaponListTotal:
+    """武器列表总数测试"""
+
+    async def test_window_total_matches_filtered_count(self, pg_session, weapons):
+        """窗口函数返回的总数是过滤后的总数，而不是当前页行数"""
+        service = WeaponService(pg_session)
+
+        page, total = await service.get_weapon_list(WeaponQueryParams(weapon_type="Sword", per_page=2))
+
+        assert len(page) == 2
+        assert total == 5
+
+    async def test_out_of_range_page_still_reports_total(self, pg_session, weapons):
+        """页码越界时窗口函数没有行，总数由单独的计数查询给出（仍按过滤条件）"""
+        service = WeaponService(pg_session)
+
+        page, total = await service.get_weapon_list(WeaponQueryParams(weapon_type="Bow", page=3, per_page=2))
+
+        assert page == []
+        assert total == 2
+
+    async def test_empty_table_first_page(self, pg_session):
+        """空表第一页总数为0"""
+        service = WeaponService(pg_session)
+
+        assert await service.get_weapon_list(WeaponQueryParams()) == ([], 0)